@@ -329,12 +329,12 @@ def init_session_state():
 def get_pipeline() -> TransactionPipeline:
     """Get or create the transaction pipeline instance."""
     # ==========================================================================
-    # BACKEND INTEGRATION: Pipeline initialization with streaming delay
+    # BACKEND INTEGRATION: Pipeline initialization
+    # Streaming delay comes from EXPLAINER_STREAM_DELAY (off by default)
     # ==========================================================================
     if st.session_state.pipeline is None:
         st.session_state.pipeline = TransactionPipeline(
-            verbose=False,  # Disable console logging for UI
-            stream_delay=0.025  # Natural typing effect
+            verbose=False  # Disable console logging for UI
         )
     return st.session_state.pipeline
 
@@ -9,7 +9,7 @@ The mapping ensures:
 3. Execution remains tool-based and deterministic (no LLM in data collection)
 """
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set
 
 # SECTION_TOOL_MAP: Maps section names to the builder functions that populate them.
 # These function names correspond to methods in customer_report_builder.py
@@ -45,6 +45,9 @@ SECTION_TOOL_MAP: Dict[str, List[str]] = {
 # All available section names
 AVAILABLE_SECTIONS: List[str] = list(SECTION_TOOL_MAP.keys())
 
+# Same names as a set, for O(1) validation of planned/requested sections
+AVAILABLE_SECTIONS_SET: FrozenSet[str] = frozenset(AVAILABLE_SECTIONS)
+
 # Core sections that should always be included when data is available
 CORE_SECTIONS: Set[str] = {"income_summary", "spending_summary", "cashflow_analysis"}
 
@@ -14,6 +14,16 @@ MAX_ITERATIONS = 10
 
 # Pipeline models
 PARSER_MODEL = "mistral"
+# Keep the parser model loaded between calls. The static parser system prompt
+# is ~2k tokens, so the context must leave room for it plus query and answer.
+PARSER_KEEP_ALIVE = "30m"
+PARSER_NUM_CTX = 4096
+# Constrain parser output with a JSON schema (Ollama >= 0.5). Set
+# PARSER_JSON_SCHEMA=0 to fall back to plain format="json" on older servers.
+PARSER_JSON_SCHEMA = os.getenv("PARSER_JSON_SCHEMA", "1") == "1"
+# Send only the k parser examples most similar to the query instead of all
+# of them in the system prompt (0 = send all, as a static prompt)
+PARSER_EXAMPLES_TOP_K = int(os.getenv("PARSER_EXAMPLES_TOP_K", "3"))
 EXPLAINER_MODEL = "llama3.2"
 
 # =============================================================================
@@ -47,3 +57,58 @@ LOG_DIR = "logs"
 VERBOSE_MODE = True
 STREAMING_ENABLED = True
 USE_LLM_EXPLAINER = True
+
+# Delay in seconds between streamed explainer chunks (UX typing effect only).
+# Off by default; set EXPLAINER_STREAM_DELAY=0.025 to re-enable.
+EXPLAINER_STREAM_DELAY = float(os.getenv("EXPLAINER_STREAM_DELAY", "0"))
+
+# Cache explainer answers by prompt (the explainer LLM is deterministic:
+# temperature=0, fixed seed). Set EXPLAINER_CACHE_ENABLED=0 to disable.
+EXPLAINER_CACHE_ENABLED = os.getenv("EXPLAINER_CACHE_ENABLED", "1") == "1"
+EXPLAINER_CACHE_SIZE = 512
+
+# Parse template-like report requests ("Generate bureau report for <id>") with
+# the keyword rules instead of the parser LLM. Set PARSER_FAST_PATH_ENABLED=0
+# to always use the LLM.
+PARSER_FAST_PATH_ENABLED = os.getenv("PARSER_FAST_PATH_ENABLED", "1") == "1"
+
+# Cache intent parses by canonical query (customer id masked); the parser LLM
+# is deterministic too. Set PARSER_CACHE_ENABLED=0 to disable.
+PARSER_CACHE_ENABLED = os.getenv("PARSER_CACHE_ENABLED", "1") == "1"
+PARSER_CACHE_SIZE = 512
+# Cosine similarity (word uni/bigram shingles) for a near-duplicate cache hit
+PARSER_CACHE_SIMILARITY = 0.95
+# Second-level parse cache on disk (needs the diskcache package), so parses
+# survive restarts. Entries are keyed on the parser prompt too, so editing the
+# prompt invalidates them.
+PARSER_DISK_CACHE_ENABLED = os.getenv("PARSER_DISK_CACHE_ENABLED", "1") == "1"
+PARSER_DISK_CACHE_DIR = os.getenv(
+    "PARSER_DISK_CACHE_DIR", os.path.join(_PROJECT_ROOT, ".cache", "intent_parser")
+)
+PARSER_DISK_CACHE_TTL_SEC = 7 * 24 * 3600
+PARSER_DISK_CACHE_SIZE_LIMIT = 100_000_000  # bytes
+
+# Compiled Jinja2 report templates are cached here so new processes skip
+# template compilation. Set JINJA_BYTECODE_CACHE_DIR="" to disable.
+JINJA_BYTECODE_CACHE_DIR = os.getenv(
+    "JINJA_BYTECODE_CACHE_DIR", os.path.join(_PROJECT_ROOT, ".cache", "jinja")
+)
+
+# Customer report PDF backend: "fpdf2" (pure Python, always available) or
+# "reportlab" (faster table layout; falls back to fpdf2 if not installed).
+PDF_BACKEND = os.getenv("PDF_BACKEND", "fpdf2").lower()
+
+# Report planner: below this many transactions, or with no EMI/rent/utility
+# presence, the deterministic default plan is used without calling the LLM.
+# Set MIN_TX_FOR_LLM_PLAN=0 to plan every profile with the LLM.
+MIN_TX_FOR_LLM_PLAN = int(os.getenv("MIN_TX_FOR_LLM_PLAN", "5"))
+
+# Second-level customer report cache on disk (needs the diskcache package), so
+# reports survive restarts. Entries are keyed on a fingerprint of the
+# transactions file, so new data never serves old reports.
+REPORT_DISK_CACHE_ENABLED = os.getenv("REPORT_DISK_CACHE_ENABLED", "1") == "1"
+REPORT_DISK_CACHE_DIR = os.getenv(
+    "REPORT_DISK_CACHE_DIR", os.path.join(_PROJECT_ROOT, ".cache", "reports")
+)
+REPORT_DISK_CACHE_TTL_SEC = 7 * 24 * 3600
+REPORT_DISK_CACHE_SIZE_LIMIT = 500_000_000  # bytes
@@ -1 +1 @@
-from .loader import get_transactions_df, load_transactions, get_data_summary
+from .loader import get_transactions_df, get_customer_slice, load_transactions, get_data_summary
@@ -3,6 +3,10 @@ Data loading and management module.
 Handles all data access in one place.
 """
 
+import hashlib
+import os
+
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Any
 
@@ -14,6 +18,12 @@ from config.settings import (
 
 # Module-level cache for the dataframe
 _transactions_df: Optional[pd.DataFrame] = None
+# Bumped on every (re)load so dependents can tell their derived data is stale
+_transactions_version: int = 0
+# cust_id -> positional row indices into _transactions_df, rebuilt on every (re)load
+_cust_index: Dict[Any, np.ndarray] = {}
+# Digest of the transactions file (path, size, mtime) as of the last load
+_transactions_fingerprint: str = ""
 
 
 def load_transactions(force_reload: bool = False) -> pd.DataFrame:
@@ -26,10 +36,17 @@ def load_transactions(force_reload: bool = False) -> pd.DataFrame:
     Returns:
         DataFrame with transaction data
     """
-    global _transactions_df
+    global _transactions_df, _transactions_version, _cust_index, _transactions_fingerprint
 
     if _transactions_df is None or force_reload:
-        _transactions_df = pd.read_csv(TRANSACTIONS_FILE, sep=TRANSACTIONS_DELIMITER)
+        stat = os.stat(TRANSACTIONS_FILE)
+        df = pd.read_csv(TRANSACTIONS_FILE, sep=TRANSACTIONS_DELIMITER)
+        _cust_index = df.groupby('cust_id', sort=False).indices
+        _transactions_fingerprint = hashlib.blake2b(
+            f"{TRANSACTIONS_FILE}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"), digest_size=8
+        ).hexdigest()
+        _transactions_df = df
+        _transactions_version += 1
         print(f"Loaded {len(_transactions_df)} transactions from {TRANSACTIONS_FILE}")
 
     return _transactions_df
@@ -44,6 +61,57 @@ def get_transactions_df() -> pd.DataFrame:
     return load_transactions()
 
 
+def get_transactions_version() -> int:
+    """
+    Get the version of the loaded transactions DataFrame.
+
+    Loads the data if needed, so the returned version always matches what
+    get_transactions_df() would return. Use it as a cache key for anything
+    derived from the DataFrame.
+    """
+    load_transactions()
+    return _transactions_version
+
+
+def get_transactions_fingerprint() -> str:
+    """
+    Get a digest identifying the transactions file behind the loaded DataFrame.
+
+    Unlike get_transactions_version(), which counts loads within a process,
+    this is stable across restarts until the file changes on disk, so it
+    can key persistent caches of derived data.
+    """
+    load_transactions()
+    return _transactions_fingerprint
+
+
+def get_customer_slice(customer_id: int) -> pd.DataFrame:
+    """
+    Get one customer's transactions without scanning the whole table.
+
+    Equivalent to ``df[df['cust_id'] == customer_id]`` (same rows, order and
+    index labels) but uses the per-customer row index built at load time.
+    The result is a new DataFrame, so callers may modify it freely.
+
+    Args:
+        customer_id: Customer identifier
+
+    Returns:
+        DataFrame of the customer's transactions (empty if unknown)
+    """
+    df = load_transactions()
+    rows = _cust_index.get(customer_id)
+    if rows is None:
+        return df.iloc[0:0].copy()
+    return df.take(rows)
+
+
+def customer_exists(customer_id: int) -> bool:
+    """Check whether a customer has any transactions in the loaded data."""
+    load_transactions()
+    return customer_id in _cust_index
+
+
 def get_data_summary() -> str:
     """
     Generate a summary of the transaction data.
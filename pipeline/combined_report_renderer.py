@@ -270,42 +270,46 @@ def _build_combined_pdf(
         if customer_report.category_overview:
             pdf.section_title("Spending by Category")
             sorted_cats = sorted(customer_report.category_overview.items(), key=lambda x: x[1], reverse=True)
-            widths = [80, 50, 60]
-            pdf.table_header(["Category", "Amount", "% of Total"], widths)
             total = sum(customer_report.category_overview.values())
-            for cat, amount in sorted_cats:
-                pct = (amount / total * 100) if total > 0 else 0
-                pdf.table_row([cat, f"{amount:,.0f}", f"{pct:.1f}%"], widths)
+            pdf.data_table(
+                ["Category", "Amount", "% of Total"],
+                [
+                    [cat, f"{amount:,.0f}", f"{(amount / total * 100) if total > 0 else 0:.1f}%"]
+                    for cat, amount in sorted_cats
+                ],
+                [80, 50, 60],
+            )
             pdf.ln(5)
 
         # Monthly Cash Flow
         if customer_report.monthly_cashflow:
             pdf.section_title("Monthly Cash Flow")
-            widths = [40, 45, 45, 45]
-            pdf.table_header(["Month", "Inflow", "Outflow", "Net"], widths)
-            for m in customer_report.monthly_cashflow:
-                pdf.table_row([
-                    m.get("month", "N/A"),
-                    f"{m.get('inflow', 0):,.0f}",
-                    f"{m.get('outflow', 0):,.0f}",
-                    f"{m.get('net', 0):,.0f}"
-                ], widths)
             total_in = sum(m.get('inflow', 0) for m in customer_report.monthly_cashflow)
             total_out = sum(m.get('outflow', 0) for m in customer_report.monthly_cashflow)
-            pdf.set_font("Helvetica", "B", 9)
-            pdf.cell(40, 6, "TOTAL", border=1, align="C")
-            pdf.cell(45, 6, f"{total_in:,.0f}", border=1, align="C")
-            pdf.cell(45, 6, f"{total_out:,.0f}", border=1, align="C")
-            pdf.cell(45, 6, f"{total_in - total_out:,.0f}", border=1, align="C")
-            pdf.ln(8)
+            pdf.data_table(
+                ["Month", "Inflow", "Outflow", "Net"],
+                [
+                    [
+                        m.get("month", "N/A"),
+                        f"{m.get('inflow', 0):,.0f}",
+                        f"{m.get('outflow', 0):,.0f}",
+                        f"{m.get('net', 0):,.0f}"
+                    ]
+                    for m in customer_report.monthly_cashflow
+                ],
+                [40, 45, 45, 45],
+                total_row=["TOTAL", f"{total_in:,.0f}", f"{total_out:,.0f}", f"{total_in - total_out:,.0f}"],
+            )
+            pdf.ln(2)
 
         # EMI Payments
         if customer_report.emis:
             pdf.section_title("EMI Payments")
-            widths = [80, 50, 60]
-            pdf.table_header(["Name", "Amount", "Frequency"], widths)
-            for emi in customer_report.emis:
-                pdf.table_row([emi.name, f"{emi.amount:,.2f}", f"{emi.frequency}x"], widths)
+            pdf.data_table(
+                ["Name", "Amount", "Frequency"],
+                [[emi.name, f"{emi.amount:,.2f}", f"{emi.frequency}x"] for emi in customer_report.emis],
+                [80, 50, 60],
+            )
             pdf.ln(3)
 
         # Rent
@@ -319,24 +323,29 @@ def _build_combined_pdf(
         # Utility Bills
         if customer_report.bills:
             pdf.section_title("Utility Bills")
-            widths = [80, 50, 60]
-            pdf.table_header(["Type", "Avg Amount", "Frequency"], widths)
-            for bill in customer_report.bills:
-                pdf.table_row([bill.bill_type, f"{bill.avg_amount:,.2f}", f"{bill.frequency}x"], widths)
+            pdf.data_table(
+                ["Type", "Avg Amount", "Frequency"],
+                [[bill.bill_type, f"{bill.avg_amount:,.2f}", f"{bill.frequency}x"] for bill in customer_report.bills],
+                [80, 50, 60],
+            )
             pdf.ln(3)
 
         # Top Merchants
         if customer_report.top_merchants:
             pdf.section_title("Top Merchants")
-            widths = [70, 30, 45, 45]
-            pdf.table_header(["Merchant", "Count", "Total", "Avg"], widths)
-            for m in customer_report.top_merchants:
-                pdf.table_row([
-                    str(m.get("name", "N/A"))[:25],
-                    str(m.get("count", 0)),
-                    f"{m.get('total', 0):,.0f}",
-                    f"{m.get('avg', 0):,.0f}"
-                ], widths)
+            pdf.data_table(
+                ["Merchant", "Count", "Total", "Avg"],
+                [
+                    [
+                        m.get("name", "N/A"),
+                        m.get("count", 0),
+                        f"{m.get('total', 0):,.0f}",
+                        f"{m.get('avg', 0):,.0f}"
+                    ]
+                    for m in customer_report.top_merchants
+                ],
+                [70, 30, 45, 45],
+            )
             pdf.ln(5)
     else:
         _render_absence_note(pdf, "Banking transaction")
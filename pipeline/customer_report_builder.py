@@ -5,12 +5,15 @@ the CustomerReport schema. NO LLM calls are made here - this is
 purely deterministic data aggregation.
 """
 
-from datetime import datetime
-from typing import Optional, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
 import logging
 
-from data.loader import get_transactions_df
-from config.section_tools import AVAILABLE_SECTIONS
+from data.loader import get_customer_slice, get_transactions_version
+from utils.helpers import now_iso
+from config.section_tools import AVAILABLE_SECTIONS_SET
 
 logger = logging.getLogger(__name__)
 from tools.analytics import (
@@ -35,6 +38,38 @@ from schemas.customer_report import (
     RiskIndicatorsBlock
 )
 
+# Category keys resolved into the per-customer presence index
+PRESENCE_CATEGORIES = ("emi", "rent", "utilities")
+
+# Top-merchant output keys and the HighFrequencyTransaction fields they read
+_TOP_MERCHANT_KEYS = ("name", "count", "total", "avg", "type")
+_top_merchant_values = attrgetter(
+    "representative_narration", "count", "total_amount", "average_amount", "transaction_type"
+)
+
+# Risk flag rules evaluated against the gathered risk context, in output order
+RISK_RULES = (
+    ("unstable_income", lambda ctx: ctx["income_stability_score"] < 50),
+    ("declining_balance", lambda ctx: ctx["balance_trend"] == "decreasing"),
+    ("irregular_income_patterns", lambda ctx: ctx["credit_spike_count"] > 3),
+    ("irregular_spending_patterns", lambda ctx: ctx["debit_spike_count"] > 5),
+    ("negative_balance_history", lambda ctx: ctx["min_balance"] < 0),
+)
+
+# Flag-count boundaries for risk level: 0 -> low, 1-2 -> medium, 3+ -> high
+_RISK_LEVEL_BOUNDS = (1, 3)
+_RISK_LEVELS = ("low", "medium", "high")
+
+
+def _get_party_name(cust_df) -> Optional[str]:
+    """Return the customer's party name from their transactions, or None if missing."""
+    if 'prty_name' not in cust_df.columns or len(cust_df) == 0:
+        return None
+    prty_name = cust_df['prty_name'].iloc[0]
+    if prty_name and str(prty_name).lower() not in ['nan', 'none', '']:
+        return str(prty_name)
+    return None
+
 
 def build_customer_report(customer_id: int, months: int = 6) -> CustomerReport:
     """
@@ -51,24 +86,17 @@ def build_customer_report(customer_id: int, months: int = 6) -> CustomerReport:
         CustomerReport with all available sections populated
     """
     # 1. Get transaction count for meta
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
+    cust_df = get_customer_slice(customer_id)
     transaction_count = len(cust_df)
 
     # 2. Get party name if available
-    prty_name = None
-    if 'prty_name' in cust_df.columns and len(cust_df) > 0:
-        prty_name = cust_df['prty_name'].iloc[0]
-        if prty_name and str(prty_name).lower() not in ['nan', 'none', '']:
-            prty_name = str(prty_name)
-        else:
-            prty_name = None
+    prty_name = _get_party_name(cust_df)
 
     # 3. Build report meta
     meta = ReportMeta(
         customer_id=customer_id,
         prty_name=prty_name,
-        generated_at=datetime.now().isoformat(),
+        generated_at=now_iso(),
         analysis_period=f"Last {months} months",
         currency="INR",
         transaction_count=transaction_count
@@ -145,13 +173,7 @@ def _get_top_merchants(customer_id: int) -> Optional[list]:
             return None
 
         top_merchants = [
-            {
-                "name": t.representative_narration,
-                "count": t.count,
-                "total": t.total_amount,
-                "avg": t.average_amount,
-                "type": t.transaction_type
-            }
+            dict(zip(_TOP_MERCHANT_KEYS, _top_merchant_values(t)))
             for t in summary.high_frequency_transactions[:5]
         ]
         return top_merchants if top_merchants else None
@@ -191,8 +213,7 @@ def _get_latest_salary_transaction(customer_id: int) -> Optional[dict]:
     try:
         from utils.narration_utils import is_salary_narration
 
-        df = get_transactions_df()
-        cust_df = df[df['cust_id'] == customer_id].copy()
+        cust_df = get_customer_slice(customer_id)
 
         if len(cust_df) == 0:
             return None
@@ -224,10 +245,40 @@ def _get_latest_salary_transaction(customer_id: int) -> Optional[dict]:
         return None
 
 
+def _category_index(customer_id: int) -> Dict[str, dict]:
+    """
+    Resolve presence for all report categories once per customer.
+
+    The EMI, rent and bills blocks plus the planner data profile all read
+    from this index, so each category is resolved a single time per customer
+    instead of once per consumer. Entries are keyed on the transactions data
+    version, so a reload never serves presence from the old data.
+    """
+    return _category_index_for(customer_id, get_transactions_version())
+
+
+@lru_cache(maxsize=256)
+def _category_index_for(customer_id: int, data_version: int) -> Dict[str, dict]:
+    """Build the category presence index for a customer and data version."""
+    index = {}
+    for category in PRESENCE_CATEGORIES:
+        try:
+            index[category] = resolve_category_presence(customer_id, category)
+        except Exception as e:
+            logger.warning(f"Category presence failed for '{category}': {e}")
+            index[category] = {"category": category, "present": False}
+    return index
+
+
+def clear_category_index():
+    """Clear the per-customer category presence index (e.g. after a data reload)."""
+    _category_index_for.cache_clear()
+
+
 def _get_emi_block(customer_id: int) -> Optional[list]:
     """Detect EMI payments using category presence lookup."""
     try:
-        emi_result = resolve_category_presence(customer_id, "emi")
+        emi_result = _category_index(customer_id)["emi"]
 
         if not emi_result.get('present'):
             return None
@@ -253,7 +304,7 @@ def _get_emi_block(customer_id: int) -> Optional[list]:
 def _get_rent_block(customer_id: int) -> Optional[RentBlock]:
     """Detect rent payments using category presence lookup."""
     try:
-        rent_result = resolve_category_presence(customer_id, "rent")
+        rent_result = _category_index(customer_id)["rent"]
 
         if not rent_result.get('present'):
             return None
@@ -279,7 +330,7 @@ def _get_rent_block(customer_id: int) -> Optional[RentBlock]:
 def _get_bills_block(customer_id: int) -> Optional[list]:
     """Detect utility bill payments using category presence lookup."""
     try:
-        bills_result = resolve_category_presence(customer_id, "utilities")
+        bills_result = _category_index(customer_id)["utilities"]
 
         if not bills_result.get('present'):
             return None
@@ -354,46 +405,22 @@ def _get_risk_indicators_block(customer_id: int) -> Optional[RiskIndicatorsBlock
         anomaly_data = detect_anomalies(customer_id)
         balance_data = get_balance_trend(customer_id)
 
-        income_stability_score = stability_data.get('stability_score', 0)
-        balance_trend = balance_data.get('trend', 'unknown')
-        credit_spike_count = anomaly_data.get('credit_spike_count', 0)
-        debit_spike_count = anomaly_data.get('debit_spike_count', 0)
-
-        # Identify risk flags
-        risk_flags = []
-
-        # Income stability risk
-        if income_stability_score < 50:
-            risk_flags.append("unstable_income")
-
-        # Balance trend risk
-        if balance_trend == 'decreasing':
-            risk_flags.append("declining_balance")
-
-        # Anomaly-based risks
-        if credit_spike_count > 3:
-            risk_flags.append("irregular_income_patterns")
-        if debit_spike_count > 5:
-            risk_flags.append("irregular_spending_patterns")
-
-        # Negative balance risk
-        min_balance = balance_data.get('min_balance', 0)
-        if min_balance < 0:
-            risk_flags.append("negative_balance_history")
-
-        # Determine risk level
-        if len(risk_flags) == 0:
-            risk_level = "low"
-        elif len(risk_flags) <= 2:
-            risk_level = "medium"
-        else:
-            risk_level = "high"
+        ctx = {
+            "income_stability_score": stability_data.get('stability_score', 0),
+            "balance_trend": balance_data.get('trend', 'unknown'),
+            "credit_spike_count": anomaly_data.get('credit_spike_count', 0),
+            "debit_spike_count": anomaly_data.get('debit_spike_count', 0),
+            "min_balance": balance_data.get('min_balance', 0),
+        }
+
+        risk_flags = [flag for flag, predicate in RISK_RULES if predicate(ctx)]
+        risk_level = _RISK_LEVELS[bisect_right(_RISK_LEVEL_BOUNDS, len(risk_flags))]
 
         return RiskIndicatorsBlock(
-            income_stability_score=income_stability_score,
-            balance_trend=balance_trend,
-            credit_spike_count=credit_spike_count,
-            debit_spike_count=debit_spike_count,
+            income_stability_score=ctx["income_stability_score"],
+            balance_trend=ctx["balance_trend"],
+            credit_spike_count=ctx["credit_spike_count"],
+            debit_spike_count=ctx["debit_spike_count"],
             risk_flags=risk_flags,
             risk_level=risk_level
         )
@@ -419,7 +446,7 @@ def execute_section(customer_id: int, section_name: str) -> Tuple[Optional[dict]
         If execution fails, returns (None, error_description).
     """
     # Validate section name
-    if section_name not in AVAILABLE_SECTIONS:
+    if section_name not in AVAILABLE_SECTIONS_SET:
         logger.warning(f"Invalid section name: {section_name}")
         return None, f"Invalid section name: {section_name}"
 
@@ -459,18 +486,22 @@ def build_data_profile(customer_id: int) -> dict:
     without fully extracting it. Used by the planner to decide which sections
     to include.
 
+    The profile also carries ``prty_name`` so report aggregation can fill
+    the report meta without slicing the transactions again; it is not a
+    planning signal and callers should drop it before planning.
+
     Args:
         customer_id: Customer identifier
 
     Returns:
-        Dict with data availability flags
+        Dict with data availability flags, transaction_count and prty_name
     """
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
+    cust_df = get_customer_slice(customer_id)
 
     transaction_count = len(cust_df)
     if transaction_count == 0:
         return {
+            "prty_name": None,
             "transaction_count": 0,
             "has_salary": False,
             "has_emi": False,
@@ -487,29 +518,11 @@ def build_data_profile(customer_id: int) -> dict:
     except Exception:
         pass
 
-    # Check for EMI
-    has_emi = False
-    try:
-        emi_result = resolve_category_presence(customer_id, "emi")
-        has_emi = emi_result.get('present', False)
-    except Exception:
-        pass
-
-    # Check for rent
-    has_rent = False
-    try:
-        rent_result = resolve_category_presence(customer_id, "rent")
-        has_rent = rent_result.get('present', False)
-    except Exception:
-        pass
-
-    # Check for utilities
-    has_utilities = False
-    try:
-        util_result = resolve_category_presence(customer_id, "utilities")
-        has_utilities = util_result.get('present', False)
-    except Exception:
-        pass
+    # Check for EMI, rent and utilities via the shared presence index
+    presence = _category_index(customer_id)
+    has_emi = presence["emi"].get('present', False)
+    has_rent = presence["rent"].get('present', False)
+    has_utilities = presence["utilities"].get('present', False)
 
     # Count distinct months
     month_count = 0
@@ -526,6 +539,7 @@ def build_data_profile(customer_id: int) -> dict:
             pass
 
     return {
+        "prty_name": _get_party_name(cust_df),
         "transaction_count": transaction_count,
         "has_salary": has_salary,
         "has_emi": has_emi,
@@ -9,9 +9,9 @@ from tools.bureau_chat import (
     bureau_credit_card_info, bureau_loan_type_info,
     bureau_delinquency_check, bureau_overview,
 )
-from pipeline.report_orchestrator import generate_customer_report_pdf
-from tools.bureau import generate_bureau_report_pdf
-from tools.combined_report import generate_combined_report_pdf as _gen_combined_pdf
+
+# Report generators are imported inside the wrappers below: they pull in the
+# PDF/HTML renderers and LLM summary chains, which quick tools never need.
 
 
 def _generate_customer_report_with_pdf(customer_id: int, **kwargs) -> Dict[str, Any]:
@@ -20,6 +20,8 @@ def _generate_customer_report_with_pdf(customer_id: int, **kwargs) -> Dict[str,
 
     Wraps the report orchestrator to return data suitable for the pipeline.
     """
+    from pipeline.report_orchestrator import generate_customer_report_pdf
+
     report, pdf_path = generate_customer_report_pdf(customer_id, **kwargs)
     result = report.model_dump()
     result['pdf_path'] = pdf_path
@@ -33,6 +35,8 @@ def _generate_bureau_report_with_pdf(customer_id: int, **kwargs) -> Dict[str, An
 
     Wraps the bureau tool to return data suitable for the pipeline.
     """
+    from tools.bureau import generate_bureau_report_pdf
+
     report, pdf_path = generate_bureau_report_pdf(customer_id)
     result = asdict(report.executive_inputs)
     result['feature_vectors'] = {
@@ -49,6 +53,8 @@ def _generate_combined_report_with_pdf(customer_id: int, **kwargs) -> Dict[str,
 
     Wraps the combined report tool to return data suitable for the pipeline.
     """
+    from tools.combined_report import generate_combined_report_pdf as _gen_combined_pdf
+
     customer_report, bureau_report, pdf_path = _gen_combined_pdf(customer_id)
     result = customer_report.model_dump() if customer_report else {}
     result['pdf_path'] = pdf_path
@@ -1,14 +1,26 @@
 """Response explainer - generates natural language from structured results."""
 
+import asyncio
+import hashlib
+import heapq
+import sys
 import time
-from typing import List, Dict, Any, Iterator, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from io import StringIO
+from operator import itemgetter
+from typing import AsyncIterator, Callable, List, Dict, Any, Iterable, Iterator, Optional, Union
 from langchain_ollama import ChatOllama
 
-from schemas.intent import ParsedIntent
+from schemas.intent import ParsedIntent, IntentType
 from schemas.response import ToolResult
 from schemas.transaction_insights import TransactionInsights
 from utils.helpers import mask_customer_id
-from config.settings import EXPLAINER_MODEL
+from config.settings import (
+    EXPLAINER_MODEL, EXPLAINER_STREAM_DELAY,
+    EXPLAINER_CACHE_ENABLED, EXPLAINER_CACHE_SIZE,
+)
+from .result_merger import format_insights_section
 
 
 EXPLAINER_PROMPT = """You are a finance/risk manager. You need to provide your insighsts, based on the data below, provide a clear, concise answer to the user's question.
@@ -20,238 +32,637 @@ Data:
 
 Answer:"""
 
+# Static pieces of EXPLAINER_PROMPT around its two placeholders, split once so
+# each request only concatenates. The instruction head stays a fixed prefix.
+_PROMPT_HEAD, _rest = EXPLAINER_PROMPT.split("{query}")
+_PROMPT_MID, _PROMPT_TAIL = _rest.split("{data}")
+del _rest
+
+# Insights, or a Future still computing them (resolved while the prompt is built)
+_InsightsArg = Union[TransactionInsights, "Future[Optional[TransactionInsights]]", None]
+
+# Section banners used in the formatted report text
+_BANNER_EQ = "=" * 60
+_BANNER_DASH = "-" * 60
+
+# One supporting-transaction line in category presence output
+_TXN_FMT = "{i}. [{date}] {direction} {amount:,.2f} - {narration} ({txn_type})".format
+
+# Interned values of the enum-like supporting-transaction fields, so repeated
+# values share one string object (unknown values pass through unchanged)
+_DIRECTIONS = {s: sys.intern(s) for s in ("D", "C", "DR", "CR", "DEBIT", "CREDIT", "N/A")}
+_TXN_TYPES = {
+    s: sys.intern(s)
+    for s in ("UPI", "NEFT", "IMPS", "RTGS", "ATM", "POS", "Unknown", "N/A")
+}
+
+
+def _format_category_presence(data: Dict[str, Any]) -> str:
+    """Format category presence result with transactions."""
+    present = data.get('present', False)
+    header = (
+        f"Category: {data.get('category', 'Unknown')}\n"
+        f"Present: {'YES' if present else 'NO'}"
+    )
+
+    if not present:
+        return f"{header}\nNo matching transactions found for this category."
+
+    sections = [
+        header,
+        f"Total Amount: {data.get('total_amount', 0):,.2f}\n"
+        f"Transaction Count: {data.get('transaction_count', 0)}",
+    ]
+
+    txns = data.get('supporting_transactions', [])
+    if txns:
+        txn_lines = "\n".join([
+            _TXN_FMT(
+                i=i,
+                date=txn.get('date', 'N/A'),
+                direction=_DIRECTIONS.get(direction := txn.get('direction', 'N/A'), direction),
+                amount=txn.get('amount', 0),
+                narration=txn.get('narration', 'N/A'),
+                txn_type=_TXN_TYPES.get(txn_type := txn.get('transaction_type', 'N/A'), txn_type),
+            )
+            for i, txn in enumerate(txns, 1)
+        ])
+        sections.append(
+            f"\nSupporting Transactions:\n{_BANNER_DASH}\n{txn_lines}\n{_BANNER_DASH}"
+        )
+
+    return "\n".join(sections)
+
+
+def _format_customer_report(data: Dict[str, Any]) -> str:
+    """Format customer report result with key highlights."""
+    meta = data.get('meta', {})
+    cust_id = meta.get('customer_id', 'N/A')
+
+    sections = [
+        f"{_BANNER_EQ}\nCUSTOMER FINANCIAL REPORT\n{_BANNER_EQ}\n"
+        f"Customer ID: {mask_customer_id(cust_id) if cust_id != 'N/A' else 'N/A'}"
+    ]
+    if meta.get('prty_name'):
+        sections.append(f"Customer Name: {meta.get('prty_name')}")
+    generated_at = meta.get('generated_at')
+    sections.append(
+        f"Period: {meta.get('analysis_period', 'N/A')}\n"
+        f"Transactions Analyzed: {meta.get('transaction_count', 0)}\n"
+        f"Report Generated: {generated_at[:10] if generated_at else 'N/A'}\n"
+        f"\nReport saved to: {data.get('pdf_path', 'N/A')}\n"
+        f"{_BANNER_DASH}\n"
+        f"Sections included: {', '.join(data.get('populated_sections', []))}"
+    )
+
+    # Salary info
+    salary = data.get('salary')
+    if salary:
+        salary_section = f"\nSalary: {salary.get('avg_amount', 0):,.2f} INR ({salary.get('frequency', 0)} transactions)"
+        latest = salary.get('latest_transaction')
+        if latest:
+            latest_date = latest.get('date')
+            salary_section += (
+                f"\n  Latest: {latest.get('amount', 0):,.2f} INR on "
+                f"{latest_date[:10] if latest_date else 'N/A'}"
+            )
+        sections.append(salary_section)
+
+    # Category overview - top 5
+    cat_overview = data.get('category_overview')
+    if cat_overview:
+        sorted_cats = heapq.nlargest(5, cat_overview.items(), key=itemgetter(1))
+        sections.append("\nTop Spending Categories:\n" + "\n".join([
+            f"  - {cat}: {amt:,.2f}" for cat, amt in sorted_cats
+        ]))
+
+    # Monthly cashflow summary
+    cashflow = data.get('monthly_cashflow')
+    if cashflow:
+        total_in = total_out = 0
+        for m in cashflow:
+            total_in += m.get('inflow', 0)
+            total_out += m.get('outflow', 0)
+        sections.append(
+            f"\nCashflow Summary ({len(cashflow)} months):\n"
+            f"  Total Inflow: {total_in:,.0f}\n"
+            f"  Total Outflow: {total_out:,.0f}\n"
+            f"  Net: {total_in - total_out:,.0f}"
+        )
+
+    # EMI
+    emis = data.get('emis')
+    if emis:
+        total_emi = sum(e.get('amount', 0) for e in emis)
+        sections.append(f"\nEMI Commitments: {total_emi:,.2f}")
+
+    # Rent
+    rent = data.get('rent')
+    if rent:
+        sections.append(f"Rent: {rent.get('amount', 0):,.2f}")
+
+    # Customer persona (LLM profile)
+    persona = data.get('customer_persona')
+    if persona:
+        sections.append(f"\nCustomer Profile:\n{persona}")
+
+    # Customer review (LLM summary)
+    review = data.get('customer_review')
+    if review:
+        sections.append(f"\nExecutive Summary:\n{review}")
+
+    sections.append(_BANNER_EQ)
+
+    return "\n".join(sections)
+
+
+# ---------------------------------------------------------------------------
+# Simple (no-LLM) formatters, one per result shape
+# ---------------------------------------------------------------------------
+
+def _money(amount: float, data: Dict[str, Any]) -> str:
+    """Format an amount in the result's own currency (tools default to USD)."""
+    currency = data.get("currency", "USD")
+    if currency == "USD":
+        return f"${amount:,.2f}"
+    return f"{amount:,.2f} {currency}"
+
+
+def _fmt_spending(data: Dict[str, Any]) -> List[str]:
+    lines = [f"Total spending: {_money(data['total_spending'], data)}"]
+    if data.get("start_date") and data.get("end_date"):
+        lines.append(f"Period: {data['start_date']} to {data['end_date']}")
+    if "transaction_count" in data:
+        lines.append(f"Number of transactions: {data['transaction_count']}")
+    if "month_wise_spending" in data:
+        lines.append("Monthly spending:")
+        for month, amount in data['month_wise_spending'].items():
+            lines.append(f"  {month}: {_money(amount, data)}")
+    return lines
+
+
+def _fmt_income(data: Dict[str, Any]) -> List[str]:
+    lines = [f"Total income: {_money(data['total_income'], data)}"]
+    if "transaction_count" in data:
+        lines.append(f"Number of transactions: {data['transaction_count']}")
+    return lines
+
+
+def _fmt_category_breakdown(data: Dict[str, Any]) -> List[str]:
+    lines = []
+    if "category_spending" in data:
+        lines.append(f"Spending on {data['category']}: {_money(data['category_spending'], data)}")
+    if "all_categories_spending" in data:
+        lines.append("Spending by category:")
+        txns_by_cat = data.get('transactions_by_category', {})
+        for cat, amount in data['all_categories_spending'].items():
+            count = txns_by_cat.get(cat, 0)
+            lines.append(f"  {cat}: {_money(amount, data)} ({count} transactions)")
+    return lines
+
+
+def _fmt_category_spending(data: Dict[str, Any]) -> List[str]:
+    """Single-category or all-categories result of get_spending_by_category."""
+    lines = _fmt_spending(data) if "total_spending" in data else []
+    lines.extend(_fmt_category_breakdown(data))
+    return lines
+
+
+def _fmt_top_categories(data: Dict[str, Any]) -> List[str]:
+    lines = ["Top spending categories:"]
+    for i, (cat, amt) in enumerate(data['top_categories'].items(), 1):
+        lines.append(f"  {i}. {cat}: {_money(amt, data)}")
+    return lines
+
+
+def _fmt_customers(data: Dict[str, Any]) -> List[str]:
+    return [f"Customers: {data['customers']}"]
+
+
+def _fmt_categories(data: Dict[str, Any]) -> List[str]:
+    return [f"Categories: {data['categories']}"]
+
+
+def _fmt_category_presence(data: Dict[str, Any]) -> List[str]:
+    return [_format_category_presence(data)]
+
+
+def _fmt_customer_report(data: Dict[str, Any]) -> List[str]:
+    return [_format_customer_report(data)]
+
+
+def _fmt_by_keys(data: Dict[str, Any]) -> List[str]:
+    """Fallback for tools without a dedicated formatter: probe result keys."""
+    lines = []
+    if "total_spending" in data:
+        lines.extend(_fmt_spending(data))
+    if "total_income" in data:
+        lines.extend(_fmt_income(data))
+    lines.extend(_fmt_category_breakdown(data))
+    if "top_categories" in data:
+        lines.extend(_fmt_top_categories(data))
+    if "customers" in data:
+        lines.extend(_fmt_customers(data))
+    if "categories" in data:
+        lines.extend(_fmt_categories(data))
+    if "present" in data and "category" in data:
+        lines.extend(_fmt_category_presence(data))
+    if "pdf_path" in data and "populated_sections" in data:
+        lines.extend(_fmt_customer_report(data))
+    return lines
+
+
+# Tool name -> simple formatter (tools not listed fall back to _fmt_by_keys)
+_SIMPLE_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "debit_total": _fmt_spending,
+    "spending_in_date_range": _fmt_spending,
+    "get_total_income": _fmt_income,
+    "get_spending_by_category": _fmt_category_spending,
+    "top_spending_categories": _fmt_top_categories,
+    "list_customers": _fmt_customers,
+    "list_categories": _fmt_categories,
+    "category_presence_lookup": _fmt_category_presence,
+    "generate_customer_report": _fmt_customer_report,
+}
+
+
+# Intents whose explainer prompt makes use of the transaction insights section.
+# The orchestrator skips insight extraction for anything not marked True here.
+EXPLAINER_USES_INSIGHTS: Dict[IntentType, bool] = {
+    IntentType.LENDER_PROFILE: True,
+    IntentType.CUSTOMER_REPORT: True,
+    IntentType.FINANCIAL_OVERVIEW: True,
+}
+
+
+# Deterministic tools whose simple formatting fully answers the query, so the
+# explainer can skip the LLM when every result comes from one of them
+_SIMPLE_ONLY_TOOLS = frozenset({
+    "debit_total",
+    "spending_in_date_range",
+    "get_total_income",
+    "get_spending_by_category",
+    "top_spending_categories",
+    "list_customers",
+    "list_categories",
+})
+
+
+def _simple_lines(results: List[ToolResult]) -> Iterator[str]:
+    """Yield format_simple output lines for all successful results."""
+    for r in results:
+        if r.success:
+            fmt = _SIMPLE_FORMATTERS.get(r.tool_name, _fmt_by_keys)
+            yield from fmt(r.result)
+
+
+def _format_single(r: ToolResult) -> Optional[str]:
+    """Format one result for the LLM prompt (None for failed results)."""
+    if not r.success:
+        return None
+    data = r.result
+    # Special formatting for category presence lookup
+    if r.tool_name == "category_presence_lookup" and "present" in data:
+        return _format_category_presence(data)
+    # Special formatting for customer report
+    if r.tool_name == "generate_customer_report" and "pdf_path" in data:
+        return _format_customer_report(data)
+    return f"{r.tool_name}: {r.result}"
+
+
+class _Coalescer:
+    """
+    Flush rules shared by the sync and async streaming paths.
+
+    A batch is released once it reaches batch_chars characters or once
+    flush_interval seconds have passed since the last release; flush()
+    returns the tail. The first piece is released as soon as it arrives.
+    """
+
+    def __init__(self, batch_chars: int, flush_interval: float):
+        self.batch_chars = batch_chars
+        self.flush_interval = flush_interval
+        self._buf: List[str] = []
+        self._len = 0
+        # Backdated so the first token is released at once (time to first token)
+        self._last_flush = time.monotonic() - flush_interval
+
+    def push(self, piece: str) -> Optional[str]:
+        """Buffer a piece; return the batch to emit, if one is due."""
+        self._buf.append(piece)
+        self._len += len(piece)
+        now = time.monotonic()
+        if self._len >= self.batch_chars or now - self._last_flush >= self.flush_interval:
+            self._last_flush = now
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return whatever is buffered (None if empty) and reset."""
+        if not self._buf:
+            return None
+        batch = "".join(self._buf)
+        self._buf.clear()
+        self._len = 0
+        return batch
+
 
 class ResponseExplainer:
-    def __init__(self, model_name: str = EXPLAINER_MODEL, stream_delay: float = 0.025):
+    def __init__(
+        self,
+        model_name: str = EXPLAINER_MODEL,
+        stream_delay: float = EXPLAINER_STREAM_DELAY,
+        batch_chars: int = 24,
+        flush_interval: float = 0.03,
+        bypass_llm_for_simple: bool = True
+    ):
         """
         Initialize the explainer.
 
         Args:
             model_name: Ollama model to use
             stream_delay: Delay in seconds between streaming chunks (0.0 = no delay)
-                         Use 0.02-0.05 for readable typing effect
+                         Use 0.02-0.05 for readable typing effect; defaults to
+                         the EXPLAINER_STREAM_DELAY setting (off)
+            batch_chars: Buffered characters that trigger a streamed chunk
+            flush_interval: Max seconds to hold buffered text before yielding it
+            bypass_llm_for_simple: Answer with format_simple() instead of the
+                         LLM when all results come from simple numeric tools
         """
         self.llm = ChatOllama(model=model_name, temperature=0, seed=42)
         self.stream_delay = stream_delay
+        self.batch_chars = batch_chars
+        self.flush_interval = flush_interval
+        self.bypass_llm_for_simple = bypass_llm_for_simple
+        # Last built prompt, keyed by the identity of its inputs
+        self._prompt_memo: Optional[tuple] = None
+        # LRU of LLM answers keyed by prompt digest
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
 
     def explain(
         self,
         intent: ParsedIntent,
         results: List[ToolResult],
-        transaction_insights: Optional[TransactionInsights] = None
+        transaction_insights: _InsightsArg = None
     ) -> str:
-        if not results:
-            return "No data available to answer this question."
+        unanswerable = self._unanswerable(results)
+        if unanswerable is not None:
+            return unanswerable
 
-        all_failed = all(not r.success for r in results)
-        if all_failed:
-            errors = [r.error for r in results if r.error]
-            return f"Unable to retrieve data: {'; '.join(errors)}"
-
-        data_str = self._format_results(results)
-
-        if transaction_insights:
-            from .result_merger import merge_transaction_insights
-            data_str = merge_transaction_insights(data_str, transaction_insights)
+        prompt = self._build_prompt(intent, results, transaction_insights)
+        key = self._cache_key(prompt)
 
-        prompt = EXPLAINER_PROMPT.format(query=intent.raw_query, data=data_str)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
         response = self.llm.invoke(prompt)
+        self._cache_put(key, response.content)
         return response.content
 
     def stream_explain(
         self,
         intent: ParsedIntent,
         results: List[ToolResult],
-        transaction_insights: Optional[TransactionInsights] = None
+        transaction_insights: _InsightsArg = None
     ) -> Iterator[str]:
         """
         Stream explanation tokens as they are generated.
         Yields individual tokens/chunks from the LLM.
+
+        transaction_insights may be a Future still being computed; it is only
+        waited on while the prompt is assembled, after the results are
+        formatted, and not at all when the reply needs no LLM call.
         """
-        if not results:
-            yield "No data available to answer this question."
+        unanswerable = self._unanswerable(results)
+        if unanswerable is not None:
+            yield from self._replay(unanswerable)
+            return
+
+        prompt = self._build_prompt(intent, results, transaction_insights)
+        key = self._cache_key(prompt)
+
+        # Replay a cached answer without the model call
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield from self._replay(cached)
+            return
+
+        # Stream tokens from LLM, coalesced into small batches
+        tokens: List[str] = []
+        for batch in self._batched(self._llm_tokens(prompt)):
+            tokens.append(batch)
+            yield batch
+        # Only a fully consumed stream is cached
+        self._cache_put(key, "".join(tokens))
+
+    async def aexplain(
+        self,
+        intent: ParsedIntent,
+        results: List[ToolResult],
+        transaction_insights: _InsightsArg = None
+    ) -> str:
+        """
+        Async variant of explain().
+
+        Lets callers fan out several explanations concurrently, e.g.
+        ``await asyncio.gather(*(explainer.aexplain(i, r) for i, r in pairs))``.
+        """
+        unanswerable = self._unanswerable(results)
+        if unanswerable is not None:
+            return unanswerable
+
+        if isinstance(transaction_insights, Future):
+            transaction_insights = await asyncio.wrap_future(transaction_insights)
+        prompt = self._build_prompt(intent, results, transaction_insights)
+        key = self._cache_key(prompt)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.llm.ainvoke(prompt)
+        self._cache_put(key, response.content)
+        return response.content
+
+    async def astream_explain(
+        self,
+        intent: ParsedIntent,
+        results: List[ToolResult],
+        transaction_insights: _InsightsArg = None
+    ) -> AsyncIterator[str]:
+        """Async variant of stream_explain(), yielding the same batches."""
+        unanswerable = self._unanswerable(results)
+        if unanswerable is None:
+            if isinstance(transaction_insights, Future):
+                transaction_insights = await asyncio.wrap_future(transaction_insights)
+            prompt = self._build_prompt(intent, results, transaction_insights)
+            key = self._cache_key(prompt)
+            # Replay a cached answer without the model call
+            unanswerable = self._cache_get(key)
+
+        if unanswerable is not None:
+            n = self.batch_chars
+            for i in range(0, len(unanswerable), n):
+                yield unanswerable[i:i + n]
+                await asyncio.sleep(self.stream_delay)
             return
 
+        tokens: List[str] = []
+        coalescer = _Coalescer(self.batch_chars, self.flush_interval)
+
+        async for chunk in self.llm.astream(prompt):
+            piece = getattr(chunk, 'content', chunk)
+            if not isinstance(piece, str) or not piece:
+                continue
+            batch = coalescer.push(piece)
+            if batch is not None:
+                tokens.append(batch)
+                yield batch
+                # Yield to the event loop (plus any configured UX delay)
+                await asyncio.sleep(self.stream_delay)
+
+        batch = coalescer.flush()
+        if batch is not None:
+            tokens.append(batch)
+            yield batch
+        self._cache_put(key, "".join(tokens))
+
+    def _unanswerable(self, results: List[ToolResult]) -> Optional[str]:
+        """
+        Return a reply that needs no LLM call, else None.
+
+        Covers empty or all-failed results, and (if enabled) results that all
+        come from simple numeric tools, answered via format_simple().
+        """
+        if not results:
+            return "No data available to answer this question."
+
         all_failed = all(not r.success for r in results)
         if all_failed:
             errors = [r.error for r in results if r.error]
-            yield f"Unable to retrieve data: {'; '.join(errors)}"
-            return
-
-        data_str = self._format_results(results)
+            return f"Unable to retrieve data: {'; '.join(errors)}"
 
-        if transaction_insights:
-            from .result_merger import merge_transaction_insights
-            data_str = merge_transaction_insights(data_str, transaction_insights)
+        if self.bypass_llm_for_simple and all(
+            r.success and r.tool_name in _SIMPLE_ONLY_TOOLS for r in results
+        ):
+            return self.format_simple(results)
+
+        return None
+
+    @staticmethod
+    def _cache_key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Return a cached answer (refreshing its LRU position) or None."""
+        if not EXPLAINER_CACHE_ENABLED:
+            return None
+        answer = self._response_cache.get(key)
+        if answer is not None:
+            self._response_cache.move_to_end(key)
+        return answer
+
+    def _cache_put(self, key: bytes, answer: str) -> None:
+        """Store an answer, evicting the least recently used beyond capacity."""
+        if not EXPLAINER_CACHE_ENABLED or not answer:
+            return
+        self._response_cache[key] = answer
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > EXPLAINER_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
 
-        prompt = EXPLAINER_PROMPT.format(query=intent.raw_query, data=data_str)
+    def _build_prompt(
+        self,
+        intent: ParsedIntent,
+        results: List[ToolResult],
+        transaction_insights: _InsightsArg
+    ) -> str:
+        """
+        Build the explainer prompt, reusing the last one for identical inputs.
 
-        # Stream tokens from LLM
+        The memo holds references to its inputs, so an identity match cannot
+        be a recycled id. A Future for the insights is resolved only once the
+        results are written, so its work overlaps with the formatting.
+        """
+        memo = self._prompt_memo
+        if (
+            memo is not None
+            and memo[0] is intent
+            and memo[1] is results
+            and memo[2] is transaction_insights
+        ):
+            return memo[3]
+
+        # Write the whole prompt into one buffer rather than building the data
+        # string first and copying it again into the template
+        buf = StringIO()
+        write = buf.write
+        write(_PROMPT_HEAD)
+        write(intent.raw_query)
+        write(_PROMPT_MID)
+        self._format_results_into(write, results)
+
+        insights = transaction_insights
+        if isinstance(insights, Future):
+            insights = insights.result()
+        if insights:
+            insights_section = format_insights_section(insights)
+            if insights_section:
+                write("\n\n")
+                write(insights_section)
+
+        write(_PROMPT_TAIL)
+        prompt = buf.getvalue()
+        self._prompt_memo = (intent, results, transaction_insights, prompt)
+        return prompt
+
+    def _replay(self, text: str) -> Iterator[str]:
+        """Stream ready-made text in batch_chars-sized slices."""
+        n = self.batch_chars
+        return self._batched(text[i:i + n] for i in range(0, len(text), n))
+
+    def _llm_tokens(self, prompt: str) -> Iterator[str]:
+        """Yield raw text tokens from the streaming LLM call."""
         for chunk in self.llm.stream(prompt):
             if hasattr(chunk, 'content') and chunk.content:
                 yield chunk.content
             elif isinstance(chunk, str):
                 yield chunk
-            # Apply delay if configured
-            if self.stream_delay > 0:
-                time.sleep(self.stream_delay)
+
+    def _batched(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Coalesce small text pieces into batches for streaming (see _Coalescer)."""
+        delay = self.stream_delay
+        coalescer = _Coalescer(self.batch_chars, self.flush_interval)
+
+        for piece in pieces:
+            batch = coalescer.push(piece)
+            if batch is not None:
+                yield batch
+                # Apply delay only if explicitly configured
+                if delay:
+                    time.sleep(delay)
+
+        batch = coalescer.flush()
+        if batch is not None:
+            yield batch
 
     def _format_results(self, results: List[ToolResult]) -> str:
-        lines = []
-        for r in results:
-            if r.success:
-                data = r.result
-                # Special formatting for category presence lookup
-                if r.tool_name == "category_presence_lookup" and "present" in data:
-                    lines.append(self._format_category_presence(data))
-                # Special formatting for customer report
-                elif r.tool_name == "generate_customer_report" and "pdf_path" in data:
-                    lines.append(self._format_customer_report(data))
-                else:
-                    lines.append(f"{r.tool_name}: {r.result}")
-        return "\n".join(lines)
-
-    def _format_category_presence(self, data: Dict[str, Any]) -> str:
-        """Format category presence result with transactions."""
-        lines = []
-        category = data.get('category', 'Unknown')
-        present = data.get('present', False)
-
-        lines.append(f"Category: {category}")
-        lines.append(f"Present: {'YES' if present else 'NO'}")
-
-        if present:
-            lines.append(f"Total Amount: {data.get('total_amount', 0):,.2f}")
-            lines.append(f"Transaction Count: {data.get('transaction_count', 0)}")
-
-            txns = data.get('supporting_transactions', [])
-            if txns:
-                lines.append("\nSupporting Transactions:")
-                lines.append("-" * 60)
-                for i, txn in enumerate(txns, 1):
-                    date = txn.get('date', 'N/A')
-                    amount = txn.get('amount', 0)
-                    narration = txn.get('narration', 'N/A')
-                    direction = txn.get('direction', 'N/A')
-                    txn_type = txn.get('transaction_type', 'N/A')
-                    lines.append(f"{i}. [{date}] {direction} {amount:,.2f} - {narration} ({txn_type})")
-                lines.append("-" * 60)
-        else:
-            lines.append("No matching transactions found for this category.")
-
-        return "\n".join(lines)
-
-    def _format_customer_report(self, data: Dict[str, Any]) -> str:
-        """Format customer report result with key highlights."""
-        lines = []
-        meta = data.get('meta', {})
-
-        lines.append("=" * 60)
-        lines.append("CUSTOMER FINANCIAL REPORT")
-        lines.append("=" * 60)
-        cust_id = meta.get('customer_id', 'N/A')
-        lines.append(f"Customer ID: {mask_customer_id(cust_id) if cust_id != 'N/A' else 'N/A'}")
-        if meta.get('prty_name'):
-            lines.append(f"Customer Name: {meta.get('prty_name')}")
-        lines.append(f"Period: {meta.get('analysis_period', 'N/A')}")
-        lines.append(f"Transactions Analyzed: {meta.get('transaction_count', 0)}")
-        lines.append(f"Report Generated: {meta.get('generated_at', 'N/A')[:10]}")
-        lines.append(f"\nReport saved to: {data.get('pdf_path', 'N/A')}")
-        lines.append("-" * 60)
-
-        # Populated sections
-        sections = data.get('populated_sections', [])
-        lines.append(f"Sections included: {', '.join(sections)}")
-
-        # Salary info
-        salary = data.get('salary')
-        if salary:
-            lines.append(f"\nSalary: {salary.get('avg_amount', 0):,.2f} INR ({salary.get('frequency', 0)} transactions)")
-            latest = salary.get('latest_transaction')
-            if latest:
-                lines.append(f"  Latest: {latest.get('amount', 0):,.2f} INR on {latest.get('date', 'N/A')[:10]}")
-
-        # Category overview - top 5
-        cat_overview = data.get('category_overview')
-        if cat_overview:
-            lines.append("\nTop Spending Categories:")
-            sorted_cats = sorted(cat_overview.items(), key=lambda x: x[1], reverse=True)[:5]
-            for cat, amt in sorted_cats:
-                lines.append(f"  - {cat}: {amt:,.2f}")
-
-        # Monthly cashflow summary
-        cashflow = data.get('monthly_cashflow')
-        if cashflow:
-            total_in = sum(m.get('inflow', 0) for m in cashflow)
-            total_out = sum(m.get('outflow', 0) for m in cashflow)
-            lines.append(f"\nCashflow Summary ({len(cashflow)} months):")
-            lines.append(f"  Total Inflow: {total_in:,.0f}")
-            lines.append(f"  Total Outflow: {total_out:,.0f}")
-            lines.append(f"  Net: {total_in - total_out:,.0f}")
-
-        # EMI
-        emis = data.get('emis')
-        if emis:
-            total_emi = sum(e.get('amount', 0) for e in emis)
-            lines.append(f"\nEMI Commitments: {total_emi:,.2f}")
-
-        # Rent
-        rent = data.get('rent')
-        if rent:
-            lines.append(f"Rent: {rent.get('amount', 0):,.2f}")
-
-        # Customer persona (LLM profile)
-        persona = data.get('customer_persona')
-        if persona:
-            lines.append(f"\nCustomer Profile:\n{persona}")
-
-        # Customer review (LLM summary)
-        review = data.get('customer_review')
-        if review:
-            lines.append(f"\nExecutive Summary:\n{review}")
-
-        lines.append("=" * 60)
-
-        return "\n".join(lines)
+        buf = StringIO()
+        self._format_results_into(buf.write, results)
+        return buf.getvalue()
+
+    def _format_results_into(self, write: Callable[[str], Any], results: List[ToolResult]) -> None:
+        """Write formatted results (newline-separated) through ``write``."""
+        first = True
+        for part in map(_format_single, results):
+            if part is None:
+                continue
+            if not first:
+                write("\n")
+            first = False
+            write(part)
 
     def format_simple(self, results: List[ToolResult]) -> str:
         """Simple formatting without LLM - for faster responses."""
-        lines = []
-        for r in results:
-            if r.success:
-                data = r.result
-                if "total_spending" in data:
-                    lines.append(f"Total spending: ${data['total_spending']:,.2f}")
-                    if "transaction_count" in data:
-                        lines.append(f"Number of transactions: {data['transaction_count']}")
-                    if "month_wise_spending" in data:
-                        lines.append("Monthly spending:")
-                        for month, amount in data['month_wise_spending'].items():
-                            lines.append(f"  {month}: ${amount:,.2f}")
-                if "total_income" in data:
-                    lines.append(f"Total income: ${data['total_income']:,.2f}")
-                    if "transaction_count" in data:
-                        lines.append(f"Number of transactions: {data['transaction_count']}")
-                if "category_spending" in data:
-                    lines.append(f"Spending on {data['category']}: ${data['category_spending']:,.2f}")
-                if "all_categories_spending" in data:
-                    lines.append("Spending by category:")
-                    for cat, amount in data['all_categories_spending'].items():
-                        count = data.get('transactions_by_category', {}).get(cat, 0)
-                        lines.append(f"  {cat}: ${amount:,.2f} ({count} transactions)")
-                if "top_categories" in data:
-                    lines.append("Top spending categories:")
-                    for i, (cat, amt) in enumerate(data['top_categories'].items(), 1):
-                        lines.append(f"  {i}. {cat}: ${amt:,.2f}")
-                if "customers" in data:
-                    lines.append(f"Customers: {data['customers']}")
-                if "categories" in data:
-                    lines.append(f"Categories: {data['categories']}")
-                # Category presence lookup
-                if "present" in data and "category" in data:
-                    lines.append(self._format_category_presence(data))
-                # Customer report
-                if "pdf_path" in data and "populated_sections" in data:
-                    lines.append(self._format_customer_report(data))
-        return "\n".join(lines) if lines else "No results found."
+        return "\n".join(_simple_lines(results)) or "No results found."
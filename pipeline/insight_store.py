@@ -1,11 +1,36 @@
-"""Insight cache for transaction patterns."""
+"""Insight cache for transaction patterns.
 
-from typing import Dict, Tuple, Optional
+Bounded LRU with a TTL, so a long-running service neither grows without
+limit nor serves insights from before a data refresh.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Set, Tuple, Optional
 
 from schemas.transaction_insights import TransactionInsights
 
 
-_INSIGHT_CACHE: Dict[Tuple[int, str], TransactionInsights] = {}
+INSIGHT_CACHE_MAX_ENTRIES = 1024
+INSIGHT_TTL_SEC = 3600.0
+
+# (customer_id, scope) -> (stored_at monotonic time, insights), oldest first
+_INSIGHT_CACHE: "OrderedDict[Tuple[int, str], Tuple[float, TransactionInsights]]" = OrderedDict()
+# customer_id -> scopes currently cached for that customer
+_BY_CUSTOMER: Dict[int, Set[str]] = {}
+_LOCK = threading.Lock()
+
+
+def _drop(key: Tuple[int, str]) -> None:
+    """Remove an entry and its customer index slot. Caller holds _LOCK."""
+    _INSIGHT_CACHE.pop(key, None)
+    customer_id, scope = key
+    scopes = _BY_CUSTOMER.get(customer_id)
+    if scopes is not None:
+        scopes.discard(scope)
+        if not scopes:
+            del _BY_CUSTOMER[customer_id]
 
 
 def get_cached_insights(customer_id: int, scope: str) -> Optional[TransactionInsights]:
@@ -17,38 +42,57 @@ def get_cached_insights(customer_id: int, scope: str) -> Optional[TransactionIns
         scope: Analysis scope used
 
     Returns:
-        Cached TransactionInsights or None if not cached
+        Cached TransactionInsights or None if not cached (or expired)
     """
-    return _INSIGHT_CACHE.get((customer_id, scope))
+    key = (customer_id, scope)
+    with _LOCK:
+        entry = _INSIGHT_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, insights = entry
+        if time.monotonic() - stored_at > INSIGHT_TTL_SEC:
+            _drop(key)
+            return None
+        _INSIGHT_CACHE.move_to_end(key)
+        return insights
 
 
 def store_insights(customer_id: int, scope: str, insights: TransactionInsights) -> None:
     """
-    Store insights in cache.
+    Store insights in cache, evicting the least recently used entry when full.
 
     Args:
         customer_id: Customer identifier
         scope: Analysis scope used
         insights: TransactionInsights to cache
     """
-    _INSIGHT_CACHE[(customer_id, scope)] = insights
+    key = (customer_id, scope)
+    with _LOCK:
+        _INSIGHT_CACHE[key] = (time.monotonic(), insights)
+        _INSIGHT_CACHE.move_to_end(key)
+        _BY_CUSTOMER.setdefault(customer_id, set()).add(scope)
+        while len(_INSIGHT_CACHE) > INSIGHT_CACHE_MAX_ENTRIES:
+            _drop(next(iter(_INSIGHT_CACHE)))
 
 
 def clear_customer_cache(customer_id: int) -> None:
     """Clear all cached insights for a customer."""
-    keys_to_remove = [k for k in _INSIGHT_CACHE if k[0] == customer_id]
-    for key in keys_to_remove:
-        del _INSIGHT_CACHE[key]
+    with _LOCK:
+        for scope in _BY_CUSTOMER.pop(customer_id, ()):
+            _INSIGHT_CACHE.pop((customer_id, scope), None)
 
 
 def clear_all_cache() -> None:
     """Clear entire insight cache."""
-    _INSIGHT_CACHE.clear()
+    with _LOCK:
+        _INSIGHT_CACHE.clear()
+        _BY_CUSTOMER.clear()
 
 
 def get_cache_stats() -> Dict[str, int]:
     """Get cache statistics."""
-    return {
-        "total_entries": len(_INSIGHT_CACHE),
-        "unique_customers": len(set(k[0] for k in _INSIGHT_CACHE))
-    }
+    with _LOCK:
+        return {
+            "total_entries": len(_INSIGHT_CACHE),
+            "unique_customers": len(_BY_CUSTOMER)
+        }
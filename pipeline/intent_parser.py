@@ -1,12 +1,66 @@
 """Intent parser using LLM to extract structured intent from user query."""
 
+import asyncio
+import hashlib
+import heapq
 import json
+import logging
+import math
 import re
+import threading
+from collections import Counter, OrderedDict
 from difflib import get_close_matches
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_ollama import ChatOllama
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# orjson decodes the LLM's JSON faster; its JSONDecodeError subclasses
+# json.JSONDecodeError, so the fallback handling is the same either way
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 from schemas.intent import ParsedIntent, IntentType, CONFIDENCE_THRESHOLD_RETRY
-from config.settings import PARSER_MODEL
+from config.settings import (
+    PARSER_MODEL,
+    PARSER_KEEP_ALIVE,
+    PARSER_NUM_CTX,
+    PARSER_JSON_SCHEMA,
+    PARSER_EXAMPLES_TOP_K,
+    PARSER_FAST_PATH_ENABLED,
+    PARSER_CACHE_ENABLED,
+    PARSER_CACHE_SIZE,
+    PARSER_CACHE_SIMILARITY,
+    PARSER_DISK_CACHE_ENABLED,
+    PARSER_DISK_CACHE_DIR,
+    PARSER_DISK_CACHE_TTL_SEC,
+    PARSER_DISK_CACHE_SIZE_LIMIT,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # All valid categories for normalization
@@ -24,6 +78,40 @@ VALID_CATEGORIES = [
     "Sports_Fitness", "EMI", "Finance", "P2P"
 ]
 
+# Lowercase name -> canonical category, and VALID_CATEGORIES order
+_CATEGORY_MAP = {cat.lower(): cat for cat in VALID_CATEGORIES}
+_CATEGORY_KEYS = list(_CATEGORY_MAP)
+_CATEGORY_RANK = {cat: i for i, cat in enumerate(VALID_CATEGORIES)}
+# Every category as a whole word, found in one scan of the lowercased query
+_CAT_RE = re.compile(r"\b(" + "|".join(map(re.escape, _CATEGORY_MAP)) + r")\b")
+
+# Aho-Corasick automaton over the same names (value: (length, category)) when
+# pyahocorasick is installed; word boundaries are checked on each hit
+if AHOCORASICK_AVAILABLE:
+    _CAT_AC = ahocorasick.Automaton()
+    for _key, _cat in _CATEGORY_MAP.items():
+        _CAT_AC.add_word(_key, (len(_key), _cat))
+    _CAT_AC.make_automaton()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _find_categories(query_lower: str) -> List[str]:
+    """Categories named as whole words in a lowercased query, in VALID_CATEGORIES order."""
+    if AHOCORASICK_AVAILABLE:
+        last = len(query_lower) - 1
+        found = set()
+        for end, (length, cat) in _CAT_AC.iter(query_lower):
+            start = end - length + 1
+            if ((start == 0 or not _is_word_char(query_lower[start - 1]))
+                    and (end == last or not _is_word_char(query_lower[end + 1]))):
+                found.add(cat)
+    else:
+        found = {_CATEGORY_MAP[hit] for hit in _CAT_RE.findall(query_lower)}
+    return sorted(found, key=_CATEGORY_RANK.__getitem__)
+
 # All valid intents (excluding UNKNOWN)
 VALID_INTENTS = [
     "total_spending", "total_income", "spending_by_category", "all_categories_spending", "top_categories",
@@ -41,7 +129,10 @@ VALID_INTENTS = [
     "bureau_credit_cards", "bureau_loan_count", "bureau_delinquency", "bureau_overview"
 ]
 
-PARSER_PROMPT = """You are a JSON extractor for a transaction analysis system. Extract intent from the query below.
+# Static rules go in the system message and only the query in the human
+# message, so every call shares an identical prefix Ollama can keep in its
+# KV cache (with keep_alive holding the model resident between calls).
+PARSER_SYSTEM_PROMPT = """You are a JSON extractor for a transaction analysis system. Extract intent from the user's query.
 
 INTENTS (choose the most specific one):
 - total_spending: Get total spending/expenses for a customer (e.g., "What is the total spending?", "How much did I spend in total?")
@@ -131,33 +222,446 @@ CATEGORIES: MNC_Companies, Digital_Betting_Gaming, Food, Liquor_Smoke, Bank_Fees
 
 DATE FORMAT: Use YYYY-MM-DD format (e.g., 2025-07-01)
 
-Query: {query}
-
 Return ONLY this JSON (no markdown, no explanation):
-{{"intent":"<intent>","customer_id":<int or null>,"category":"<str or null>","categories":<list or null>,"start_date":"<YYYY-MM-DD or null>","end_date":"<YYYY-MM-DD or null>","top_n":5,"threshold_std":2.0}}"""
+{"intent":"<intent>","customer_id":<int or null>,"category":"<str or null>","categories":<list or null>,"start_date":"<YYYY-MM-DD or null>","end_date":"<YYYY-MM-DD or null>","top_n":5,"threshold_std":2.0}"""
+
+# Human message is this prefix + the raw query (plain concat, no format())
+PARSER_HUMAN_PREFIX = "Query: "
+
+# Few-shot examples: with PARSER_EXAMPLES_TOP_K > 0 the example lines are
+# taken out of the system prompt and only the k most similar to the query
+# (tf-idf cosine over words, digits ignored) are sent with it, cutting input
+# tokens. The rules stay in the static system message, so its prefix is
+# still cacheable. PARSER_EXAMPLES_TOP_K=0 sends the full prompt as before.
+_EXAMPLE_LINE_RE = re.compile(r'^- ".*\n', re.M)
+_EXAMPLE_HEADER_RE = re.compile(r'^Examples for [^\n]*:\n', re.M)
+_EXAMPLE_WORD_RE = re.compile(r"[a-z_]*[a-z][a-z_]*")
+
+PARSER_EXAMPLES = [line.rstrip("\n") for line in _EXAMPLE_LINE_RE.findall(PARSER_SYSTEM_PROMPT)]
+PARSER_RULES_PROMPT = re.sub(
+    r"\n{3,}", "\n\n",
+    _EXAMPLE_HEADER_RE.sub("", _EXAMPLE_LINE_RE.sub("", PARSER_SYSTEM_PROMPT)),
+).replace(
+    "IMPORTANT for bureau chat queries (these are quick lookups, NOT full report generation):\n",
+    "IMPORTANT: bureau chat queries (credit cards, loan counts, delinquency, bureau overview) "
+    "are quick lookups, NOT full report generation.\n\n"
+    "Relevant examples are given with each query.\n",
+    1,
+)
+_ACTIVE_SYSTEM_PROMPT = PARSER_RULES_PROMPT if PARSER_EXAMPLES_TOP_K > 0 else PARSER_SYSTEM_PROMPT
+
+# Each example's quoted query (not its answer) as words, weighted by idf so
+# filler like "for"/"report" counts less than "loans"/"betting"
+_EXAMPLE_WORDS = [
+    Counter(_EXAMPLE_WORD_RE.findall(line.split("->", 1)[0].lower())) for line in PARSER_EXAMPLES
+]
+_EXAMPLE_IDF = {
+    word: math.log((1 + len(_EXAMPLE_WORDS)) / (1 + df)) + 1.0
+    for word, df in Counter(w for words in _EXAMPLE_WORDS for w in words).items()
+}
+_EXAMPLE_VECTORS = []
+for _words in _EXAMPLE_WORDS:
+    _vec = {w: n * _EXAMPLE_IDF[w] for w, n in _words.items()}
+    _EXAMPLE_VECTORS.append((_vec, math.sqrt(sum(v * v for v in _vec.values()))))
+
+
+# Words never seen in an example get the maximum idf (df = 0)
+_UNSEEN_IDF = math.log(1 + len(_EXAMPLE_WORDS)) + 1.0
+# Examples less similar than this are not worth their tokens
+_MIN_EXAMPLE_SIMILARITY = 0.4
+
+
+def _select_examples(query: str, k: int = PARSER_EXAMPLES_TOP_K) -> List[str]:
+    """Up to k examples similar to the query (cosine >= 0.4), in prompt order."""
+    weights = {
+        w: n * _EXAMPLE_IDF.get(w, _UNSEEN_IDF)
+        for w, n in Counter(_EXAMPLE_WORD_RE.findall(query.lower())).items()
+    }
+    query_norm = math.sqrt(sum(v * v for v in weights.values()))
+    if not query_norm:
+        return []
+    scored = []
+    for i, (vec, norm) in enumerate(_EXAMPLE_VECTORS):
+        dot = sum(weight * vec.get(w, 0.0) for w, weight in weights.items())
+        sim = dot / (norm * query_norm)
+        if sim >= _MIN_EXAMPLE_SIMILARITY:
+            scored.append((sim, -i))
+    top = heapq.nlargest(k, scored)
+    return [PARSER_EXAMPLES[-neg_i] for neg_i in sorted((neg_i for _, neg_i in top), reverse=True)]
+
+
+def _human_content(query: str) -> str:
+    """Human message: retrieved examples (if enabled) then the query."""
+    if PARSER_EXAMPLES_TOP_K > 0:
+        examples = _select_examples(query)
+        if examples:
+            return "Examples:\n" + "\n".join(examples) + "\n\n" + PARSER_HUMAN_PREFIX + query
+    return PARSER_HUMAN_PREFIX + query
+
+# String spellings of null the LLM emits for optional fields
+_NULL_STRINGS = frozenset(("null", "None", ""))
+_NULLABLE_FIELDS = ("category", "start_date", "end_date")
+
+# Intents that use category for non-transaction purposes (loan type, or a
+# phrase the category resolver handles) - their category is not normalized
+_SKIP_CATEGORY_NORM = frozenset({
+    IntentType.CATEGORY_PRESENCE_LOOKUP,
+    IntentType.BUREAU_LOAN_COUNT,
+    IntentType.BUREAU_DELINQUENCY,
+})
+# Queries that mean TOTAL_SPENDING when the LLM says SPENDING_BY_CATEGORY
+# without a category
+_TOTAL_SPENDING_KEYWORDS = ("total spending", "total expense", "spend in total")
+
+
+# Regexes compiled once at import (re's internal cache is small and shared)
+
+# Customer ID patterns, most specific first
+CUST_PATTERNS = [re.compile(p) for p in (
+    r'customer\s*[#:]?\s*(\d+)',
+    r'cust(?:omer)?[_\s]?id\s*[=:]?\s*(\d+)',
+    r'for\s+customer\s+(\d+)',
+    r'for\s+(\d{10})',  # 10-digit phone number
+    r'for\s+(\d+)',
+    r'^(\d+)\s',  # ID at start
+    r'(\d{10})',  # 10-digit phone number anywhere
+)]
+
+# Category presence lookup patterns (group 1 = the category phrase)
+PRESENCE_PATTERNS = [re.compile(p) for p in (
+    r'does\s+(?:he|she|customer|they)\s+(?:spend|pay|have)\s+(?:on|for)?\s*(.+?)(?:\?|$)',
+    r'(?:is|are)\s+there\s+(?:any)?\s*(.+?)\s+(?:transactions?|expenses?|spending|activity)',
+    r'does\s+(?:he|she|customer|they)\s+receive\s+(.+?)(?:\?|$)',
+    r'any\s+(.+?)\s+(?:activity|transactions?|spending|expenses?)',
+    r'check\s+(?:for)?\s*(.+?)\s+(?:transactions?|presence)',
+)]
+PRESENCE_SUFFIX_RE = re.compile(r'\s+(transactions?|expenses?|spending|activity).*$')
+
+DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+DATE_VALID_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Fallback intent keyword rules, highest priority first (most specific first).
+# A rule matches when the query contains a keyword from every one of its groups.
+INTENT_KEYWORD_RULES = [
+    # Bureau chat intents (checked before bureau_report to avoid catch-all)
+    (IntentType.BUREAU_CREDIT_CARDS, (("credit card util", "credit card count", "any credit card", "has credit card", "have credit card"),)),
+    (IntentType.BUREAU_DELINQUENCY, (("delinquen", "dpd", "overdue", "default", "is any loan"),)),
+    (IntentType.BUREAU_LOAN_COUNT, (("how many",), ("loan", "tradeline", "pl", "hl", "bl"))),
+    (IntentType.BUREAU_OVERVIEW, (("bureau summary", "bureau overview", "tradeline summary", "tradeline overview", "bureau detail", "what does the bureau"),)),
+    # Combined report (must check before individual report intents)
+    (IntentType.COMBINED_REPORT, (("combined report", "merged report", "both report", "complete combined", "merge report"),)),
+    # Report intents (bureau report — full PDF generation)
+    (IntentType.BUREAU_REPORT, (("bureau report", "cibil report", "tradeline report", "credit bureau"),)),
+    (IntentType.CUSTOMER_REPORT, (("full report", "customer report", "comprehensive report", "complete report", "generate report", "create report", "make report", "report for", "generate a report", "pdf report"),)),
+    (IntentType.LENDER_PROFILE, (("lender", "creditworth", "lending", "loan", "credit profile", "underwriting"),)),
+    (IntentType.ANOMALY_DETECTION, (("anomal", "spike", "unusual", "outlier", "irregular"),)),
+    (IntentType.BALANCE_TREND, (("balance trend", "running balance", "balance over time"),)),
+    (IntentType.INCOME_STABILITY, (("income stability", "salary regularity", "income consistent"),)),
+    (IntentType.CASH_FLOW, (("cash flow", "inflow", "outflow"),)),
+    (IntentType.CREDIT_ANALYSIS, (("credit analysis", "credit stats", "income analysis", "max credit"),)),
+    (IntentType.DEBIT_ANALYSIS, (("debit analysis", "spending analysis", "expense analysis"),)),
+    (IntentType.TRANSACTION_STATISTICS, (("transaction count", "how many transaction", "transaction stats"),)),
+    # Existing intents
+    (IntentType.ALL_CATEGORIES_SPENDING, (("all categories", "spending by category", "category breakdown", "spend by category"),)),
+    (IntentType.COMPARE_CATEGORIES, (("compare",), ("categor",))),
+    (IntentType.TOP_CATEGORIES, (("top",), ("categor",))),
+    (IntentType.TOTAL_SPENDING, (("total spending", "spend in total", "total expense"),)),
+    (IntentType.TOTAL_INCOME, (("total income", "total credit", "how much earned"),)),
+    (IntentType.FINANCIAL_OVERVIEW, (("overview", "summary"),)),
+    (IntentType.LIST_CUSTOMERS, (("list customer", "all customer"),)),
+    (IntentType.LIST_CATEGORIES, (("list categor", "all categor"),)),
+]
+
+# Single-group rules are found in one scan: one named group per rule, ordered
+# by priority, inside a lookahead so every start position is tried (a plain
+# alternation would stop at the leftmost hit and could hide a higher-priority
+# keyword overlapping it)
+INTENT_RE = re.compile("(?=" + "|".join(
+    f"(?P<r{i}>" + "|".join(map(re.escape, groups[0])) + ")"
+    for i, (_, groups) in enumerate(INTENT_KEYWORD_RULES) if len(groups) == 1
+) + ")")
+GROUP_TO_RULE = {f"r{i}": i for i in range(len(INTENT_KEYWORD_RULES))}
+
+# With pyahocorasick, the same single-group keywords go into an automaton
+# (value: best rule index for that keyword), which reports every occurrence
+if AHOCORASICK_AVAILABLE:
+    _INTENT_AC = ahocorasick.Automaton()
+    for _rule, (_, _groups) in reversed(list(enumerate(INTENT_KEYWORD_RULES))):
+        if len(_groups) == 1:
+            for _kw in _groups[0]:
+                _INTENT_AC.add_word(_kw, _rule)
+    _INTENT_AC.make_automaton()
+
+
+def _scan_keyword_rules(query_lower: str):
+    """Yield the rule index of single-group keyword hits in one pass."""
+    if AHOCORASICK_AVAILABLE:
+        for _, rule in _INTENT_AC.iter(query_lower):
+            yield rule
+    else:
+        for match in INTENT_RE.finditer(query_lower):
+            yield GROUP_TO_RULE[match.lastgroup]
+
+# Conjunctive rules are checked directly, only when they outrank the scan's hit
+_CONJUNCTIVE_RULES = [
+    (i, intent, groups) for i, (intent, groups) in enumerate(INTENT_KEYWORD_RULES) if len(groups) > 1
+]
+
+
+def _match_intent_keywords(query_lower: str) -> IntentType:
+    """Return the highest-priority keyword rule intent for a query (or UNKNOWN)."""
+    best = min(_scan_keyword_rules(query_lower), default=len(INTENT_KEYWORD_RULES))
+
+    for rule, intent, groups in _CONJUNCTIVE_RULES:
+        if rule >= best:
+            break
+        if all(any(kw in query_lower for kw in group) for group in groups):
+            return intent
+
+    return INTENT_KEYWORD_RULES[best][0] if best < len(INTENT_KEYWORD_RULES) else IntentType.UNKNOWN
+
+
+def _keyword_rule_hits(query_lower: str) -> Set[int]:
+    """Indices of all keyword rules that match a query."""
+    hits = set(_scan_keyword_rules(query_lower))
+    for rule, _, groups in _CONJUNCTIVE_RULES:
+        if all(any(kw in query_lower for kw in group) for group in groups):
+            hits.add(rule)
+    return hits
 
 
+# Full-report intents whose keywords are specific enough to skip the LLM
+# when they are the only rules matched and a customer ID is present (their
+# relative priority - combined > bureau > customer - is the fallback's)
+FAST_PATH_INTENTS = frozenset({
+    IntentType.COMBINED_REPORT,
+    IntentType.BUREAU_REPORT,
+    IntentType.CUSTOMER_REPORT,
+})
+_FAST_PATH_RULES = frozenset(
+    i for i, (intent, _) in enumerate(INTENT_KEYWORD_RULES) if intent in FAST_PATH_INTENTS
+)
+
+
+def _match_customer_id(query_lower: str) -> Optional[re.Match]:
+    """Return the first customer ID match in a lowercased query, if any."""
+    for pattern in CUST_PATTERNS:
+        match = pattern.search(query_lower)
+        if match:
+            return match
+    return None
+
+
+# =============================================================================
+# PARSE CACHE
+# =============================================================================
+# The parser LLM is deterministic (temperature=0, fixed seed), so queries that
+# differ only in the customer ID parse the same way. Entries are keyed on the
+# canonical query (lowercased, whitespace collapsed, customer ID masked) and
+# the real customer_id / raw_query are put back on a hit.
+#
+# Near-duplicates (punctuation, repeated words, small reorderings) are found
+# through word uni/bigram shingles: a fuzzy hit needs the same set of words,
+# the same numeric tokens in the same order (so swapped dates or amounts never
+# match) and cosine similarity >= PARSER_CACHE_SIMILARITY.
+
+_ID_TOKEN = "<id>"
+_TOKEN_RE = re.compile(r"<id>|\w+")
+
+# (model, canonical) -> (parsed intent, customer ID was masked, (words, shingles, norm))
+_PARSE_CACHE: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+# (model, (word set, ordered numeric tokens)) -> canonical queries with exactly those words
+_PARSE_BY_WORDS: Dict[Tuple[str, Tuple[frozenset, Tuple[str, ...]]], Set[str]] = {}
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Disk level (diskcache, opened on first use): exact hits only, stored as
+# (ParsedIntent fields, masked); keys include a digest of the system prompt
+_DISK_CACHE = None
+_DISK_CACHE_LOCK = threading.Lock()
+_PROMPT_DIGEST = hashlib.blake2b(
+    f"{_ACTIVE_SYSTEM_PROMPT}|{PARSER_EXAMPLES_TOP_K}".encode("utf-8"), digest_size=8
+).hexdigest()
+
+
+def _canonical_query(query: str) -> Tuple[str, Optional[int]]:
+    """Canonicalize a query for the parse cache.
+
+    Returns:
+        (canonical query, customer ID masked out of it or None)
+    """
+    text = " ".join(query.lower().split())
+    match = _match_customer_id(text)
+    if match is None:
+        return text, None
+    start, end = match.span(1)
+    return text[:start] + _ID_TOKEN + text[end:], int(match.group(1))
+
+
+def _shingles(canonical: str) -> Tuple[Tuple[frozenset, Tuple[str, ...]], Counter, float]:
+    """Word key, uni+bigram counts and vector norm for a canonical query.
+
+    The word key is the word set plus the numeric tokens in query order;
+    fuzzy matches are only considered between queries with equal keys.
+    """
+    tokens = _TOKEN_RE.findall(canonical)
+    counts = Counter(tokens)
+    counts.update(zip(tokens, tokens[1:]))
+    norm = math.sqrt(sum(v * v for v in counts.values()))
+    numbers = tuple(t for t in tokens if any(c.isdigit() for c in t))
+    return (frozenset(tokens), numbers), counts, norm
+
+
+def _drop_parse(key: Tuple[str, str]) -> None:
+    """Remove a cache entry and its word index slot. Caller holds the lock."""
+    entry = _PARSE_CACHE.pop(key, None)
+    if entry is None:
+        return
+    model, canonical = key
+    words_key = (model, entry[2][0])
+    bucket = _PARSE_BY_WORDS.get(words_key)
+    if bucket is not None:
+        bucket.discard(canonical)
+        if not bucket:
+            del _PARSE_BY_WORDS[words_key]
+
+
+def _get_disk_cache():
+    """Open the disk parse cache on first use (None if unavailable/disabled)."""
+    global _DISK_CACHE
+    if not (PARSER_DISK_CACHE_ENABLED and DISKCACHE_AVAILABLE):
+        return None
+    if _DISK_CACHE is None:
+        with _DISK_CACHE_LOCK:
+            if _DISK_CACHE is None:
+                try:
+                    _DISK_CACHE = Cache(PARSER_DISK_CACHE_DIR, size_limit=PARSER_DISK_CACHE_SIZE_LIMIT)
+                except Exception as e:
+                    logger.warning("Parser disk cache unavailable at %s: %s", PARSER_DISK_CACHE_DIR, e)
+                    _DISK_CACHE = False
+    # Compare to False explicitly: an empty Cache is falsy (it has __len__)
+    return None if _DISK_CACHE is False else _DISK_CACHE
+
+
+def _disk_key(model: str, canonical: str) -> str:
+    return f"{model}|{_PROMPT_DIGEST}|{canonical}"
+
+
+def _parse_cache_get(model: str, canonical: str) -> Optional[tuple]:
+    """Memory (exact, then near-duplicate), then disk (exact) lookup."""
+    entry = _memory_cache_get(model, canonical)
+    if entry is not None:
+        return entry
+
+    disk = _get_disk_cache()
+    if disk is None:
+        return None
+    try:
+        stored = disk.get(_disk_key(model, canonical))
+    except Exception as e:
+        logger.warning("Parser disk cache read failed: %s", e)
+        return None
+    if stored is None:
+        return None
+    fields, masked = stored
+    parsed = ParsedIntent(**fields)
+    _parse_cache_put(model, canonical, parsed, masked, persist=False)
+    return parsed, masked, None
+
+
+def _memory_cache_get(model: str, canonical: str) -> Optional[tuple]:
+    """Exact lookup first, then near-duplicate lookup among same-word entries."""
+    key = (model, canonical)
+    with _PARSE_CACHE_LOCK:
+        entry = _PARSE_CACHE.get(key)
+        if entry is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return entry
+
+        words, counts, norm = _shingles(canonical)
+        best_key, best_sim = None, PARSER_CACHE_SIMILARITY
+        for other in _PARSE_BY_WORDS.get((model, words), ()):
+            _, other_counts, other_norm = _PARSE_CACHE[(model, other)][2]
+            dot = sum(n * other_counts[t] for t, n in counts.items())
+            sim = dot / (norm * other_norm) if norm and other_norm else 0.0
+            if sim >= best_sim:
+                best_key, best_sim = (model, other), sim
+        if best_key is None:
+            return None
+        _PARSE_CACHE.move_to_end(best_key)
+        return _PARSE_CACHE[best_key]
+
+
+def _parse_cache_put(
+    model: str, canonical: str, parsed: ParsedIntent, masked: bool, persist: bool = True
+) -> None:
+    """Store a parse, evicting the least recently used entry when full.
+
+    Args:
+        persist: Also write the entry to the disk cache (if enabled)
+    """
+    key = (model, canonical)
+    shingles = _shingles(canonical)
+    with _PARSE_CACHE_LOCK:
+        _drop_parse(key)
+        _PARSE_CACHE[key] = (parsed, masked, shingles)
+        _PARSE_BY_WORDS.setdefault((model, shingles[0]), set()).add(canonical)
+        while len(_PARSE_CACHE) > PARSER_CACHE_SIZE:
+            _drop_parse(next(iter(_PARSE_CACHE)))
+
+    disk = _get_disk_cache() if persist else None
+    if disk is not None:
+        try:
+            disk.set(_disk_key(model, canonical), (parsed.model_dump(), masked), expire=PARSER_DISK_CACHE_TTL_SEC)
+        except Exception as e:
+            logger.warning("Parser disk cache write failed: %s", e)
+
+
+def clear_parse_cache(include_disk: bool = False) -> None:
+    """Clear the in-memory intent parse cache (and the disk cache if asked)."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+        _PARSE_BY_WORDS.clear()
+    if include_disk:
+        disk = _get_disk_cache()
+        if disk is not None:
+            disk.clear()
+
+
+def _closest_match(value: str, choices: List[str], cutoff: float) -> Optional[str]:
+    """Best fuzzy match for ``value`` with similarity >= cutoff (0-1), or None.
+
+    Uses rapidfuzz (C++) when installed, else difflib.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        match = process.extractOne(value, choices, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return match[0] if match else None
+    matches = get_close_matches(value, choices, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+
+@lru_cache(maxsize=1024)
 def normalize_category_name(category: str) -> str | None:
-    """Normalize category name using case-insensitive matching."""
+    """Normalize category name using case-insensitive matching (memoized;
+    the LLM repeats a small set of spellings, so fuzzy matching runs once each)."""
     if not category:
         return None
 
     category_lower = category.lower().strip()
-    category_map = {cat.lower(): cat for cat in VALID_CATEGORIES}
 
-    if category_lower in category_map:
-        return category_map[category_lower]
+    if category_lower in _CATEGORY_MAP:
+        return _CATEGORY_MAP[category_lower]
 
     # Fuzzy matching for typos
-    matches = get_close_matches(category_lower, list(category_map.keys()), n=1, cutoff=0.7)
-    if matches:
-        return category_map[matches[0]]
+    match = _closest_match(category_lower, _CATEGORY_KEYS, 0.7)
+    if match:
+        return _CATEGORY_MAP[match]
 
     return None
 
 
+@lru_cache(maxsize=1024)
 def validate_intent_name(intent_str: str) -> IntentType:
-    """Validate and normalize intent string to IntentType enum."""
+    """Validate and normalize intent string to IntentType enum (memoized)."""
     if not intent_str:
         return IntentType.UNKNOWN
 
@@ -167,10 +671,10 @@ def validate_intent_name(intent_str: str) -> IntentType:
         return IntentType(intent_lower)
     except ValueError:
         # Fuzzy match for typos
-        matches = get_close_matches(intent_lower, VALID_INTENTS, n=1, cutoff=0.6)
-        if matches:
+        match = _closest_match(intent_lower, VALID_INTENTS, 0.6)
+        if match:
             try:
-                return IntentType(matches[0])
+                return IntentType(match)
             except ValueError:
                 pass
         return IntentType.UNKNOWN
@@ -202,40 +706,129 @@ def calculate_confidence(parsed: dict, query: str) -> float:
     # Date extraction quality
     if parsed.get("start_date") and parsed.get("end_date"):
         # Check format validity
-        date_pattern = r"^\d{4}-\d{2}-\d{2}$"
-        if re.match(date_pattern, parsed["start_date"]) and re.match(date_pattern, parsed["end_date"]):
+        if DATE_VALID_RE.match(parsed["start_date"]) and DATE_VALID_RE.match(parsed["end_date"]):
             score += 0.1
 
     return min(max(score, 0.0), 1.0)
 
 
+# JSON schema for Ollama's structured output (format=<schema>, Ollama >= 0.5).
+# Decoding is grammar-constrained: output is always valid JSON, the intent is
+# one of the IntentType values, and optional fields can simply be omitted.
+_NULLABLE_STR = {"type": ["string", "null"]}
+INTENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {"type": "string", "enum": [t.value for t in IntentType]},
+        "customer_id": {"type": ["integer", "null"]},
+        "category": _NULLABLE_STR,
+        "categories": {"type": ["array", "null"], "items": {"type": "string"}},
+        "start_date": _NULLABLE_STR,
+        "end_date": _NULLABLE_STR,
+        "top_n": {"type": "integer"},
+        "threshold_std": {"type": "number"},
+    },
+    "required": ["intent"],
+}
+
+
+@lru_cache(maxsize=4)
+def _get_llm(model_name: str) -> ChatOllama:
+    """One ChatOllama client per model, shared by every IntentParser so its
+    HTTP connection pool is reused (the app builds parsers per session)."""
+    return ChatOllama(
+        model=model_name, temperature=0, seed=42,
+        format=INTENT_SCHEMA if PARSER_JSON_SCHEMA else "json",
+        keep_alive=PARSER_KEEP_ALIVE, num_ctx=PARSER_NUM_CTX,
+    )
+
+
 class IntentParser:
     def __init__(self, model_name: str = PARSER_MODEL):
-        self.llm = ChatOllama(model=model_name, temperature=0, format="json", seed=42)
+        self.model_name = model_name
+        self.llm = _get_llm(model_name)
+        self._system_message = SystemMessage(content=_ACTIVE_SYSTEM_PROMPT)
+        # query -> in-flight ainvoke future (parse_async single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def parse(self, query: str) -> ParsedIntent:
-        prompt = PARSER_PROMPT.format(query=query)
+        parsed = self._parse_without_llm(query)
+        if parsed is not None:
+            return parsed
 
         try:
-            response = self.llm.invoke(prompt)
-            content = response.content.strip()
+            response = self.llm.invoke(self._messages(query))
+        except Exception as e:
+            print(f"Parse error: {e}")
+            return ParsedIntent(intent=IntentType.UNKNOWN, raw_query=query, confidence=0.0)
+        return self._parse_response(query, response.content)
+
+    async def parse_async(self, query: str) -> ParsedIntent:
+        """
+        Async variant of parse().
+
+        Keeps the event loop free during the Ollama call. Concurrent calls
+        for the same query share one in-flight LLM request.
+        """
+        parsed = self._parse_without_llm(query)
+        if parsed is not None:
+            return parsed
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(query)
+        if pending is None or pending.get_loop() is not loop:
+            pending = asyncio.ensure_future(self.llm.ainvoke(self._messages(query)))
+            self._inflight[query] = pending
+            pending.add_done_callback(lambda done: self._forget_inflight(query, done))
 
-            # With format="json", output should be clean JSON
-            data = json.loads(content)
+        try:
+            # shield: one caller being cancelled must not cancel the others
+            response = await asyncio.shield(pending)
+        except Exception as e:
+            print(f"Parse error: {e}")
+            return ParsedIntent(intent=IntentType.UNKNOWN, raw_query=query, confidence=0.0)
+        return self._parse_response(query, response.content)
+
+    def _forget_inflight(self, query: str, done: "asyncio.Future") -> None:
+        if self._inflight.get(query) is done:
+            del self._inflight[query]
+
+    def _messages(self, query: str) -> list:
+        return [self._system_message, HumanMessage(content=_human_content(query))]
+
+    def _parse_without_llm(self, query: str) -> ParsedIntent | None:
+        """Answer from the rule-based fast path or the parse cache, if possible."""
+        if PARSER_FAST_PATH_ENABLED:
+            fast = self._fast_parse(query)
+            if fast is not None:
+                return fast
+
+        if PARSER_CACHE_ENABLED:
+            canonical, query_customer_id = _canonical_query(query)
+            cached = _parse_cache_get(self.model_name, canonical)
+            if cached is not None:
+                parsed, masked, _ = cached
+                update = {"raw_query": query}
+                if masked:
+                    update["customer_id"] = query_customer_id
+                return parsed.model_copy(update=update, deep=True)
+        return None
+
+    def _parse_response(self, query: str, raw: str) -> ParsedIntent:
+        """Validate and normalize the LLM's JSON into a ParsedIntent (and cache it)."""
+        try:
+            content = raw.strip()
+
+            # With format=<schema>/"json", output should be clean JSON
+            data = _json_loads(content)
 
             # Validate and normalize intent
             intent_str = data.get("intent", "unknown")
             data["intent"] = validate_intent_name(intent_str)
 
             # Normalize category if present
-            # Skip normalization for intents that use category for non-transaction purposes
-            _skip_category_norm = {
-                IntentType.CATEGORY_PRESENCE_LOOKUP,
-                IntentType.BUREAU_LOAN_COUNT,
-                IntentType.BUREAU_DELINQUENCY,
-            }
             if data.get("category"):
-                if data["intent"] not in _skip_category_norm:
+                if data["intent"] not in _SKIP_CATEGORY_NORM:
                     normalized = normalize_category_name(data["category"])
                     data["category"] = normalized  # May be None if invalid
                 # else: keep category as-is (loan type or category resolver handles it)
@@ -257,65 +850,79 @@ class IntentParser:
             query_lower = query.lower()
             if (data["intent"] == IntentType.SPENDING_BY_CATEGORY and
                 not data.get("category") and
-                any(kw in query_lower for kw in ["total spending", "total expense", "spend in total"])):
+                any(kw in query_lower for kw in _TOTAL_SPENDING_KEYWORDS)):
                 # Correct misclassification: "total spending" should be TOTAL_SPENDING, not SPENDING_BY_CATEGORY
                 data["intent"] = IntentType.TOTAL_SPENDING
                 data["confidence"] = min(data["confidence"] + 0.1, 1.0)  # Boost confidence for correction
 
             # Clean up null string values
-            for key in ["category", "start_date", "end_date"]:
-                if data.get(key) in ["null", "None", ""]:
+            for key in _NULLABLE_FIELDS:
+                value = data.get(key)
+                if isinstance(value, str) and value in _NULL_STRINGS:
                     data[key] = None
 
-            return ParsedIntent(**data)
+            parsed = ParsedIntent(**data)
+            # Only cache when the masked ID is the one the LLM extracted;
+            # otherwise re-injecting another customer's ID would be wrong.
+            # A copy is cached: callers mutate the returned intent (e.g. the
+            # session's active customer ID), which must not leak into the cache
+            if PARSER_CACHE_ENABLED:
+                canonical, query_customer_id = _canonical_query(query)
+                if query_customer_id is None or parsed.customer_id == query_customer_id:
+                    _parse_cache_put(
+                        self.model_name, canonical, parsed.model_copy(deep=True),
+                        query_customer_id is not None,
+                    )
+            return parsed
 
         except json.JSONDecodeError as e:
             print(f"JSON parse error: {e}")
-            print(f"Raw: {response.content[:300]}")
+            print(f"Raw: {raw[:300]}")
             return self._fallback_parse(query)
         except Exception as e:
             print(f"Parse error: {e}")
             return ParsedIntent(intent=IntentType.UNKNOWN, raw_query=query, confidence=0.0)
 
+    def _fast_parse(self, query: str) -> ParsedIntent | None:
+        """Rule-based parse for template-like report requests, skipping the LLM.
+
+        Returns None (use the LLM) unless only full-report keywords match, a
+        customer ID is found, and the query has no presence phrasing,
+        category or dates that the LLM would need to extract.
+        """
+        query_lower = query.lower()
+        hits = _keyword_rule_hits(query_lower)
+        if not hits or not hits <= _FAST_PATH_RULES:
+            return None
+        match = _match_customer_id(query_lower)
+        if match is None:
+            return None
+        if (any(p.search(query_lower) for p in PRESENCE_PATTERNS)
+                or _find_categories(query_lower) or DATE_RE.search(query)):
+            return None
+
+        data = {
+            "intent": INTENT_KEYWORD_RULES[min(hits)][0],
+            "customer_id": int(match.group(1)),
+        }
+        data["confidence"] = calculate_confidence(data, query)
+        return ParsedIntent(**data, raw_query=query)
+
     def _fallback_parse(self, query: str) -> ParsedIntent:
         """Enhanced regex fallback when LLM JSON fails."""
         query_lower = query.lower()
 
         # Extract customer ID (multiple patterns)
-        customer_id = None
-        cust_patterns = [
-            r'customer\s*[#:]?\s*(\d+)',
-            r'cust(?:omer)?[_\s]?id\s*[=:]?\s*(\d+)',
-            r'for\s+customer\s+(\d+)',
-            r'for\s+(\d{10})',  # 10-digit phone number
-            r'for\s+(\d+)',
-            r'^(\d+)\s',  # ID at start
-            r'(\d{10})',  # 10-digit phone number anywhere
-        ]
-        for pattern in cust_patterns:
-            match = re.search(pattern, query_lower)
-            if match:
-                customer_id = int(match.group(1))
-                break
-
-        # Detect intent with priority ordering (most specific first)
-        intent = IntentType.UNKNOWN
+        match = _match_customer_id(query_lower)
+        customer_id = int(match.group(1)) if match else None
 
         # Category presence lookup patterns (check first - high priority)
-        presence_patterns = [
-            (r'does\s+(?:he|she|customer|they)\s+(?:spend|pay|have)\s+(?:on|for)?\s*(.+?)(?:\?|$)', True),
-            (r'(?:is|are)\s+there\s+(?:any)?\s*(.+?)\s+(?:transactions?|expenses?|spending|activity)', True),
-            (r'does\s+(?:he|she|customer|they)\s+receive\s+(.+?)(?:\?|$)', True),
-            (r'any\s+(.+?)\s+(?:activity|transactions?|spending|expenses?)', True),
-            (r'check\s+(?:for)?\s*(.+?)\s+(?:transactions?|presence)', True),
-        ]
-
-        for pattern, _ in presence_patterns:
-            match = re.search(pattern, query_lower)
+        for pattern in PRESENCE_PATTERNS:
+            match = pattern.search(query_lower)
             if match:
                 extracted_category = match.group(1).strip()
                 # Clean up extracted category
-                extracted_category = re.sub(r'\s+(transactions?|expenses?|spending|activity).*$', '', extracted_category)
+                extracted_category = PRESENCE_SUFFIX_RE.sub('', extracted_category)
                 # Try to resolve to known category via alias
                 from config.category_loader import resolve_category_alias
                 resolved = resolve_category_alias(extracted_category)
@@ -327,66 +934,11 @@ class IntentParser:
                     confidence=0.75
                 )
 
-        # Bureau chat intents (checked before bureau_report to avoid catch-all)
-        if any(kw in query_lower for kw in ["credit card util", "credit card count", "any credit card", "has credit card", "have credit card"]):
-            intent = IntentType.BUREAU_CREDIT_CARDS
-        elif any(kw in query_lower for kw in ["delinquen", "dpd", "overdue", "default", "is any loan"]):
-            intent = IntentType.BUREAU_DELINQUENCY
-        elif any(kw in query_lower for kw in ["how many"]) and any(kw in query_lower for kw in ["loan", "tradeline", "pl", "hl", "bl"]):
-            intent = IntentType.BUREAU_LOAN_COUNT
-        elif any(kw in query_lower for kw in ["bureau summary", "bureau overview", "tradeline summary", "tradeline overview", "bureau detail", "what does the bureau"]):
-            intent = IntentType.BUREAU_OVERVIEW
-
-        # Combined report (must check before individual report intents)
-        elif any(kw in query_lower for kw in ["combined report", "merged report", "both report", "complete combined", "merge report"]):
-            intent = IntentType.COMBINED_REPORT
-
-        # Report intents (bureau report — full PDF generation)
-        elif any(kw in query_lower for kw in ["bureau report", "cibil report", "tradeline report", "credit bureau"]):
-            intent = IntentType.BUREAU_REPORT
-        elif any(kw in query_lower for kw in ["full report", "customer report", "comprehensive report", "complete report", "generate report", "create report", "make report", "report for", "generate a report", "pdf report"]):
-            intent = IntentType.CUSTOMER_REPORT
-        elif any(kw in query_lower for kw in ["lender", "creditworth", "lending", "loan", "credit profile", "underwriting"]):
-            intent = IntentType.LENDER_PROFILE
-        elif any(kw in query_lower for kw in ["anomal", "spike", "unusual", "outlier", "irregular"]):
-            intent = IntentType.ANOMALY_DETECTION
-        elif any(kw in query_lower for kw in ["balance trend", "running balance", "balance over time"]):
-            intent = IntentType.BALANCE_TREND
-        elif any(kw in query_lower for kw in ["income stability", "salary regularity", "income consistent"]):
-            intent = IntentType.INCOME_STABILITY
-        elif any(kw in query_lower for kw in ["cash flow", "inflow", "outflow"]):
-            intent = IntentType.CASH_FLOW
-        elif any(kw in query_lower for kw in ["credit analysis", "credit stats", "income analysis", "max credit"]):
-            intent = IntentType.CREDIT_ANALYSIS
-        elif any(kw in query_lower for kw in ["debit analysis", "spending analysis", "expense analysis"]):
-            intent = IntentType.DEBIT_ANALYSIS
-        elif any(kw in query_lower for kw in ["transaction count", "how many transaction", "transaction stats"]):
-            intent = IntentType.TRANSACTION_STATISTICS
-
-        # Existing intents
-        elif any(kw in query_lower for kw in ["all categories", "spending by category", "category breakdown", "spend by category"]):
-            intent = IntentType.ALL_CATEGORIES_SPENDING
-        elif "compare" in query_lower and "categor" in query_lower:
-            intent = IntentType.COMPARE_CATEGORIES
-        elif "top" in query_lower and "categor" in query_lower:
-            intent = IntentType.TOP_CATEGORIES
-        elif any(kw in query_lower for kw in ["total spending", "spend in total", "total expense"]):
-            intent = IntentType.TOTAL_SPENDING
-        elif any(kw in query_lower for kw in ["total income", "total credit", "how much earned"]):
-            intent = IntentType.TOTAL_INCOME
-        elif "overview" in query_lower or "summary" in query_lower:
-            intent = IntentType.FINANCIAL_OVERVIEW
-        elif "list customer" in query_lower or "all customer" in query_lower:
-            intent = IntentType.LIST_CUSTOMERS
-        elif "list categor" in query_lower or "all categor" in query_lower:
-            intent = IntentType.LIST_CATEGORIES
-
-        # Extract category (single)
-        category = None
-        for cat in VALID_CATEGORIES:
-            if cat.lower() in query_lower:
-                category = cat
-                break
+        intent = _match_intent_keywords(query_lower)
+
+        # Extract categories (whole words, in VALID_CATEGORIES order)
+        found_cats = _find_categories(query_lower)
+        category = found_cats[0] if found_cats else None
 
         # Check for category-specific spending
         if category and intent == IntentType.UNKNOWN:
@@ -395,10 +947,6 @@ class IntentParser:
         # Extract multiple categories for comparison
         categories = None
         if intent == IntentType.COMPARE_CATEGORIES or ("vs" in query_lower or "versus" in query_lower or "compare" in query_lower):
-            found_cats = []
-            for cat in VALID_CATEGORIES:
-                if cat.lower() in query_lower:
-                    found_cats.append(cat)
             if len(found_cats) >= 2:
                 categories = found_cats
                 intent = IntentType.COMPARE_CATEGORIES
@@ -406,8 +954,7 @@ class IntentParser:
         # Extract dates
         start_date = None
         end_date = None
-        date_pattern = r'(\d{4}-\d{2}-\d{2})'
-        dates = re.findall(date_pattern, query)
+        dates = DATE_RE.findall(query)
         if len(dates) >= 2:
             start_date = dates[0]
             end_date = dates[1]
@@ -7,8 +7,20 @@ Each finding is severity-tagged for rendering.
 NO LLM calls - purely threshold-based deterministic logic.
 """
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from collections import namedtuple
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from schemas.loan_type import LoanType, get_loan_type_display_name
 from features.bureau_features import BureauLoanFeatureVector
@@ -17,13 +29,24 @@ from pipeline.bureau_feature_aggregator import BureauExecutiveSummaryInputs
 from utils.helpers import format_inr
 
 
-@dataclass
+# Sort rank per severity: high_risk > moderate_risk > concern > neutral > positive
+_SEVERITY_ORDER = {"high_risk": 0, "moderate_risk": 1, "concern": 2, "neutral": 3, "positive": 4}
+
+
+@dataclass(slots=True, frozen=True)
 class KeyFinding:
     """A single key finding with inference."""
     category: str       # Feature group (e.g., "Portfolio", "DPD & Delinquency")
     finding: str        # Factual observation
     inference: str      # Risk/positive interpretation
     severity: str       # "high_risk", "moderate_risk", "concern", "positive", "neutral"
+    _severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_severity_rank", _SEVERITY_ORDER.get(self.severity, 3))
+
+
+_BY_SEVERITY = attrgetter("_severity_rank")
 
 
 def _timeline_str(vec: BureauLoanFeatureVector) -> str:
@@ -41,6 +64,247 @@ def _timeline_str(vec: BureauLoanFeatureVector) -> str:
     return " | ".join(parts)
 
 
+# DPD severity ladders: (exclusive lower bound, severity, finding template,
+# inference template), checked in order. Templates take label/dpd/tl.
+_PORTFOLIO_DPD_BUCKETS = (
+    (90, "high_risk",
+     "Active delinquency detected with Max DPD of {dpd} days{tl}",
+     "Severe delinquency indicates significant repayment stress; loan may be classified as NPA"),
+    (30, "moderate_risk",
+     "Active delinquency detected with Max DPD of {dpd} days{tl}",
+     "Significant past-due status suggests repayment difficulty; close monitoring required"),
+    (0, "concern",
+     "Minor delinquency detected with Max DPD of {dpd} days{tl}",
+     "Early-stage past-due status; may reflect temporary cash flow mismatch"),
+)
+_LOAN_TYPE_DPD_BUCKETS = (
+    (90, "high_risk",
+     "{label}: Delinquent with Max DPD of {dpd} days{tl}",
+     "Severe delinquency on {label} account; may indicate deep financial distress"),
+    (30, "moderate_risk",
+     "{label}: Delinquent with Max DPD of {dpd} days{tl}",
+     "Significant past-due on {label}; repayment discipline is compromised"),
+)
+_TRADELINE_DPD_BUCKETS = (
+    (90, "high_risk",
+     "Max DPD for {label}: {dpd} days{tl}",
+     "Severe delinquency on {label} — strong negative indicator"),
+    (30, "moderate_risk",
+     "Max DPD for {label}: {dpd} days{tl}",
+     "Significant past-due on {label}; repayment under stress"),
+    (0, "concern",
+     "Max DPD for {label}: {dpd} days{tl}",
+     "Minor past-due on {label}; may be a temporary delay"),
+)
+# Tradeline DPD fields: (attribute, label, short label, LoanType for timeline lookup)
+_DPD_FIELD_MAP = (
+    ("max_dpd_6m_cc", "Credit Card (6M)", "CC 6M", LoanType.CC),
+    ("max_dpd_6m_pl", "Personal Loan (6M)", "PL 6M", LoanType.PL),
+    ("max_dpd_9m_cc", "Credit Card (9M)", "CC 9M", LoanType.CC),
+)
+
+_OVERDUE_INFERENCE_TPL = "Active overdue balance on {label} indicates unresolved payment obligation"
+_FORCED_EVENT_INFERENCE_TPL = "Adverse credit events on {label} are strong negative signals for creditworthiness"
+
+
+def _bucket_codes_loop(values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Scalar bucket loop, compiled with numba when it is installed."""
+    out = np.full(values.shape[0], -1, dtype=np.int8)
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v != v:  # NaN marks a missing feature
+            continue
+        for j in range(thresholds.shape[0]):
+            if v > thresholds[j]:
+                out[i] = j
+                break
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _bucket_codes_loop = njit(cache=True, nogil=True)(_bucket_codes_loop)
+
+
+def _bucket_codes(values, thresholds) -> np.ndarray:
+    """Classify many feature values against a descending threshold ladder.
+
+    Batch counterpart of the scalar ladders: code ``j`` means the value
+    exceeds ``thresholds[j]`` (and no earlier one); -1 means it exceeds none
+    or is missing (NaN).
+
+    Args:
+        values: Feature values, one per customer.
+        thresholds: Exclusive lower bounds, highest first.
+
+    Returns:
+        int8 array of bucket codes aligned with ``values``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _bucket_codes_loop(values, thresholds)
+    codes = np.arange(thresholds.shape[0], dtype=np.int8)
+    return np.select([values > t for t in thresholds], codes, default=-1).astype(np.int8)
+
+
+# Threshold rule shared by the scalar and batch paths. ``predicate`` takes the
+# ``fields`` values and must use only comparisons joined with ``&`` so it
+# works on scalars and on NumPy columns alike. ``finding`` is a str.format
+# template over the same values, plus {pl_tl}/{cc_tl} timeline suffixes.
+_Rule = namedtuple("_Rule", "fields predicate category severity finding inference")
+
+_ACTIVITY_RULES = (
+    _Rule(("new_trades_6m_pl",), lambda n: n >= 3, "Loan Activity", "high_risk",
+          "{0:.0f} new personal loan trades opened in last 6 months{pl_tl}",
+          "Rapid PL acquisition suggests urgent credit need or loan stacking behavior"),
+    _Rule(("new_trades_6m_pl",), lambda n: (n >= 2) & (n < 3), "Loan Activity", "moderate_risk",
+          "{0:.0f} new personal loan trades opened in last 6 months{pl_tl}",
+          "Multiple recent PL acquisitions; monitor for emerging over-leverage"),
+    _Rule(("months_since_last_trade_pl",), lambda m: m < 2, "Loan Activity", "concern",
+          "Last PL trade opened {0:.1f} months ago{pl_tl}",
+          "Very recent PL activity indicates active credit seeking"),
+)
+
+_BEHAVIOR_RULES = (
+    # Payment behavior (the 0% case cross-checks DPD and is handled inline)
+    _Rule(("pct_missed_payments_18m",), lambda m: m > 10, "Payment Behavior", "high_risk",
+          "{0:.1f}% missed payments in last 18 months",
+          "Frequent missed payments indicate chronic repayment stress"),
+    _Rule(("pct_missed_payments_18m",), lambda m: (m > 0) & (m <= 10), "Payment Behavior", "concern",
+          "{0:.1f}% missed payments in last 18 months",
+          "Some missed payments detected; not habitual but warrants attention"),
+    _Rule(("ratio_good_closed_pl",), lambda r: r >= 0.8, "Payment Behavior", "positive",
+          "Good closure ratio for PL loans: {0:.0%}",
+          "Strong track record of closing personal loans in good standing"),
+    _Rule(("ratio_good_closed_pl",), lambda r: r < 0.5, "Payment Behavior", "high_risk",
+          "Good closure ratio for PL loans: {0:.0%}",
+          "Poor PL closure history — majority of closed PLs had issues"),
+    _Rule(("ratio_good_closed_pl",), lambda r: (r >= 0.5) & (r < 0.7), "Payment Behavior", "concern",
+          "Good closure ratio for PL loans: {0:.0%}",
+          "Below-average PL closure quality; some loans closed with problems"),
+    # Utilization (CC utilization is covered by _loan_type_findings)
+    _Rule(("pl_balance_remaining_pct",), lambda p: p > 80, "Utilization", "high_risk",
+          "PL balance remaining: {0:.1f}%",
+          "Most PL sanctioned amount still outstanding; limited principal repayment progress"),
+    _Rule(("pl_balance_remaining_pct",), lambda p: p <= 30, "Utilization", "positive",
+          "PL balance remaining: {0:.1f}%",
+          "Significant PL principal already repaid; good repayment progress"),
+    # Enquiry behavior
+    _Rule(("unsecured_enquiries_12m",), lambda e: e > 15, "Enquiry Behavior", "high_risk",
+          "{0:.0f} unsecured enquiries in last 12 months",
+          "Very high enquiry pressure suggests desperate credit seeking or multiple rejections"),
+    _Rule(("unsecured_enquiries_12m",), lambda e: (e > 10) & (e <= 15), "Enquiry Behavior", "moderate_risk",
+          "{0:.0f} unsecured enquiries in last 12 months",
+          "Elevated enquiry activity; may indicate difficulty securing credit"),
+    _Rule(("unsecured_enquiries_12m",), lambda e: e <= 3, "Enquiry Behavior", "positive",
+          "{0:.0f} unsecured enquiries in last 12 months",
+          "Minimal enquiry activity indicates stable credit position"),
+    _Rule(("trade_to_enquiry_ratio_uns_24m",), lambda t: t < 20, "Enquiry Behavior", "concern",
+          "Trade-to-enquiry ratio (unsecured, 24M): {0:.1f}%",
+          "Low conversion from enquiries to actual loans suggests possible rejections by lenders"),
+    _Rule(("trade_to_enquiry_ratio_uns_24m",), lambda t: t > 50, "Enquiry Behavior", "positive",
+          "Trade-to-enquiry ratio (unsecured, 24M): {0:.1f}%",
+          "High conversion rate indicates strong acceptance by lenders"),
+    # Loan acquisition velocity
+    _Rule(("interpurchase_time_12m_plbl",), lambda i: i < 1, "Loan Velocity", "high_risk",
+          "Avg time between PL/BL acquisitions (12M): {0:.1f} months",
+          "Rapid loan stacking — acquiring unsecured loans faster than monthly; high risk of over-leverage"),
+    _Rule(("interpurchase_time_12m_plbl",), lambda i: (i >= 1) & (i < 2), "Loan Velocity", "concern",
+          "Avg time between PL/BL acquisitions (12M): {0:.1f} months",
+          "Frequent loan acquisitions; borrower is actively accumulating unsecured debt"),
+    _Rule(("interpurchase_time_12m_plbl",), lambda i: i >= 6, "Loan Velocity", "positive",
+          "Avg time between PL/BL acquisitions (12M): {0:.1f} months",
+          "Measured pace of loan acquisitions indicates no urgency or stacking behavior"),
+)
+
+_COMPOSITE_RULES = (
+    # Credit hungry + loan stacking
+    _Rule(("unsecured_enquiries_12m", "new_trades_6m_pl"), lambda e, n: (e > 10) & (n >= 2),
+          "Composite Signal", "high_risk",
+          "High enquiry volume ({0:.0f} in 12M) combined with {1:.0f} new PL trades in 6M{pl_tl}",
+          "Credit hungry behavior with active loan stacking — elevated risk of debt spiral"),
+    # Rapid stacking with low interpurchase time
+    _Rule(("interpurchase_time_12m_plbl", "new_trades_6m_pl"), lambda i, n: (i < 2) & (n >= 2),
+          "Composite Signal", "high_risk",
+          "Avg {0:.1f} months between PL/BL with {1:.0f} new trades in 6M{pl_tl}",
+          "Rapid PL stacking pattern — borrower is accumulating unsecured debt at an accelerating pace"),
+    # High utilization + high outstanding
+    _Rule(("cc_balance_utilization_pct", "pl_balance_remaining_pct"), lambda c, p: (c > 50) & (p > 50),
+          "Composite Signal", "moderate_risk",
+          "CC utilization at {0:.1f}%{cc_tl} and PL balance remaining at {1:.1f}%{pl_tl}",
+          "Elevated leverage across both revolving and term products; limited debt servicing headroom"),
+    # High enquiries + low conversion
+    _Rule(("unsecured_enquiries_12m", "trade_to_enquiry_ratio_uns_24m"), lambda e, t: (e > 10) & (t < 30),
+          "Composite Signal", "moderate_risk",
+          "High enquiries ({0:.0f}) but only {1:.1f}% trade-to-enquiry conversion",
+          "Low conversion rate despite high enquiry volume suggests multiple lender rejections"),
+)
+
+
+def _rule_findings(
+    rules: tuple,
+    tf: TradelineFeatures,
+    pl_tl: str = "",
+    cc_tl: str = "",
+) -> Iterator[KeyFinding]:
+    """Yield a finding for every rule that fires; rules with a None input are skipped."""
+    for rule in rules:
+        values = [getattr(tf, name) for name in rule.fields]
+        if None in values or not rule.predicate(*values):
+            continue
+        yield KeyFinding(
+            category=rule.category,
+            finding=rule.finding.format(*values, pl_tl=pl_tl, cc_tl=cc_tl),
+            inference=rule.inference,
+            severity=rule.severity,
+        )
+
+
+@dataclass(slots=True)
+class _DpdContext:
+    """Tradeline DPD state read once and shared by the tradeline and composite helpers."""
+    values: tuple           # max_dpd_6m_cc, max_dpd_6m_pl, max_dpd_9m_cc
+    clean: bool             # all three present and zero
+    details: List[str]      # "CC 6M: 45 days" per non-zero field
+
+
+def _dpd_context(tf: TradelineFeatures) -> _DpdContext:
+    cc6, pl6, cc9 = values = (tf.max_dpd_6m_cc, tf.max_dpd_6m_pl, tf.max_dpd_9m_cc)
+    return _DpdContext(
+        values=values,
+        # None never equals 0, so this also requires all three to be present
+        clean=cc6 == 0 and pl6 == 0 and cc9 == 0,
+        details=[
+            f"{short}: {val} days"
+            for val, (_, _, short, _) in zip(values, _DPD_FIELD_MAP)
+            if val is not None and val > 0
+        ],
+    )
+
+
+def _dpd_finding(
+    buckets: tuple,
+    category: str,
+    dpd: int,
+    label: str = "",
+    tl_suffix: str = "",
+) -> Optional[KeyFinding]:
+    """Build the finding for the first DPD bucket that ``dpd`` exceeds.
+
+    Returns:
+        KeyFinding, or None when ``dpd`` falls below every bucket.
+    """
+    for threshold, severity, finding_tpl, inference_tpl in buckets:
+        if dpd > threshold:
+            return KeyFinding(
+                category=category,
+                finding=finding_tpl.format(label=label, dpd=dpd, tl=tl_suffix),
+                inference=inference_tpl.format(label=label),
+                severity=severity,
+            )
+    return None
+
+
 def extract_key_findings(
     executive_inputs: BureauExecutiveSummaryInputs,
     feature_vectors: Dict[LoanType, BureauLoanFeatureVector],
@@ -60,524 +324,441 @@ def extract_key_findings(
     Returns:
         List of KeyFinding objects, severity-ordered.
     """
-    findings: List[KeyFinding] = []
-
-    # --- Portfolio-level findings ---
-    findings.extend(_portfolio_findings(executive_inputs, feature_vectors))
-
-    # --- Per-loan-type findings ---
-    findings.extend(_loan_type_findings(feature_vectors))
-
-    # --- Tradeline behavioral findings ---
-    if tradeline_features is not None:
-        findings.extend(_tradeline_findings(tradeline_features, feature_vectors))
-
-    # --- Composite / interaction findings ---
+    # Timelines and display names are reused by several helpers; build once
+    timelines = {lt: _timeline_str(vec) for lt, vec in feature_vectors.items()}
+    tl_suffixes = {lt: f" [{tl}]" for lt, tl in timelines.items() if tl}
+    display_names = {lt: get_loan_type_display_name(lt) for lt in feature_vectors}
+
+    # Helpers are generators; nothing is materialized until the final sort
+    sources = [
+        _portfolio_findings(executive_inputs, feature_vectors, timelines, display_names),
+        _loan_type_findings(feature_vectors, tl_suffixes, display_names),
+    ]
     if tradeline_features is not None:
-        findings.extend(_composite_findings(executive_inputs, tradeline_features, feature_vectors))
-
-    # Sort: high_risk > moderate_risk > concern > neutral > positive
-    severity_order = {"high_risk": 0, "moderate_risk": 1, "concern": 2, "neutral": 3, "positive": 4}
-    findings.sort(key=lambda f: severity_order.get(f.severity, 3))
-
-    return findings
+        dpd = _dpd_context(tradeline_features)
+        sources.append(_tradeline_findings(tradeline_features, tl_suffixes, dpd))
+        sources.append(_composite_findings(executive_inputs, tradeline_features, tl_suffixes, dpd))
+    # sorted() builds the one result list straight from the chained helpers
+    return sorted(chain.from_iterable(sources), key=_BY_SEVERITY)
 
 
 def _portfolio_findings(
     ei: BureauExecutiveSummaryInputs,
     vectors: Dict[LoanType, BureauLoanFeatureVector],
-) -> List[KeyFinding]:
+    timelines: Dict[LoanType, str],
+    display_names: Dict[LoanType, str],
+) -> Iterator[KeyFinding]:
     """Extract findings from portfolio-level data."""
-    findings = []
-
     # Delinquency flag — find timeline of loan type with max DPD
     dpd_timeline = ""
     if ei.max_dpd_loan_type:
-        for lt, vec in vectors.items():
-            if get_loan_type_display_name(lt) == ei.max_dpd_loan_type:
-                tl = _timeline_str(vec)
-                if tl:
-                    dpd_timeline = f" [{ei.max_dpd_loan_type}: {tl}]"
-                break
+        name_to_lt = {name: lt for lt, name in display_names.items()}
+        lt = name_to_lt.get(ei.max_dpd_loan_type)
+        tl = timelines[lt] if lt is not None else ""
+        if tl:
+            dpd_timeline = f" [{ei.max_dpd_loan_type}: {tl}]"
 
     if ei.has_delinquency:
-        if ei.max_dpd is not None and ei.max_dpd > 90:
-            findings.append(KeyFinding(
-                category="Delinquency",
-                finding=f"Active delinquency detected with Max DPD of {ei.max_dpd} days{dpd_timeline}",
-                inference="Severe delinquency indicates significant repayment stress; loan may be classified as NPA",
-                severity="high_risk",
-            ))
-        elif ei.max_dpd is not None and ei.max_dpd > 30:
-            findings.append(KeyFinding(
-                category="Delinquency",
-                finding=f"Active delinquency detected with Max DPD of {ei.max_dpd} days{dpd_timeline}",
-                inference="Significant past-due status suggests repayment difficulty; close monitoring required",
-                severity="moderate_risk",
-            ))
-        elif ei.max_dpd is not None and ei.max_dpd > 0:
-            findings.append(KeyFinding(
-                category="Delinquency",
-                finding=f"Minor delinquency detected with Max DPD of {ei.max_dpd} days{dpd_timeline}",
-                inference="Early-stage past-due status; may reflect temporary cash flow mismatch",
-                severity="concern",
-            ))
+        if ei.max_dpd is not None:
+            finding = _dpd_finding(_PORTFOLIO_DPD_BUCKETS, "Delinquency", ei.max_dpd, tl_suffix=dpd_timeline)
+            if finding is not None:
+                yield finding
     else:
-        findings.append(KeyFinding(
+        yield KeyFinding(
             category="Delinquency",
             finding="No delinquency detected across the portfolio",
             inference="Clean delinquency record is a positive indicator for repayment discipline",
             severity="positive",
-        ))
+        )
 
     # Unsecured sanction proportion
     if ei.total_sanctioned > 0:
         unsecured_pct = (ei.unsecured_sanctioned / ei.total_sanctioned) * 100
         if unsecured_pct > 80:
-            findings.append(KeyFinding(
+            yield KeyFinding(
                 category="Portfolio",
                 finding=f"Unsecured sanction is {unsecured_pct:.0f}% of total (INR {format_inr(ei.unsecured_sanctioned)} of INR {format_inr(ei.total_sanctioned)})",
                 inference="Heavily skewed towards unsecured lending; higher risk in absence of collateral",
                 severity="moderate_risk",
-            ))
+            )
         elif unsecured_pct > 50:
-            findings.append(KeyFinding(
+            yield KeyFinding(
                 category="Portfolio",
                 finding=f"Unsecured sanction is {unsecured_pct:.0f}% of total (INR {format_inr(ei.unsecured_sanctioned)} of INR {format_inr(ei.total_sanctioned)})",
                 inference="Majority unsecured portfolio; monitor for over-leveraging on unsecured products",
                 severity="concern",
-            ))
+            )
 
     # Outstanding as % of sanctioned
     if ei.total_sanctioned > 0:
         outstanding_pct = (ei.total_outstanding / ei.total_sanctioned) * 100
         if outstanding_pct > 80:
-            findings.append(KeyFinding(
+            yield KeyFinding(
                 category="Portfolio",
                 finding=f"Outstanding balance is {outstanding_pct:.0f}% of total sanctioned amount",
                 inference="Most sanctioned amount still outstanding; limited repayment progress on existing obligations",
                 severity="concern",
-            ))
+            )
 
     # Product diversity
     product_count = len(vectors)
     if product_count >= 4:
-        product_names = ", ".join(get_loan_type_display_name(lt) for lt in vectors)
-        findings.append(KeyFinding(
+        product_names = ", ".join(display_names.values())
+        yield KeyFinding(
             category="Portfolio",
             finding=f"Portfolio spans {product_count} loan products ({product_names})",
             inference="Diversified credit portfolio indicates established borrowing history across products",
             severity="neutral",
-        ))
-
-    return findings
+        )
 
 
 def _loan_type_findings(
     vectors: Dict[LoanType, BureauLoanFeatureVector],
-) -> List[KeyFinding]:
+    tl_suffixes: Dict[LoanType, str],
+    display_names: Dict[LoanType, str],
+) -> Iterator[KeyFinding]:
     """Extract findings from per-loan-type feature vectors."""
-    findings = []
-
     for loan_type, vec in vectors.items():
-        lt_name = get_loan_type_display_name(loan_type)
-        tl = _timeline_str(vec)
-        tl_suffix = f" [{tl}]" if tl else ""
+        lt_name = display_names[loan_type]
+        tl_suffix = tl_suffixes.get(loan_type, "")
 
         # CC utilization (utilization_ratio is stored as 0-1; convert to %)
         if loan_type == LoanType.CC and vec.utilization_ratio is not None:
             util = vec.utilization_ratio * 100
             if util > 75:
-                findings.append(KeyFinding(
+                yield KeyFinding(
                     category="Utilization",
                     finding=f"Credit card utilization at {util:.0f}%{tl_suffix}",
                     inference="Over-utilization of credit card limits signals high credit dependency and potential cash flow stress",
                     severity="high_risk",
-                ))
+                )
             elif util > 50:
-                findings.append(KeyFinding(
+                yield KeyFinding(
                     category="Utilization",
                     finding=f"Credit card utilization at {util:.0f}%{tl_suffix}",
                     inference="Elevated utilization; approaching high-risk threshold for revolving credit",
                     severity="moderate_risk",
-                ))
+                )
             elif util <= 30:
-                findings.append(KeyFinding(
+                yield KeyFinding(
                     category="Utilization",
                     finding=f"Credit card utilization at {util:.0f}%{tl_suffix}",
                     inference="Healthy utilization indicates disciplined credit card usage",
                     severity="positive",
-                ))
+                )
 
         # Per-type delinquency
-        if vec.delinquency_flag and vec.max_dpd is not None and vec.max_dpd > 0:
-            if vec.max_dpd > 90:
-                findings.append(KeyFinding(
-                    category="Delinquency",
-                    finding=f"{lt_name}: Delinquent with Max DPD of {vec.max_dpd} days{tl_suffix}",
-                    inference=f"Severe delinquency on {lt_name} account; may indicate deep financial distress",
-                    severity="high_risk",
-                ))
-            elif vec.max_dpd > 30:
-                findings.append(KeyFinding(
-                    category="Delinquency",
-                    finding=f"{lt_name}: Delinquent with Max DPD of {vec.max_dpd} days{tl_suffix}",
-                    inference=f"Significant past-due on {lt_name}; repayment discipline is compromised",
-                    severity="moderate_risk",
-                ))
+        if vec.delinquency_flag and vec.max_dpd is not None:
+            finding = _dpd_finding(_LOAN_TYPE_DPD_BUCKETS, "Delinquency", vec.max_dpd, lt_name, tl_suffix)
+            if finding is not None:
+                yield finding
 
         # Overdue amount
         if vec.overdue_amount > 0:
-            findings.append(KeyFinding(
+            yield KeyFinding(
                 category="Outstanding",
                 finding=f"{lt_name}: Overdue amount of INR {format_inr(vec.overdue_amount)}{tl_suffix}",
-                inference=f"Active overdue balance on {lt_name} indicates unresolved payment obligation",
+                inference=_OVERDUE_INFERENCE_TPL.format(label=lt_name),
                 severity="concern",
-            ))
+            )
 
         # Forced events (write-off, settlement, etc.)
         if vec.forced_event_flags:
             events = ", ".join(vec.forced_event_flags)
-            findings.append(KeyFinding(
+            yield KeyFinding(
                 category="Adverse Events",
                 finding=f"{lt_name}: Forced events detected — {events}{tl_suffix}",
-                inference=f"Adverse credit events on {lt_name} are strong negative signals for creditworthiness",
+                inference=_FORCED_EVENT_INFERENCE_TPL.format(label=lt_name),
                 severity="high_risk",
-            ))
-
-    return findings
+            )
 
 
 def _tradeline_findings(
     tf: TradelineFeatures,
-    vectors: Optional[Dict[LoanType, BureauLoanFeatureVector]] = None,
-) -> List[KeyFinding]:
+    tl_suffixes: Dict[LoanType, str],
+    dpd: _DpdContext,
+) -> Iterator[KeyFinding]:
     """Extract findings from pre-computed tradeline features."""
-    findings = []
-
-    # Helper to look up timeline for CC or PL from vectors
-    def _lt_timeline(lt: LoanType) -> str:
-        if vectors and lt in vectors:
-            tl = _timeline_str(vectors[lt])
-            return f" [{tl}]" if tl else ""
-        return ""
-
-    pl_tl = _lt_timeline(LoanType.PL)
+    pl_tl = tl_suffixes.get(LoanType.PL, "")
 
     # --- Loan Activity ---
-    if tf.new_trades_6m_pl is not None:
-        if tf.new_trades_6m_pl >= 3:
-            findings.append(KeyFinding(
-                category="Loan Activity",
-                finding=f"{tf.new_trades_6m_pl} new personal loan trades opened in last 6 months{pl_tl}",
-                inference="Rapid PL acquisition suggests urgent credit need or loan stacking behavior",
-                severity="high_risk",
-            ))
-        elif tf.new_trades_6m_pl >= 2:
-            findings.append(KeyFinding(
-                category="Loan Activity",
-                finding=f"{tf.new_trades_6m_pl} new personal loan trades opened in last 6 months{pl_tl}",
-                inference="Multiple recent PL acquisitions; monitor for emerging over-leverage",
-                severity="moderate_risk",
-            ))
-
-    if tf.months_since_last_trade_pl is not None and tf.months_since_last_trade_pl < 2:
-        findings.append(KeyFinding(
-            category="Loan Activity",
-            finding=f"Last PL trade opened {tf.months_since_last_trade_pl:.1f} months ago{pl_tl}",
-            inference="Very recent PL activity indicates active credit seeking",
-            severity="concern",
-        ))
+    yield from _rule_findings(_ACTIVITY_RULES, tf, pl_tl=pl_tl)
 
     # --- DPD & Delinquency ---
-    # Map field name to (label, LoanType) for timeline lookup
-    dpd_field_map = [
-        ("max_dpd_6m_cc", "Credit Card (6M)", LoanType.CC),
-        ("max_dpd_6m_pl", "Personal Loan (6M)", LoanType.PL),
-        ("max_dpd_9m_cc", "Credit Card (9M)", LoanType.CC),
-    ]
-    for field_name, label, lt in dpd_field_map:
-        val = getattr(tf, field_name, None)
-        lt_tl = _lt_timeline(lt)
-        if val is not None and val > 0:
-            if val > 90:
-                findings.append(KeyFinding(
-                    category="DPD & Delinquency",
-                    finding=f"Max DPD for {label}: {val} days{lt_tl}",
-                    inference=f"Severe delinquency on {label} — strong negative indicator",
-                    severity="high_risk",
-                ))
-            elif val > 30:
-                findings.append(KeyFinding(
-                    category="DPD & Delinquency",
-                    finding=f"Max DPD for {label}: {val} days{lt_tl}",
-                    inference=f"Significant past-due on {label}; repayment under stress",
-                    severity="moderate_risk",
-                ))
-            else:
-                findings.append(KeyFinding(
-                    category="DPD & Delinquency",
-                    finding=f"Max DPD for {label}: {val} days{lt_tl}",
-                    inference=f"Minor past-due on {label}; may be a temporary delay",
-                    severity="concern",
-                ))
+    for val, (_, label, _, lt) in zip(dpd.values, _DPD_FIELD_MAP):
+        if val is not None:
+            finding = _dpd_finding(_TRADELINE_DPD_BUCKETS, "DPD & Delinquency", val, label, tl_suffixes.get(lt, ""))
+            if finding is not None:
+                yield finding
 
     # Clean DPD check (all zero)
-    dpd_fields = [tf.max_dpd_6m_cc, tf.max_dpd_6m_pl, tf.max_dpd_9m_cc]
-    if all(v is not None and v == 0 for v in dpd_fields):
-        findings.append(KeyFinding(
+    if dpd.clean:
+        yield KeyFinding(
             category="DPD & Delinquency",
             finding="Zero DPD across all products in recent 6-9 month windows",
             inference="Clean recent payment record demonstrates consistent repayment discipline",
             severity="positive",
-        ))
+        )
 
     # --- Payment Behavior ---
-    if tf.pct_missed_payments_18m is not None:
-        if tf.pct_missed_payments_18m > 10:
-            findings.append(KeyFinding(
+    # 0% missed payments — but cross-check against DPD fields
+    missed = tf.pct_missed_payments_18m
+    if missed is not None and not missed > 0:
+        if dpd.details:
+            yield KeyFinding(
                 category="Payment Behavior",
-                finding=f"{tf.pct_missed_payments_18m:.1f}% missed payments in last 18 months",
-                inference="Frequent missed payments indicate chronic repayment stress",
-                severity="high_risk",
-            ))
-        elif tf.pct_missed_payments_18m > 0:
-            findings.append(KeyFinding(
-                category="Payment Behavior",
-                finding=f"{tf.pct_missed_payments_18m:.1f}% missed payments in last 18 months",
-                inference="Some missed payments detected; not habitual but warrants attention",
+                finding="No formal missed payments in last 18 months, but DPD delays detected on some products",
+                inference="Payments were eventually made but past due date; payment timing discipline is not fully clean",
                 severity="concern",
-            ))
-        else:
-            # 0% missed payments — but cross-check against DPD fields
-            has_dpd = any(
-                getattr(tf, f, None) is not None and getattr(tf, f) > 0
-                for f in ["max_dpd_6m_cc", "max_dpd_6m_pl", "max_dpd_9m_cc"]
             )
-            if has_dpd:
-                findings.append(KeyFinding(
-                    category="Payment Behavior",
-                    finding="No formal missed payments in last 18 months, but DPD delays detected on some products",
-                    inference="Payments were eventually made but past due date; payment timing discipline is not fully clean",
-                    severity="concern",
-                ))
-            else:
-                findings.append(KeyFinding(
-                    category="Payment Behavior",
-                    finding="No missed payments in last 18 months",
-                    inference="Perfect payment track record over 18 months is a strong positive",
-                    severity="positive",
-                ))
-
-    if tf.ratio_good_closed_pl is not None:
-        if tf.ratio_good_closed_pl >= 0.8:
-            findings.append(KeyFinding(
-                category="Payment Behavior",
-                finding=f"Good closure ratio for PL loans: {tf.ratio_good_closed_pl:.0%}",
-                inference="Strong track record of closing personal loans in good standing",
-                severity="positive",
-            ))
-        elif tf.ratio_good_closed_pl < 0.5:
-            findings.append(KeyFinding(
-                category="Payment Behavior",
-                finding=f"Good closure ratio for PL loans: {tf.ratio_good_closed_pl:.0%}",
-                inference="Poor PL closure history — majority of closed PLs had issues",
-                severity="high_risk",
-            ))
-        elif tf.ratio_good_closed_pl < 0.7:
-            findings.append(KeyFinding(
+        else:
+            yield KeyFinding(
                 category="Payment Behavior",
-                finding=f"Good closure ratio for PL loans: {tf.ratio_good_closed_pl:.0%}",
-                inference="Below-average PL closure quality; some loans closed with problems",
-                severity="concern",
-            ))
-
-    # --- Utilization ---
-    # CC utilization is already covered by _loan_type_findings (from feature vectors)
-
-    if tf.pl_balance_remaining_pct is not None:
-        if tf.pl_balance_remaining_pct > 80:
-            findings.append(KeyFinding(
-                category="Utilization",
-                finding=f"PL balance remaining: {tf.pl_balance_remaining_pct:.1f}%",
-                inference="Most PL sanctioned amount still outstanding; limited principal repayment progress",
-                severity="high_risk",
-            ))
-        elif tf.pl_balance_remaining_pct <= 30:
-            findings.append(KeyFinding(
-                category="Utilization",
-                finding=f"PL balance remaining: {tf.pl_balance_remaining_pct:.1f}%",
-                inference="Significant PL principal already repaid; good repayment progress",
+                finding="No missed payments in last 18 months",
+                inference="Perfect payment track record over 18 months is a strong positive",
                 severity="positive",
-            ))
-
-    # --- Enquiry Behavior ---
-    if tf.unsecured_enquiries_12m is not None:
-        if tf.unsecured_enquiries_12m > 15:
-            findings.append(KeyFinding(
-                category="Enquiry Behavior",
-                finding=f"{tf.unsecured_enquiries_12m} unsecured enquiries in last 12 months",
-                inference="Very high enquiry pressure suggests desperate credit seeking or multiple rejections",
-                severity="high_risk",
-            ))
-        elif tf.unsecured_enquiries_12m > 10:
-            findings.append(KeyFinding(
-                category="Enquiry Behavior",
-                finding=f"{tf.unsecured_enquiries_12m} unsecured enquiries in last 12 months",
-                inference="Elevated enquiry activity; may indicate difficulty securing credit",
-                severity="moderate_risk",
-            ))
-        elif tf.unsecured_enquiries_12m <= 3:
-            findings.append(KeyFinding(
-                category="Enquiry Behavior",
-                finding=f"{tf.unsecured_enquiries_12m} unsecured enquiries in last 12 months",
-                inference="Minimal enquiry activity indicates stable credit position",
-                severity="positive",
-            ))
-
-    if tf.trade_to_enquiry_ratio_uns_24m is not None:
-        if tf.trade_to_enquiry_ratio_uns_24m < 20:
-            findings.append(KeyFinding(
-                category="Enquiry Behavior",
-                finding=f"Trade-to-enquiry ratio (unsecured, 24M): {tf.trade_to_enquiry_ratio_uns_24m:.1f}%",
-                inference="Low conversion from enquiries to actual loans suggests possible rejections by lenders",
-                severity="concern",
-            ))
-        elif tf.trade_to_enquiry_ratio_uns_24m > 50:
-            findings.append(KeyFinding(
-                category="Enquiry Behavior",
-                finding=f"Trade-to-enquiry ratio (unsecured, 24M): {tf.trade_to_enquiry_ratio_uns_24m:.1f}%",
-                inference="High conversion rate indicates strong acceptance by lenders",
-                severity="positive",
-            ))
-
-    # --- Loan Acquisition Velocity ---
-    if tf.interpurchase_time_12m_plbl is not None:
-        if tf.interpurchase_time_12m_plbl < 1:
-            findings.append(KeyFinding(
-                category="Loan Velocity",
-                finding=f"Avg time between PL/BL acquisitions (12M): {tf.interpurchase_time_12m_plbl:.1f} months",
-                inference="Rapid loan stacking — acquiring unsecured loans faster than monthly; high risk of over-leverage",
-                severity="high_risk",
-            ))
-        elif tf.interpurchase_time_12m_plbl < 2:
-            findings.append(KeyFinding(
-                category="Loan Velocity",
-                finding=f"Avg time between PL/BL acquisitions (12M): {tf.interpurchase_time_12m_plbl:.1f} months",
-                inference="Frequent loan acquisitions; borrower is actively accumulating unsecured debt",
-                severity="concern",
-            ))
-        elif tf.interpurchase_time_12m_plbl >= 6:
-            findings.append(KeyFinding(
-                category="Loan Velocity",
-                finding=f"Avg time between PL/BL acquisitions (12M): {tf.interpurchase_time_12m_plbl:.1f} months",
-                inference="Measured pace of loan acquisitions indicates no urgency or stacking behavior",
-                severity="positive",
-            ))
+            )
 
-    return findings
+    # --- Missed payments, closures, utilization, enquiries, velocity ---
+    yield from _rule_findings(_BEHAVIOR_RULES, tf)
 
 
 def _composite_findings(
     ei: BureauExecutiveSummaryInputs,
     tf: TradelineFeatures,
-    vectors: Optional[Dict[LoanType, BureauLoanFeatureVector]] = None,
-) -> List[KeyFinding]:
+    tl_suffixes: Dict[LoanType, str],
+    dpd: _DpdContext,
+) -> Iterator[KeyFinding]:
     """Extract findings from feature interactions (multi-feature signals)."""
-    findings = []
-
-    # Timeline helpers
-    def _lt_timeline(lt: LoanType) -> str:
-        if vectors and lt in vectors:
-            tl = _timeline_str(vectors[lt])
-            return f" [{tl}]" if tl else ""
-        return ""
-
-    pl_tl = _lt_timeline(LoanType.PL)
-    cc_tl = _lt_timeline(LoanType.CC)
-
-    enquiries = tf.unsecured_enquiries_12m
-    new_pl_6m = tf.new_trades_6m_pl
-    ipt_plbl = tf.interpurchase_time_12m_plbl
+    pl_tl = tl_suffixes.get(LoanType.PL, "")
+    cc_tl = tl_suffixes.get(LoanType.CC, "")
 
-    # Credit hungry + loan stacking
-    if enquiries is not None and enquiries > 10 and new_pl_6m is not None and new_pl_6m >= 2:
-        findings.append(KeyFinding(
-            category="Composite Signal",
-            finding=f"High enquiry volume ({enquiries} in 12M) combined with {new_pl_6m} new PL trades in 6M{pl_tl}",
-            inference="Credit hungry behavior with active loan stacking — elevated risk of debt spiral",
-            severity="high_risk",
-        ))
-
-    # Rapid stacking with low interpurchase time
-    if ipt_plbl is not None and ipt_plbl < 2 and new_pl_6m is not None and new_pl_6m >= 2:
-        findings.append(KeyFinding(
-            category="Composite Signal",
-            finding=f"Avg {ipt_plbl:.1f} months between PL/BL with {new_pl_6m} new trades in 6M{pl_tl}",
-            inference="Rapid PL stacking pattern — borrower is accumulating unsecured debt at an accelerating pace",
-            severity="high_risk",
-        ))
-
-    # High utilization + high outstanding
-    cc_util = tf.cc_balance_utilization_pct
-    pl_bal = tf.pl_balance_remaining_pct
-    if cc_util is not None and cc_util > 50 and pl_bal is not None and pl_bal > 50:
-        findings.append(KeyFinding(
-            category="Composite Signal",
-            finding=f"CC utilization at {cc_util:.1f}%{cc_tl} and PL balance remaining at {pl_bal:.1f}%{pl_tl}",
-            inference="Elevated leverage across both revolving and term products; limited debt servicing headroom",
-            severity="moderate_risk",
-        ))
-
-    # High enquiries + low conversion
-    trade_ratio = tf.trade_to_enquiry_ratio_uns_24m
-    if enquiries is not None and enquiries > 10 and trade_ratio is not None and trade_ratio < 30:
-        findings.append(KeyFinding(
-            category="Composite Signal",
-            finding=f"High enquiries ({enquiries}) but only {trade_ratio:.1f}% trade-to-enquiry conversion",
-            inference="Low conversion rate despite high enquiry volume suggests multiple lender rejections",
-            severity="moderate_risk",
-        ))
+    yield from _rule_findings(_COMPOSITE_RULES, tf, pl_tl=pl_tl, cc_tl=cc_tl)
 
     # Clean profile composite
-    dpd_clean = all(
-        getattr(tf, f, None) is not None and getattr(tf, f) == 0
-        for f in ["max_dpd_6m_cc", "max_dpd_6m_pl", "max_dpd_9m_cc"]
-    )
     missed_clean = tf.pct_missed_payments_18m is not None and tf.pct_missed_payments_18m == 0
     good_ratio = tf.ratio_good_closed_pl
-    if dpd_clean and missed_clean and good_ratio is not None and good_ratio >= 0.8:
-        findings.append(KeyFinding(
+    if dpd.clean and missed_clean and good_ratio is not None and good_ratio >= 0.8:
+        yield KeyFinding(
             category="Composite Signal",
             finding=f"Zero DPD, no missed payments, and {good_ratio:.0%} good PL closure ratio",
             inference="Exemplary repayment profile — strong candidate from a credit discipline standpoint",
             severity="positive",
-        ))
+        )
 
     # Missed payments = 0 but DPD detected (from tl_features or portfolio-level)
-    has_tf_dpd = not dpd_clean
     has_portfolio_dpd = ei.has_delinquency and ei.max_dpd is not None and ei.max_dpd > 0
-    if missed_clean and (has_tf_dpd or has_portfolio_dpd):
-        dpd_details = []
-        if tf.max_dpd_6m_cc is not None and tf.max_dpd_6m_cc > 0:
-            dpd_details.append(f"CC 6M: {tf.max_dpd_6m_cc} days")
-        if tf.max_dpd_6m_pl is not None and tf.max_dpd_6m_pl > 0:
-            dpd_details.append(f"PL 6M: {tf.max_dpd_6m_pl} days")
-        if tf.max_dpd_9m_cc is not None and tf.max_dpd_9m_cc > 0:
-            dpd_details.append(f"CC 9M: {tf.max_dpd_9m_cc} days")
-        if has_portfolio_dpd and not dpd_details:
-            dpd_details.append(f"Portfolio Max DPD: {ei.max_dpd} days")
-        if dpd_details:
-            findings.append(KeyFinding(
-                category="Composite Signal",
-                finding=f"No formal missed payments but DPD detected ({', '.join(dpd_details)})",
-                inference="Payments were made but with delays past due date; payment discipline is inconsistent despite no formal defaults",
-                severity="concern",
-            ))
-
-    return findings
+    if missed_clean and (dpd.details or has_portfolio_dpd):
+        dpd_details = dpd.details or [f"Portfolio Max DPD: {ei.max_dpd} days"]
+        yield KeyFinding(
+            category="Composite Signal",
+            finding=f"No formal missed payments but DPD detected ({', '.join(dpd_details)})",
+            inference="Payments were made but with delays past due date; payment discipline is inconsistent despite no formal defaults",
+            severity="concern",
+        )
 
 
 def findings_to_dicts(findings: List[KeyFinding]) -> List[Dict]:
     """Convert KeyFinding list to list of dicts for serialization."""
-    return [asdict(f) for f in findings]
+    return [
+        {
+            "category": f.category,
+            "finding": f.finding,
+            "inference": f.inference,
+            "severity": f.severity,
+        }
+        for f in findings
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Batch mode: one DataFrame row per customer
+# ---------------------------------------------------------------------------
+
+def _dpd_bucket_rules(column: str, code_column: str, buckets: tuple, category: str, label: str = "") -> list:
+    """Expand a DPD bucket table into batch rules, one per bucket."""
+    rules = []
+    for code, (_, severity, finding_tpl, inference_tpl) in enumerate(buckets):
+        rules.append((
+            (column, code_column),
+            lambda dpd, codes, code=code: codes == code,
+            category,
+            severity,
+            lambda dpd, codes, tpl=finding_tpl: tpl.format(label=label, dpd=int(dpd), tl=""),
+            inference_tpl.format(label=label),
+        ))
+    return rules
+
+
+def _batch_dpd_details(cc6: float, pl6: float, cc9: float, max_dpd: float) -> str:
+    details = [
+        f"{short}: {int(v)} days"
+        for v, (_, _, short, _) in zip((cc6, pl6, cc9), _DPD_FIELD_MAP)
+        if v > 0
+    ]
+    if not details:
+        details.append(f"Portfolio Max DPD: {int(max_dpd)} days")
+    return f"No formal missed payments but DPD detected ({', '.join(details)})"
+
+
+def _batch_rules(rules: tuple) -> list:
+    """Adapt shared _Rule entries to batch rules (no timelines in batch mode)."""
+    return [
+        (
+            rule.fields,
+            rule.predicate,
+            rule.category,
+            rule.severity,
+            lambda *values, tpl=rule.finding: tpl.format(*values, pl_tl="", cc_tl=""),
+            rule.inference,
+        )
+        for rule in rules
+    ]
+
+
+# (columns, mask predicate, category, severity, finding builder, inference),
+# in the same order extract_key_findings emits them. Predicates get whole
+# columns (NaN = missing, so every comparison on it is False); the finding
+# builder runs only on the rows that fire.
+_BATCH_RULES = (
+    # Portfolio
+    *_dpd_bucket_rules("max_dpd", "_portfolio_dpd_code", _PORTFOLIO_DPD_BUCKETS, "Delinquency"),
+    (("has_delinquency",), lambda h: ~h, "Delinquency", "positive",
+     lambda h: "No delinquency detected across the portfolio",
+     "Clean delinquency record is a positive indicator for repayment discipline"),
+    (("_unsecured_pct", "unsecured_sanctioned", "total_sanctioned"), lambda p, u, t: p > 80, "Portfolio", "moderate_risk",
+     lambda p, u, t: f"Unsecured sanction is {p:.0f}% of total (INR {format_inr(u)} of INR {format_inr(t)})",
+     "Heavily skewed towards unsecured lending; higher risk in absence of collateral"),
+    (("_unsecured_pct", "unsecured_sanctioned", "total_sanctioned"), lambda p, u, t: (p > 50) & ~(p > 80), "Portfolio", "concern",
+     lambda p, u, t: f"Unsecured sanction is {p:.0f}% of total (INR {format_inr(u)} of INR {format_inr(t)})",
+     "Majority unsecured portfolio; monitor for over-leveraging on unsecured products"),
+    (("_outstanding_pct",), lambda p: p > 80, "Portfolio", "concern",
+     lambda p: f"Outstanding balance is {p:.0f}% of total sanctioned amount",
+     "Most sanctioned amount still outstanding; limited repayment progress on existing obligations"),
+    # Tradeline
+    *_batch_rules(_ACTIVITY_RULES),
+    *(
+        rule
+        for column, label, _, _ in _DPD_FIELD_MAP
+        for rule in _dpd_bucket_rules(column, f"_{column}_code", _TRADELINE_DPD_BUCKETS, "DPD & Delinquency", label)
+    ),
+    (("_dpd_clean",), lambda c: c, "DPD & Delinquency", "positive",
+     lambda c: "Zero DPD across all products in recent 6-9 month windows",
+     "Clean recent payment record demonstrates consistent repayment discipline"),
+    (("pct_missed_payments_18m", "_has_dpd"), lambda m, d: (m <= 0) & d, "Payment Behavior", "concern",
+     lambda m, d: "No formal missed payments in last 18 months, but DPD delays detected on some products",
+     "Payments were eventually made but past due date; payment timing discipline is not fully clean"),
+    (("pct_missed_payments_18m", "_has_dpd"), lambda m, d: (m <= 0) & ~d, "Payment Behavior", "positive",
+     lambda m, d: "No missed payments in last 18 months",
+     "Perfect payment track record over 18 months is a strong positive"),
+    *_batch_rules(_BEHAVIOR_RULES),
+    # Composite
+    *_batch_rules(_COMPOSITE_RULES),
+    (("_dpd_clean", "pct_missed_payments_18m", "ratio_good_closed_pl"), lambda c, m, g: c & (m == 0) & (g >= 0.8), "Composite Signal", "positive",
+     lambda c, m, g: f"Zero DPD, no missed payments, and {g:.0%} good PL closure ratio",
+     "Exemplary repayment profile — strong candidate from a credit discipline standpoint"),
+    (("max_dpd_6m_cc", "max_dpd_6m_pl", "max_dpd_9m_cc", "max_dpd", "pct_missed_payments_18m", "_has_dpd", "_portfolio_dpd"),
+     lambda cc6, pl6, cc9, d, m, has_dpd, port: (m == 0) & (has_dpd | port), "Composite Signal", "concern",
+     lambda cc6, pl6, cc9, d, m, has_dpd, port: _batch_dpd_details(cc6, pl6, cc9, d),
+     "Payments were made but with delays past due date; payment discipline is inconsistent despite no formal defaults"),
+)
+
+
+def _batch_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Pull every column the batch rules read, plus derived helper columns."""
+    n = len(df)
+
+    def numeric(name: str) -> np.ndarray:
+        if name not in df.columns:
+            return np.full(n, np.nan)
+        return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+    cols: Dict[str, np.ndarray] = {
+        name: numeric(name)
+        for rule in _BATCH_RULES
+        for name in rule[0]
+        if not name.startswith("_") and name != "has_delinquency"
+    }
+    if "has_delinquency" in df.columns:
+        cols["has_delinquency"] = df["has_delinquency"].fillna(False).to_numpy(dtype=bool)
+    else:
+        cols["has_delinquency"] = np.zeros(n, dtype=bool)
+
+    has_delinquency = cols["has_delinquency"]
+    max_dpd = cols["max_dpd"]
+    codes = _bucket_codes(max_dpd, [b[0] for b in _PORTFOLIO_DPD_BUCKETS])
+    cols["_portfolio_dpd_code"] = np.where(has_delinquency, codes, -1)
+    cols["_portfolio_dpd"] = has_delinquency & (max_dpd > 0)
+
+    total_sanctioned = cols["total_sanctioned"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid = total_sanctioned > 0
+        cols["_unsecured_pct"] = np.where(valid, cols["unsecured_sanctioned"] / total_sanctioned * 100, np.nan)
+        cols["_outstanding_pct"] = np.where(valid, numeric("total_outstanding") / total_sanctioned * 100, np.nan)
+
+    dpd_thresholds = [b[0] for b in _TRADELINE_DPD_BUCKETS]
+    clean = np.ones(n, dtype=bool)
+    has_dpd = np.zeros(n, dtype=bool)
+    for column, _, _, _ in _DPD_FIELD_MAP:
+        values = cols[column]
+        cols[f"_{column}_code"] = _bucket_codes(values, dpd_thresholds)
+        clean &= values == 0
+        has_dpd |= values > 0
+    cols["_dpd_clean"] = clean
+    cols["_has_dpd"] = has_dpd
+    return cols
+
+
+def extract_key_findings_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Extract key findings for many customers in one vectorized pass.
+
+    Each row of ``df`` is one customer, with columns named after the
+    BureauExecutiveSummaryInputs and TradelineFeatures attributes. Missing
+    columns and NaN cells are treated as None. Thresholds are evaluated on
+    whole columns; strings are only built for the rows a rule fires on.
+
+    Per-loan-type vectors do not fit a flat row, so each customer gets the
+    findings extract_key_findings would return with no feature vectors
+    (no per-loan-type findings, product diversity, or timelines).
+
+    Args:
+        df: One row per customer.
+
+    Returns:
+        Long-format DataFrame (category, finding, inference, severity)
+        indexed by the customer's row label, customers in input order and
+        severity-ordered within each customer.
+    """
+    cols = _batch_columns(df)
+    positions, ranks, orders = [], [], []
+    categories, findings, inferences, severities = [], [], [], []
+
+    with np.errstate(invalid="ignore"):
+        for order, (names, predicate, category, severity, build, inference) in enumerate(_BATCH_RULES):
+            values = [cols[name] for name in names]
+            rows = np.flatnonzero(predicate(*values))
+            if not rows.size:
+                continue
+            positions.append(rows)
+            ranks.append(np.full(rows.size, _SEVERITY_ORDER.get(severity, 3)))
+            orders.append(np.full(rows.size, order))
+            findings.extend(build(*row) for row in zip(*(v[rows] for v in values)))
+            categories.extend([category] * rows.size)
+            inferences.extend([inference] * rows.size)
+            severities.extend([severity] * rows.size)
+
+    columns = ["category", "finding", "inference", "severity"]
+    if not positions:
+        return pd.DataFrame(columns=columns, index=df.index[:0])
+
+    pos = np.concatenate(positions)
+    idx = np.lexsort((np.concatenate(orders), np.concatenate(ranks), pos))
+    return pd.DataFrame(
+        {
+            "category": np.asarray(categories, dtype=object)[idx],
+            "finding": np.asarray(findings, dtype=object)[idx],
+            "inference": np.asarray(inferences, dtype=object)[idx],
+            "severity": np.asarray(severities, dtype=object)[idx],
+        },
+        index=df.index[pos[idx]],
+    )
@@ -1,20 +1,27 @@
 """Main orchestrator - coordinates all pipeline components."""
 
+import asyncio
+import atexit
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Iterator
+from typing import Iterator, List, Optional, Tuple
 
 from schemas.intent import ParsedIntent, IntentType
-from schemas.response import PipelineResponse, AuditLog
+from schemas.response import PipelineResponse, AuditLog, ToolResult
+from schemas.transaction_insights import TransactionInsights
 
 from .intent_parser import IntentParser
 from .planner import QueryPlanner
 from .executor import ToolExecutor
-from .explainer import ResponseExplainer
+from .explainer import ResponseExplainer, EXPLAINER_USES_INSIGHTS
 from .audit import AuditLogger
 from .transaction_flow import get_transaction_insights_if_needed
 from utils.helpers import mask_customer_id
-from config.settings import PARSER_MODEL, EXPLAINER_MODEL
+from config.settings import PARSER_MODEL, EXPLAINER_MODEL, EXPLAINER_STREAM_DELAY
 
 
 INSIGHT_INTENTS = {
@@ -22,6 +29,59 @@ INSIGHT_INTENTS = {
     IntentType.CUSTOMER_REPORT,
     IntentType.FINANCIAL_OVERVIEW,
 }
+# INSIGHT_INTENTS narrowed to those whose explainer prompt reads the insights,
+# resolved once here instead of per query
+_EXPLAINER_INSIGHT_INTENTS = frozenset(
+    it for it in INSIGHT_INTENTS if EXPLAINER_USES_INSIGHTS.get(it, False)
+)
+
+# How often query() flushes streamed answer text to stdout when verbose
+_STDOUT_FLUSH_INTERVAL_SEC = 0.05
+
+# Insight extraction runs here while the plan is built and tools execute
+_INSIGHT_POOL: Optional[ThreadPoolExecutor] = None
+_INSIGHT_POOL_LOCK = threading.Lock()
+
+
+def _get_insight_pool() -> ThreadPoolExecutor:
+    """Create the shared insight pool on first use."""
+    global _INSIGHT_POOL
+    if _INSIGHT_POOL is None:
+        with _INSIGHT_POOL_LOCK:
+            if _INSIGHT_POOL is None:
+                _INSIGHT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline-insights")
+    return _INSIGHT_POOL
+
+
+# Audit entries from every pipeline are written by one background thread so
+# file I/O never delays a response; atexit waits for the queue to drain
+_AUDIT_QUEUE: "queue.Queue[Tuple[AuditLogger, AuditLog]]" = queue.Queue()
+_AUDIT_WRITER: Optional[threading.Thread] = None
+_AUDIT_WRITER_LOCK = threading.Lock()
+
+
+def _audit_drain() -> None:
+    """Write queued (logger, entry) pairs until the process exits."""
+    while True:
+        audit_logger, entry = _AUDIT_QUEUE.get()
+        try:
+            audit_logger.log(entry)
+        except Exception as e:
+            print(f"[Audit] Failed to write audit entry: {e}")
+        finally:
+            _AUDIT_QUEUE.task_done()
+
+
+def _get_audit_queue() -> "queue.Queue[Tuple[AuditLogger, AuditLog]]":
+    """Start the shared audit writer on first use and return its queue."""
+    global _AUDIT_WRITER
+    if _AUDIT_WRITER is None:
+        with _AUDIT_WRITER_LOCK:
+            if _AUDIT_WRITER is None:
+                _AUDIT_WRITER = threading.Thread(target=_audit_drain, name="pipeline-audit", daemon=True)
+                _AUDIT_WRITER.start()
+                atexit.register(_AUDIT_QUEUE.join)
+    return _AUDIT_QUEUE
 
 
 class TransactionPipeline:
@@ -31,7 +91,7 @@ class TransactionPipeline:
         explainer_model: str = EXPLAINER_MODEL,
         use_llm_explainer: bool = True,
         verbose: bool = True,
-        stream_delay: float = 0.025
+        stream_delay: float = EXPLAINER_STREAM_DELAY
     ):
         """
         Initialize the transaction pipeline.
@@ -42,7 +102,8 @@ class TransactionPipeline:
             use_llm_explainer: Whether to use LLM for explanations
             verbose: Whether to print debug info
             stream_delay: Delay in seconds between streaming chunks (0.0 = no delay)
-                         Use 0.02-0.05 for readable typing effect
+                         Use 0.02-0.05 for readable typing effect; defaults to
+                         the EXPLAINER_STREAM_DELAY setting (off)
         """
         self.parser = IntentParser(model_name=parser_model)
         self.planner = QueryPlanner()
@@ -70,12 +131,67 @@ class TransactionPipeline:
             self._log(f"    [Session] Using active customer: {mask_customer_id(self.active_customer_id)}")
 
     def _should_get_insights(self, intent: ParsedIntent) -> bool:
-        """Check if this intent benefits from transaction insights."""
-        return intent.intent in INSIGHT_INTENTS and intent.customer_id is not None
+        """Check if this intent benefits from transaction insights.
 
-    def query(self, user_query: str) -> PipelineResponse:
-        start_time = time.time()
+        Insights only feed the LLM explainer prompt, so they are skipped when
+        the LLM explainer is off or its prompt for this intent does not use them.
+        """
+        return (
+            self.use_llm_explainer
+            and intent.customer_id is not None
+            and intent.intent in _EXPLAINER_INSIGHT_INTENTS
+        )
+
+    def _start_insights(self, intent: ParsedIntent) -> Optional[Future]:
+        """Start insight extraction in the background as soon as the customer is known.
+
+        It only depends on the customer, so it overlaps with planning and tool
+        execution; Phase 3.5 then just collects the result.
+        """
+        if not self._should_get_insights(intent):
+            return None
+        return _get_insight_pool().submit(get_transaction_insights_if_needed, intent.customer_id)
+
+    def _collect_insights(self, future: Optional[Future]) -> Optional[TransactionInsights]:
+        """Phase 3.5: wait for the background insight extraction, if one was started."""
+        if future is None:
+            return None
+        self._log("\n[3.5] Extracting transaction insights...")
+        transaction_insights = future.result()
+        self._log_insights(transaction_insights)
+        return transaction_insights
+
+    def _log_intent(self, intent: ParsedIntent):
+        self._log(f"    Intent: {intent.intent.value}")
+        self._log(f"    Customer: {mask_customer_id(intent.customer_id) if intent.customer_id else 'N/A'}")
+        if intent.category:
+            self._log(f"    Category: {intent.category}")
+        self._log(f"    Confidence: {intent.confidence}")
 
+    def _log_results(self, results: list):
+        for r in results:
+            status = "OK" if r.success else f"FAIL: {r.error}"
+            self._log(f"    {r.tool_name}: {status}")
+
+    def _log_insights(self, transaction_insights: Optional[TransactionInsights]):
+        if transaction_insights:
+            self._log(f"    Patterns found: {len(transaction_insights.patterns)}")
+        else:
+            self._log("    No patterns detected")
+
+    def _run_tools(
+        self, user_query: str
+    ) -> Tuple[ParsedIntent, Optional[Future], List[ToolResult], str]:
+        """
+        Phases 1-3 shared by query() and query_stream().
+
+        Parses the query, plans, starts insight extraction if the intent
+        uses it (once the plan is accepted) and executes the tools.
+
+        Returns:
+            (intent, insights_future, results, error); error is non-empty when
+            planning failed, in which case results is empty
+        """
         self._log(f"\n{'='*60}")
         self._log(f"Query: {user_query}")
         self._log('='*60)
@@ -84,11 +200,7 @@ class TransactionPipeline:
         self._log("\n[1] Parsing intent...")
         intent = self.parser.parse(user_query)
         self.resolve_customer_id(intent)
-        self._log(f"    Intent: {intent.intent.value}")
-        self._log(f"    Customer: {mask_customer_id(intent.customer_id) if intent.customer_id else 'N/A'}")
-        if intent.category:
-            self._log(f"    Category: {intent.category}")
-        self._log(f"    Confidence: {intent.confidence}")
+        self._log_intent(intent)
 
         # Phase 2: Create plan
         self._log("\n[2] Creating execution plan...")
@@ -96,39 +208,46 @@ class TransactionPipeline:
 
         if error:
             self._log(f"    Error: {error}")
-            return self._error_response(intent, error, start_time)
+            return intent, None, [], error
 
         self._log(f"    Plan: {[p['tool'] for p in plan]}")
+        insights_future = self._start_insights(intent)
 
         # Phase 3: Execute tools
         self._log("\n[3] Executing tools...")
         results = self.executor.execute(plan)
+        self._log_results(results)
+        return intent, insights_future, results, ""
 
-        for r in results:
-            status = "OK" if r.success else f"FAIL: {r.error}"
-            self._log(f"    {r.tool_name}: {status}")
+    def query(self, user_query: str) -> PipelineResponse:
+        start_time = time.time()
 
-        # Phase 3.5: Transaction insights (if needed)
-        transaction_insights = None
-        if self._should_get_insights(intent):
-            self._log("\n[3.5] Extracting transaction insights...")
-            transaction_insights = get_transaction_insights_if_needed(intent.customer_id)
-            if transaction_insights:
-                self._log(f"    Patterns found: {len(transaction_insights.patterns)}")
-            else:
-                self._log("    No patterns detected")
+        intent, insights_future, results, error = self._run_tools(user_query)
+        if error:
+            return self._error_response(intent, error, start_time)
+
+        # Phase 3.5: Transaction insights (started after Phase 2)
+        transaction_insights = self._collect_insights(insights_future)
 
         # Phase 4: Generate explanation (streaming by default)
         self._log("\n[4] Generating response (streaming)...\n")
         if self.use_llm_explainer:
-            answer = ""
+            parts = []
+            last_flush = time.monotonic()
             for chunk in self.explainer.stream_explain(intent, results, transaction_insights):
-                print(chunk, end='', flush=True)
-                answer += chunk
-            print()  # Newline after streaming
+                parts.append(chunk)
+                if self.verbose:
+                    sys.stdout.write(chunk)
+                    # Flush on a timer rather than per token
+                    now = time.monotonic()
+                    if now - last_flush >= _STDOUT_FLUSH_INTERVAL_SEC:
+                        sys.stdout.flush()
+                        last_flush = now
+            answer = "".join(parts)
+            self._log("")  # Newline after streaming
         else:
             answer = self.explainer.format_simple(results)
-            print(answer)
+            self._log(answer)
 
         # Build response
         response = PipelineResponse(
@@ -145,10 +264,12 @@ class TransactionPipeline:
 
         return response
 
-    def query_stream(self, user_query: str) -> Iterator[str]:
+    async def query_async(self, user_query: str) -> PipelineResponse:
         """
-        Stream the response as it's being generated.
-        Yields chunks of the final answer as they are produced by the LLM explainer.
+        Async variant of query() for callers already running an event loop.
+
+        Insight extraction and tool execution run concurrently in worker
+        threads; the answer comes from the explainer without console streaming.
         """
         start_time = time.time()
 
@@ -158,13 +279,9 @@ class TransactionPipeline:
 
         # Phase 1: Parse intent
         self._log("\n[1] Parsing intent...")
-        intent = self.parser.parse(user_query)
+        intent = await self.parser.parse_async(user_query)
         self.resolve_customer_id(intent)
-        self._log(f"    Intent: {intent.intent.value}")
-        self._log(f"    Customer: {mask_customer_id(intent.customer_id) if intent.customer_id else 'N/A'}")
-        if intent.category:
-            self._log(f"    Category: {intent.category}")
-        self._log(f"    Confidence: {intent.confidence}")
+        self._log_intent(intent)
 
         # Phase 2: Create plan
         self._log("\n[2] Creating execution plan...")
@@ -172,39 +289,79 @@ class TransactionPipeline:
 
         if error:
             self._log(f"    Error: {error}")
-            yield error
-            self._log_audit(user_query, intent, [], error, (time.time() - start_time) * 1000, False, error)
-            return
+            return self._error_response(intent, error, start_time)
 
         self._log(f"    Plan: {[p['tool'] for p in plan]}")
 
-        # Phase 3: Execute tools
-        self._log("\n[3] Executing tools...")
-        results = self.executor.execute(plan)
+        # Started only once the plan is accepted, so a rejected query leaves
+        # no extraction running (or an unretrieved task exception) behind
+        insights_task = None
+        if self._should_get_insights(intent):
+            insights_task = asyncio.create_task(
+                asyncio.to_thread(get_transaction_insights_if_needed, intent.customer_id)
+            )
 
-        for r in results:
-            status = "OK" if r.success else f"FAIL: {r.error}"
-            self._log(f"    {r.tool_name}: {status}")
+        # Phase 3 + 3.5: Execute tools while insights are extracted
+        self._log("\n[3] Executing tools...")
+        results = await asyncio.to_thread(self.executor.execute, plan)
+        self._log_results(results)
 
-        # Phase 3.5: Transaction insights (if needed)
         transaction_insights = None
-        if self._should_get_insights(intent):
+        if insights_task is not None:
             self._log("\n[3.5] Extracting transaction insights...")
-            transaction_insights = get_transaction_insights_if_needed(intent.customer_id)
-            if transaction_insights:
-                self._log(f"    Patterns found: {len(transaction_insights.patterns)}")
-            else:
-                self._log("    No patterns detected")
+            transaction_insights = await insights_task
+            self._log_insights(transaction_insights)
+
+        # Phase 4: Generate explanation
+        self._log("\n[4] Generating response...\n")
+        if self.use_llm_explainer:
+            answer = await self.explainer.aexplain(intent, results, transaction_insights)
+        else:
+            answer = self.explainer.format_simple(results)
+
+        response = PipelineResponse(
+            answer=answer,
+            data={r.tool_name: r.result for r in results if r.success},
+            intent=intent,
+            tools_used=[r.tool_name for r in results],
+            success=True
+        )
+
+        # Phase 5: Audit log
+        latency = (time.time() - start_time) * 1000
+        self._log_audit(user_query, intent, results, answer, latency, True)
+
+        return response
+
+    def query_stream(self, user_query: str) -> Iterator[str]:
+        """
+        Stream the response as it's being generated.
+        Yields chunks of the final answer as they are produced by the LLM explainer.
+        """
+        start_time = time.time()
+
+        intent, insights_future, results, error = self._run_tools(user_query)
+        if error:
+            yield error
+            self._log_audit(user_query, intent, [], error, (time.time() - start_time) * 1000, False, error)
+            return
+
+        # Phase 3.5: Transaction insights (started after Phase 2). The
+        # explainer waits on the future only once the results are already in
+        # its prompt, and not at all when no LLM call is needed.
+        if insights_future is not None:
+            self._log("\n[3.5] Transaction insights handed to the explainer")
 
         # Phase 4: Stream explanation
         self._log("\n[4] Generating response (streaming)...\n")
 
         if self.use_llm_explainer:
-            full_answer = ""
-            for chunk in self.explainer.stream_explain(intent, results, transaction_insights):
-                full_answer += chunk
+            # stream_explain already coalesces tokens into small batches
+            parts = []
+            for chunk in self.explainer.stream_explain(intent, results, insights_future):
+                parts.append(chunk)
                 yield chunk
-            answer = full_answer
+            answer = "".join(parts)
         else:
             answer = self.explainer.format_simple(results)
             yield answer
@@ -248,4 +405,4 @@ class TransactionPipeline:
             success=success,
             error=error
         )
-        self.audit.log(audit)
+        _get_audit_queue().put_nowait((self.audit, audit))
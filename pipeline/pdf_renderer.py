@@ -7,96 +7,282 @@ This module renders the CustomerReport to:
 NO LLM calls - NO data manipulation - just rendering.
 """
 
+import importlib.util
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
-from fpdf import FPDF
+import numpy as np
 
 from dataclasses import asdict
 
 from schemas.customer_report import CustomerReport
 from features.tradeline_features import TradelineFeatures
 from utils.helpers import mask_customer_id, format_inr_units, strip_segment_prefix
+from config.settings import JINJA_BYTECODE_CACHE_DIR, PDF_BACKEND
+
+# fpdf2 and Jinja2 are imported on first render, not at module import
+if TYPE_CHECKING:
+    from fpdf import FPDF
+    from jinja2 import Template
+
+# Optional reportlab backend; checked without importing it
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+logger = logging.getLogger(__name__)
+
+
+# Unicode characters with ASCII alternatives, applied in one str.translate
+# pass. Escapes keep the quote characters from being normalized by editors.
+_SANITIZE_TABLE = str.maketrans({
+    '\u20b9': 'INR ',   # rupee sign
+    '\u20ac': 'EUR ',   # euro sign
+    '\u00a3': 'GBP ',   # pound sign
+    '\u00a5': 'JPY ',   # yen sign
+    '\u2014': '-',      # em dash
+    '\u2013': '-',      # en dash
+    '\u201c': '"',      # left double quote
+    '\u201d': '"',      # right double quote
+    '\u2018': "'",      # left single quote
+    '\u2019': "'",      # right single quote
+    '\u2026': '...',    # ellipsis
+})
+
+# (inflow, outflow) record used to total the monthly cash flow table
+_CASHFLOW_DTYPE = np.dtype([('inflow', np.float64), ('outflow', np.float64)])
 
 
 def _sanitize_text(text: str) -> str:
     """Sanitize text for PDF rendering by replacing Unicode characters."""
     if not text:
         return text
-    # Replace common Unicode characters with ASCII alternatives
-    replacements = {
-        '₹': 'INR ',
-        '€': 'EUR ',
-        '£': 'GBP ',
-        '¥': 'JPY ',
-        '—': '-',
-        '–': '-',
-        '"': '"',
-        '"': '"',
-        ''': "'",
-        ''': "'",
-        '…': '...',
-    }
-    for unicode_char, ascii_replacement in replacements.items():
-        text = text.replace(unicode_char, ascii_replacement)
+    text = text.translate(_SANITIZE_TABLE)
     # Remove any remaining non-Latin-1 characters
     return text.encode('latin-1', errors='ignore').decode('latin-1')
 
 
-class ReportPDF(FPDF):
-    """Custom PDF class for customer reports."""
-
-    def __init__(self):
-        super().__init__()
-        self.set_auto_page_break(auto=True, margin=15)
-
-    def header(self):
-        self.set_font("Helvetica", "B", 16)
-        self.cell(0, 10, "Customer Financial Report", align="C", new_x="LMARGIN", new_y="NEXT")
-        self.ln(5)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 8)
-        self.cell(0, 10, f"Page {self.page_no()}", align="C")
-
-    def section_title(self, title: str):
-        self.set_font("Helvetica", "B", 12)
-        self.set_fill_color(240, 240, 240)
-        self.cell(0, 8, title, fill=True, new_x="LMARGIN", new_y="NEXT")
-        self.ln(2)
-
-    def section_text(self, text: str):
-        self.set_font("Helvetica", "", 10)
-        self.multi_cell(0, 6, _sanitize_text(text))
-        self.ln(2)
-
-    def key_value(self, key: str, value: str):
-        self.set_font("Helvetica", "B", 10)
-        self.cell(60, 6, key + ":")
-        self.set_font("Helvetica", "", 10)
-        self.cell(0, 6, str(value), new_x="LMARGIN", new_y="NEXT")
-
-    def table_header(self, headers: list, widths: list):
-        self.set_font("Helvetica", "B", 9)
-        self.set_fill_color(220, 220, 220)
-        for header, width in zip(headers, widths):
-            self.cell(width, 7, header, border=1, fill=True, align="C")
-        self.ln()
-
-    def table_row(self, values: list, widths: list):
-        self.set_font("Helvetica", "", 9)
-        for value, width in zip(values, widths):
-            # Truncate long values
-            display_val = str(value)[:25] if len(str(value)) > 25 else str(value)
-            self.cell(width, 6, display_val, border=1, align="C")
-        self.ln()
-
-
-def _build_pdf(report: CustomerReport) -> FPDF:
-    """Build PDF document from CustomerReport."""
-    pdf = ReportPDF()
+@lru_cache(maxsize=1)
+def _make_report_pdf_class() -> type:
+    """Import fpdf2 and define ReportPDF on first use.
+
+    Keeps fpdf2 out of module import; ``pipeline.pdf_renderer.ReportPDF``
+    still resolves to this class through the module ``__getattr__``.
+    """
+    from fpdf import FPDF, FontFace
+
+    heading_style = FontFace(emphasis="BOLD", fill_color=(220, 220, 220))
+    total_style = FontFace(emphasis="BOLD")
+
+    class ReportPDF(FPDF):
+        """Custom PDF class for customer reports."""
+
+        def __init__(self):
+            super().__init__()
+            self.set_auto_page_break(auto=True, margin=15)
+
+        def header(self):
+            self.set_font("Helvetica", "B", 16)
+            self.cell(0, 10, "Customer Financial Report", align="C", new_x="LMARGIN", new_y="NEXT")
+            self.ln(5)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 8)
+            self.cell(0, 10, f"Page {self.page_no()}", align="C")
+
+        def section_title(self, title: str):
+            self.set_font("Helvetica", "B", 12)
+            self.set_fill_color(240, 240, 240)
+            self.cell(0, 8, title, fill=True, new_x="LMARGIN", new_y="NEXT")
+            self.ln(2)
+
+        def section_text(self, text: str):
+            self.set_font("Helvetica", "", 10)
+            self.multi_cell(0, 6, _sanitize_text(text))
+            self.ln(2)
+
+        def key_value(self, key: str, value: str):
+            self.set_font("Helvetica", "B", 10)
+            self.cell(60, 6, key + ":")
+            self.set_font("Helvetica", "", 10)
+            self.cell(0, 6, str(value), new_x="LMARGIN", new_y="NEXT")
+
+        def data_table(self, headers: List[str], rows: List[list], widths: List[int],
+                       total_row: Optional[list] = None):
+            """Draw a bordered table in one fpdf2 table() pass.
+
+            Args:
+                headers: Column headings (bold, shaded)
+                rows: Row values; each is stringified, sanitized and cut to 25 chars
+                widths: Absolute column widths in mm
+                total_row: Optional bold summary row appended after the data rows
+            """
+            body = [[_sanitize_text(str(v))[:25] for v in row] for row in rows]
+            self.set_font("Helvetica", "", 9)
+            # table() takes the current fill colour as the body cell background
+            self.set_fill_color(255, 255, 255)
+            with self.table(
+                col_widths=widths,
+                width=sum(widths),
+                align="LEFT",
+                text_align="CENTER",
+                line_height=6,
+                headings_style=heading_style,
+            ) as table:
+                table.row(headers)
+                for cells in body:
+                    table.row(cells)
+                if total_row is not None:
+                    row = table.row()
+                    for value in total_row:
+                        row.cell(str(value), style=total_style)
+
+    return ReportPDF
+
+
+def __getattr__(name: str):
+    if name == "ReportPDF":
+        return _make_report_pdf_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _make_reportlab_pdf_class() -> type:
+    """Import reportlab and define a ReportPDF look-alike on first use.
+
+    The class exposes the drawing methods _build_pdf uses and collects them
+    as platypus flowables; ``output(path)`` lays the story out with
+    reportlab's compiled layout code.
+    """
+    from xml.sax.saxutils import escape
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    title_fill = colors.Color(240 / 255, 240 / 255, 240 / 255)
+    heading_fill = colors.Color(220 / 255, 220 / 255, 220 / 255)
+    text_style = ParagraphStyle("report-text", fontName="Helvetica", fontSize=10, leading=6 * mm)
+    # Full text width with fpdf2's default 10 mm side margins
+    content_width = A4[0] - 20 * mm
+
+    def _draw_page(canvas, doc):
+        canvas.saveState()
+        canvas.setFont("Helvetica-Bold", 16)
+        canvas.drawCentredString(A4[0] / 2, A4[1] - 17 * mm, "Customer Financial Report")
+        canvas.setFont("Helvetica-Oblique", 8)
+        canvas.drawCentredString(A4[0] / 2, 8 * mm, f"Page {doc.page}")
+        canvas.restoreState()
+
+    class ReportLabPDF:
+        """Same drawing interface as ReportPDF, rendered through reportlab."""
+
+        def __init__(self):
+            self.story = []
+
+        def add_page(self):
+            pass  # pages are created by the layout pass in output()
+
+        def ln(self, h: float = 5):
+            self.story.append(Spacer(1, h * mm))
+
+        def section_title(self, title: str):
+            table = Table([[_sanitize_text(title)]], colWidths=[content_width], rowHeights=[8 * mm])
+            table.setStyle(TableStyle([
+                ("FONT", (0, 0), (-1, -1), "Helvetica-Bold", 12),
+                ("BACKGROUND", (0, 0), (-1, -1), title_fill),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]))
+            self.story += [table, Spacer(1, 2 * mm)]
+
+        def section_text(self, text: str):
+            self.story += [Paragraph(escape(_sanitize_text(text)), text_style), Spacer(1, 2 * mm)]
+
+        def key_value(self, key: str, value: str):
+            table = Table(
+                [[_sanitize_text(key + ":"), _sanitize_text(str(value))]],
+                colWidths=[60 * mm, content_width - 60 * mm],
+                rowHeights=[6 * mm],
+            )
+            table.setStyle(TableStyle([
+                ("FONT", (0, 0), (0, 0), "Helvetica-Bold", 10),
+                ("FONT", (1, 0), (1, 0), "Helvetica", 10),
+                ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]))
+            self.story.append(table)
+
+        def data_table(self, headers: List[str], rows: List[list], widths: List[int],
+                       total_row: Optional[list] = None):
+            data = [list(headers)]
+            data += [[_sanitize_text(str(v))[:25] for v in row] for row in rows]
+            style = [
+                ("FONT", (0, 0), (-1, -1), "Helvetica", 9),
+                ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9),
+                ("BACKGROUND", (0, 0), (-1, 0), heading_fill),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]
+            if total_row is not None:
+                data.append([str(v) for v in total_row])
+                style.append(("FONT", (0, -1), (-1, -1), "Helvetica-Bold", 9))
+            table = Table(
+                data,
+                colWidths=[w * mm for w in widths],
+                rowHeights=[7 * mm] + [6 * mm] * (len(data) - 1),
+                repeatRows=1,
+                hAlign="LEFT",
+            )
+            table.setStyle(TableStyle(style))
+            self.story.append(table)
+
+        def output(self, name: str):
+            doc = SimpleDocTemplate(
+                name,
+                pagesize=A4,
+                leftMargin=10 * mm,
+                rightMargin=10 * mm,
+                topMargin=25 * mm,
+                bottomMargin=15 * mm,
+                title="Customer Financial Report",
+            )
+            doc.build(self.story, onFirstPage=_draw_page, onLaterPages=_draw_page)
+
+    return ReportLabPDF
+
+
+def _new_report_pdf():
+    """Create an empty report document for the configured PDF_BACKEND.
+
+    Falls back to fpdf2 when reportlab is requested but not installed.
+    """
+    if PDF_BACKEND == "reportlab":
+        if REPORTLAB_AVAILABLE:
+            return _make_reportlab_pdf_class()()
+        logger.warning("PDF_BACKEND=reportlab but reportlab is not installed; using fpdf2")
+    return _make_report_pdf_class()()
+
+
+def _build_pdf(report: CustomerReport, pdf=None) -> "FPDF":
+    """Build PDF document from CustomerReport.
+
+    Args:
+        report: CustomerReport to lay out
+        pdf: Empty document to draw into; any object with the ReportPDF
+            drawing methods works (see _new_report_pdf). Defaults to an fpdf2
+            ReportPDF.
+
+    Returns:
+        The populated document; call ``output(path)`` to write it
+    """
+    if pdf is None:
+        pdf = _make_report_pdf_class()()
     pdf.add_page()
 
     # Meta information
@@ -139,44 +325,53 @@ def _build_pdf(report: CustomerReport) -> FPDF:
     if report.category_overview:
         pdf.section_title("Spending by Category")
         sorted_cats = sorted(report.category_overview.items(), key=lambda x: x[1], reverse=True)
-        widths = [80, 50, 60]
-        pdf.table_header(["Category", "Amount", "% of Total"], widths)
-        total = sum(report.category_overview.values())
-        for cat, amount in sorted_cats:
-            pct = (amount / total * 100) if total > 0 else 0
-            pdf.table_row([cat, f"{amount:,.0f}", f"{pct:.1f}%"], widths)
+        total = float(np.fromiter(
+            report.category_overview.values(), dtype=np.float64, count=len(report.category_overview)
+        ).sum())
+        pdf.data_table(
+            ["Category", "Amount", "% of Total"],
+            [
+                [cat, f"{amount:,.0f}", f"{(amount / total * 100) if total > 0 else 0:.1f}%"]
+                for cat, amount in sorted_cats
+            ],
+            [80, 50, 60],
+        )
         pdf.ln(5)
 
     # Monthly Cash Flow
     if report.monthly_cashflow:
         pdf.section_title("Monthly Cash Flow")
-        widths = [40, 45, 45, 45]
-        pdf.table_header(["Month", "Inflow", "Outflow", "Net"], widths)
-        for m in report.monthly_cashflow:
-            pdf.table_row([
-                m.get("month", "N/A"),
-                f"{m.get('inflow', 0):,.0f}",
-                f"{m.get('outflow', 0):,.0f}",
-                f"{m.get('net', 0):,.0f}"
-            ], widths)
-
         # Summary row
-        total_in = sum(m.get('inflow', 0) for m in report.monthly_cashflow)
-        total_out = sum(m.get('outflow', 0) for m in report.monthly_cashflow)
-        pdf.set_font("Helvetica", "B", 9)
-        pdf.cell(40, 6, "TOTAL", border=1, align="C")
-        pdf.cell(45, 6, f"{total_in:,.0f}", border=1, align="C")
-        pdf.cell(45, 6, f"{total_out:,.0f}", border=1, align="C")
-        pdf.cell(45, 6, f"{total_in - total_out:,.0f}", border=1, align="C")
-        pdf.ln(8)
+        flows = np.fromiter(
+            ((m.get('inflow', 0), m.get('outflow', 0)) for m in report.monthly_cashflow),
+            dtype=_CASHFLOW_DTYPE,
+            count=len(report.monthly_cashflow),
+        )
+        total_in, total_out = float(flows['inflow'].sum()), float(flows['outflow'].sum())
+        pdf.data_table(
+            ["Month", "Inflow", "Outflow", "Net"],
+            [
+                [
+                    m.get("month", "N/A"),
+                    f"{m.get('inflow', 0):,.0f}",
+                    f"{m.get('outflow', 0):,.0f}",
+                    f"{m.get('net', 0):,.0f}"
+                ]
+                for m in report.monthly_cashflow
+            ],
+            [40, 45, 45, 45],
+            total_row=["TOTAL", f"{total_in:,.0f}", f"{total_out:,.0f}", f"{total_in - total_out:,.0f}"],
+        )
+        pdf.ln(2)
 
     # EMI Payments
     if report.emis:
         pdf.section_title("EMI Payments")
-        widths = [80, 50, 60]
-        pdf.table_header(["Name", "Amount", "Frequency"], widths)
-        for emi in report.emis:
-            pdf.table_row([emi.name, f"{emi.amount:,.2f}", f"{emi.frequency}x"], widths)
+        pdf.data_table(
+            ["Name", "Amount", "Frequency"],
+            [[emi.name, f"{emi.amount:,.2f}", f"{emi.frequency}x"] for emi in report.emis],
+            [80, 50, 60],
+        )
         pdf.ln(3)
 
     # Rent
@@ -190,28 +385,58 @@ def _build_pdf(report: CustomerReport) -> FPDF:
     # Utility Bills
     if report.bills:
         pdf.section_title("Utility Bills")
-        widths = [80, 50, 60]
-        pdf.table_header(["Type", "Avg Amount", "Frequency"], widths)
-        for bill in report.bills:
-            pdf.table_row([bill.bill_type, f"{bill.avg_amount:,.2f}", f"{bill.frequency}x"], widths)
+        pdf.data_table(
+            ["Type", "Avg Amount", "Frequency"],
+            [[bill.bill_type, f"{bill.avg_amount:,.2f}", f"{bill.frequency}x"] for bill in report.bills],
+            [80, 50, 60],
+        )
         pdf.ln(3)
 
     # Top Merchants
     if report.top_merchants:
         pdf.section_title("Top Merchants")
-        widths = [70, 30, 45, 45]
-        pdf.table_header(["Merchant", "Count", "Total", "Avg"], widths)
-        for m in report.top_merchants:
-            pdf.table_row([
-                str(m.get("name", "N/A"))[:25],
-                str(m.get("count", 0)),
-                f"{m.get('total', 0):,.0f}",
-                f"{m.get('avg', 0):,.0f}"
-            ], widths)
+        pdf.data_table(
+            ["Merchant", "Count", "Total", "Avg"],
+            [
+                [
+                    m.get("name", "N/A"),
+                    m.get("count", 0),
+                    f"{m.get('total', 0):,.0f}",
+                    f"{m.get('avg', 0):,.0f}"
+                ]
+                for m in report.top_merchants
+            ],
+            [70, 30, 45, 45],
+        )
 
     return pdf
 
 
+@lru_cache(maxsize=1)
+def _get_report_template() -> "Template":
+    """Build the Jinja2 environment and compile the report template once."""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    template_dir = Path(__file__).parent.parent / "templates"
+    template_dir.mkdir(parents=True, exist_ok=True)
+
+    bytecode_cache = None
+    if JINJA_BYTECODE_CACHE_DIR:
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters['mask_id'] = mask_customer_id
+    env.filters['inr_units'] = format_inr_units
+    env.filters['segment'] = strip_segment_prefix
+
+    return env.get_template("customer_report.html")
+
+
 def render_report_pdf(
     report: CustomerReport,
     output_path: str,
@@ -234,15 +459,23 @@ def render_report_pdf(
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Build and save PDF
-    pdf = _build_pdf(report)
-    pdf.output(str(output_file))
-
-    # Also save HTML version for browser viewing
+    # Also save HTML version for browser viewing; it shares nothing with the
+    # PDF build, so render and write it on a worker meanwhile
     html_path = str(output_file).replace('.pdf', '.html')
-    html_content = render_report_html(report, tl_features=tl_features, rg_salary_data=rg_salary_data)
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+
+    def _write_html():
+        html_content = render_report_html(report, tl_features=tl_features, rg_salary_data=rg_salary_data)
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-html") as pool:
+        html_future = pool.submit(_write_html)
+
+        # Build and save PDF
+        pdf = _build_pdf(report, _new_report_pdf())
+        pdf.output(str(output_file))
+
+        html_future.result()
 
     return str(output_file)
 
@@ -263,20 +496,9 @@ def render_report_html(
     Returns:
         HTML string
     """
-    template_dir = Path(__file__).parent.parent / "templates"
-    template_dir.mkdir(parents=True, exist_ok=True)
-
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=True
-    )
-    env.filters['mask_id'] = mask_customer_id
-    env.filters['inr_units'] = format_inr_units
-    env.filters['segment'] = strip_segment_prefix
-
     tl_features_data = asdict(tl_features) if tl_features is not None else None
 
-    template = env.get_template("customer_report.html")
+    template = _get_report_template()
     return template.render(report=report, tl_features=tl_features_data, rg_salary_data=rg_salary_data)
 
 
@@ -1,11 +1,38 @@
 """Query planner - validates intent and creates execution plan."""
 
-from typing import List, Dict, Any, Tuple, Optional
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Tuple, Optional
 from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
 from schemas.intent import ParsedIntent, IntentType
 from config.intents import INTENT_TOOL_MAP, REQUIRED_FIELDS, MAX_TOOLS_PER_QUERY
-from data.loader import get_transactions_df
-from pipeline.bureau_feature_extractor import _load_bureau_data, _safe_int
+from data.loader import get_transactions_df, get_transactions_version
+from config.settings import BUREAU_DPD_FILE, BUREAU_DPD_DELIMITER
+
+
+# Strict YYYY-MM-DD shape; calendar validity is checked separately
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+
+
+def _parse_date(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """Split a YYYY-MM-DD string into (year, month, day), or None if invalid."""
+    match = _DATE_RE.fullmatch(date_str)
+    if match is None:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    # Shape is known to be right; this only rejects dates like 2024-02-30
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return None
+    return year, month, day
 
 
 def validate_date_format(date_str: str) -> Tuple[bool, str]:
@@ -13,11 +40,9 @@ def validate_date_format(date_str: str) -> Tuple[bool, str]:
     if not date_str:
         return False, "Date is empty"
 
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True, ""
-    except ValueError:
+    if _parse_date(date_str) is None:
         return False, f"Invalid date format '{date_str}'. Expected YYYY-MM-DD"
+    return True, ""
 
 
 def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
@@ -30,57 +55,200 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
     if not valid:
         return False, f"End date error: {error}"
 
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-
-    if start > end:
+    # Both strings are zero-padded YYYY-MM-DD, so their (year, month, day)
+    # tuples order exactly like the dates themselves
+    if _DATE_RE.fullmatch(start_date).groups() > _DATE_RE.fullmatch(end_date).groups():
         return False, f"Start date ({start_date}) must be before or equal to end date ({end_date})"
 
     return True, ""
 
 
-def normalize_category(category: str, valid_categories: set) -> Optional[str]:
-    """Case-insensitive category matching. Returns normalized category or None."""
+def normalize_category(
+    category: str,
+    category_map: Dict[str, str],
+    candidates: Optional[Tuple[Tuple[str, str], ...]] = None,
+) -> Optional[str]:
+    """Case-insensitive category matching. Returns normalized category or None.
+
+    Args:
+        category: Category as written in the query
+        category_map: Lowercase category -> original category
+        candidates: Prebuilt tuple(category_map.items()) for the partial-match
+            fallback; built on the fly when omitted
+
+    Returns:
+        The matching original category, or None
+    """
     if not category:
         return None
 
     category_lower = category.lower().strip()
 
-    # Build lowercase lookup map
-    category_map = {cat.lower(): cat for cat in valid_categories}
-
-    if category_lower in category_map:
-        return category_map[category_lower]
+    exact = category_map.get(category_lower)
+    if exact is not None:
+        return exact
 
     # Try partial matching for common typos
-    for valid_lower, valid_original in category_map.items():
+    if candidates is None:
+        candidates = tuple(category_map.items())
+    for valid_lower, valid_original in candidates:
         if category_lower in valid_lower or valid_lower in category_lower:
             return valid_original
 
     return None
 
 
+# Simple customer-only tools
+_CUSTOMER_ONLY_TOOLS = frozenset({
+    "debit_total",
+    "get_total_income",
+    "get_credit_statistics",
+    "get_debit_statistics",
+    "get_transaction_counts",
+    "get_balance_trend",
+    "get_income_stability",
+    "get_cash_flow",
+    "generate_customer_report",
+    "generate_lender_profile",
+    "generate_bureau_report",
+    "generate_combined_report",
+})
+# Bureau chat tools
+_BUREAU_SIMPLE_TOOLS = frozenset({"bureau_credit_card_info", "bureau_overview"})
+_BUREAU_LOAN_TOOLS = frozenset({"bureau_loan_type_info", "bureau_delinquency_check"})
+
+
+def _customer_args(intent: ParsedIntent) -> Dict[str, Any]:
+    return {"customer_id": intent.customer_id}
+
+
+def _spending_by_category_args(intent: ParsedIntent) -> Dict[str, Any]:
+    args = {"customer_id": intent.customer_id}
+    if intent.category:
+        args["category"] = intent.category
+    return args
+
+
+def _top_categories_args(intent: ParsedIntent) -> Dict[str, Any]:
+    return {"customer_id": intent.customer_id, "top_n": intent.top_n or 5}
+
+
+def _date_range_args(intent: ParsedIntent) -> Dict[str, Any]:
+    return {
+        "customer_id": intent.customer_id,
+        "start_date": intent.start_date,
+        "end_date": intent.end_date,
+    }
+
+
+def _anomaly_args(intent: ParsedIntent) -> Dict[str, Any]:
+    return {"customer_id": intent.customer_id, "threshold_std": intent.threshold_std or 2.0}
+
+
+def _category_presence_args(intent: ParsedIntent) -> Dict[str, Any]:
+    return {"customer_id": intent.customer_id, "category": intent.category}
+
+
+def _bureau_loan_args(intent: ParsedIntent) -> Dict[str, Any]:
+    args = {"customer_id": intent.customer_id}
+    if intent.category:
+        args["loan_type"] = intent.category
+    return args
+
+
+# tool name -> builder for that tool's args; unknown tools get no args
+_TOOL_ARG_BUILDERS: Dict[str, Callable[[ParsedIntent], Dict[str, Any]]] = {
+    **dict.fromkeys(_CUSTOMER_ONLY_TOOLS, _customer_args),
+    "get_spending_by_category": _spending_by_category_args,
+    "top_spending_categories": _top_categories_args,
+    "spending_in_date_range": _date_range_args,
+    "detect_anomalies": _anomaly_args,
+    "category_presence_lookup": _category_presence_args,
+    **dict.fromkeys(_BUREAU_SIMPLE_TOOLS, _customer_args),
+    **dict.fromkeys(_BUREAU_LOAN_TOOLS, _bureau_loan_args),
+}
+
+
+def _load_bureau_crns() -> frozenset:
+    """
+    Read the distinct bureau CRNs from dpd_data.csv in one vectorized pass.
+
+    Only the crn column is parsed. Values are read like _safe_int does
+    (numeric strings truncated to int, NULL/blank/invalid dropped), and 0 is
+    never a valid CRN.
+
+    Returns:
+        Frozenset of bureau customer ids
+    """
+    crn = pd.read_csv(
+        BUREAU_DPD_FILE, sep=BUREAU_DPD_DELIMITER, usecols=["crn"], dtype={"crn": "string"}
+    )["crn"]
+    values = pd.to_numeric(crn.str.strip(), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[np.isfinite(values)].astype(np.int64)
+    return frozenset(np.unique(values).tolist()) - {0}
+
+
+# Everything the planner validates against, derived once per data version.
+# The *_text fields are the sorted samples quoted in error messages.
+_ValidValues = namedtuple(
+    "_ValidValues",
+    "customers categories category_map category_items bureau_customers "
+    "customers_text categories_text bureau_customers_text",
+)
+
+
+@lru_cache(maxsize=1)
+def _compute_valid_values(data_version: int) -> _ValidValues:
+    """
+    Scan the loaded data once for the values the planner validates against.
+
+    Cached per transactions data version, so every planner in the process
+    shares the same sets until data.loader reloads the DataFrame.
+
+    Args:
+        data_version: Value of get_transactions_version() the result is for
+
+    Returns:
+        _ValidValues for the current data
+    """
+    df = get_transactions_df()
+    valid_customers = frozenset(df['cust_id'].unique())
+    valid_categories = frozenset(df['category_of_txn'].unique())
+    # Create lowercase lookup for normalization
+    category_map = {cat.lower(): cat for cat in valid_categories}
+    category_items = tuple(category_map.items())
+    # Load valid bureau CRNs from dpd_data.csv
+    try:
+        valid_bureau_customers = _load_bureau_crns()
+    except Exception:
+        valid_bureau_customers = frozenset()
+    return _ValidValues(
+        customers=valid_customers,
+        categories=valid_categories,
+        category_map=category_map,
+        category_items=category_items,
+        bureau_customers=valid_bureau_customers,
+        # Sorted once here so an invalid id never triggers a sort per request
+        customers_text=str(sorted(valid_customers)[:10]),
+        categories_text=str(sorted(valid_categories)),
+        bureau_customers_text=str(sorted(valid_bureau_customers)[:10]),
+    )
+
+
 class QueryPlanner:
     def __init__(self):
         self._load_valid_values()
 
     def _load_valid_values(self):
-        df = get_transactions_df()
-        self.valid_customers = set(df['cust_id'].unique())
-        self.valid_categories = set(df['category_of_txn'].unique())
-        # Create lowercase lookup for normalization
-        self.category_map = {cat.lower(): cat for cat in self.valid_categories}
-        # Load valid bureau CRNs from dpd_data.csv
-        try:
-            bureau_rows = _load_bureau_data()
-            self.valid_bureau_customers = {
-                _safe_int(row.get("crn", ""))
-                for row in bureau_rows
-                if row.get("crn", "").strip()
-            }
-            self.valid_bureau_customers.discard(0)
-        except Exception:
-            self.valid_bureau_customers = set()
+        values = _compute_valid_values(get_transactions_version())
+        self.valid_customers = values.customers
+        self.valid_categories = values.categories
+        self.category_map = values.category_map
+        self.category_items = values.category_items
+        self.valid_bureau_customers = values.bureau_customers
+        self._customer_sample_text = values.customers_text
+        self._category_list_text = values.categories_text
+        self._bureau_sample_text = values.bureau_customers_text
 
     def create_plan(self, intent: ParsedIntent) -> Tuple[List[Dict[str, Any]], str]:
         """Returns (execution_plan, error_message). Error is empty if valid."""
@@ -120,9 +288,9 @@ class QueryPlanner:
                     return f"Customer {intent.customer_id} not found in banking or bureau data."
             elif intent.intent in bureau_intents:
                 if intent.customer_id not in self.valid_bureau_customers:
-                    return f"Customer {intent.customer_id} not found in bureau data. Valid CRNs: {sorted(self.valid_bureau_customers)[:10]}"
+                    return f"Customer {intent.customer_id} not found in bureau data. Valid CRNs: {self._bureau_sample_text}"
             elif intent.customer_id not in self.valid_customers:
-                return f"Customer {intent.customer_id} not found. Valid customers: {sorted(self.valid_customers)[:10]}"
+                return f"Customer {intent.customer_id} not found. Valid customers: {self._customer_sample_text}"
 
         # Validate and normalize single category
         if "category" in required:
@@ -131,9 +299,9 @@ class QueryPlanner:
             # For CATEGORY_PRESENCE_LOOKUP, skip strict validation
             # The category resolver handles fuzzy matching via YAML config
             if intent.intent != IntentType.CATEGORY_PRESENCE_LOOKUP:
-                normalized = normalize_category(intent.category, self.valid_categories)
+                normalized = normalize_category(intent.category, self.category_map, self.category_items)
                 if normalized is None:
-                    return f"Invalid category: '{intent.category}'. Valid categories: {sorted(self.valid_categories)}"
+                    return f"Invalid category: '{intent.category}'. Valid categories: {self._category_list_text}"
                 # Update intent with normalized category (mutable field)
                 intent.category = normalized
 
@@ -144,9 +312,9 @@ class QueryPlanner:
 
             normalized_categories = []
             for cat in intent.categories:
-                normalized = normalize_category(cat, self.valid_categories)
+                normalized = normalize_category(cat, self.category_map, self.category_items)
                 if normalized is None:
-                    return f"Invalid category: '{cat}'. Valid categories: {sorted(self.valid_categories)}"
+                    return f"Invalid category: '{cat}'. Valid categories: {self._category_list_text}"
                 normalized_categories.append(normalized)
             # Update intent with normalized categories
             intent.categories = normalized_categories
@@ -165,71 +333,59 @@ class QueryPlanner:
         return ""
 
     def _build_plan(self, intent: ParsedIntent, tools: List[str]) -> List[Dict[str, Any]]:
-        plan = []
-
-        for tool_name in tools:
-            args = self._get_tool_args(intent, tool_name)
-            plan.append({"tool": tool_name, "args": args})
-
-        if intent.intent == IntentType.COMPARE_CATEGORIES and intent.categories:
-            plan = []
-            for cat in intent.categories:
-                plan.append({
-                    "tool": "get_spending_by_category",
-                    "args": {"customer_id": intent.customer_id, "category": cat}
-                })
-
-        return plan
-
-    def _get_tool_args(self, intent: ParsedIntent, tool_name: str) -> Dict[str, Any]:
-        args = {}
-
-        # Simple customer-only tools
-        if tool_name in [
-            "debit_total",
-            "get_total_income",
-            "get_credit_statistics",
-            "get_debit_statistics",
-            "get_transaction_counts",
-            "get_balance_trend",
-            "get_income_stability",
-            "get_cash_flow",
-            "generate_customer_report",
-            "generate_lender_profile",
-            "generate_bureau_report",
-            "generate_combined_report"
-        ]:
-            args["customer_id"] = intent.customer_id
-
-        elif tool_name == "get_spending_by_category":
-            args["customer_id"] = intent.customer_id
-            if intent.category:
-                args["category"] = intent.category
-
-        elif tool_name == "top_spending_categories":
-            args["customer_id"] = intent.customer_id
-            args["top_n"] = intent.top_n or 5
-
-        elif tool_name == "spending_in_date_range":
-            args["customer_id"] = intent.customer_id
-            args["start_date"] = intent.start_date
-            args["end_date"] = intent.end_date
-
-        elif tool_name == "detect_anomalies":
-            args["customer_id"] = intent.customer_id
-            args["threshold_std"] = intent.threshold_std or 2.0
-
-        elif tool_name == "category_presence_lookup":
-            args["customer_id"] = intent.customer_id
-            args["category"] = intent.category
-
-        # Bureau chat tools
-        elif tool_name in ["bureau_credit_card_info", "bureau_overview"]:
-            args["customer_id"] = intent.customer_id
-
-        elif tool_name in ["bureau_loan_type_info", "bureau_delinquency_check"]:
-            args["customer_id"] = intent.customer_id
-            if intent.category:
-                args["loan_type"] = intent.category
-
-        return args
+        key = _PlanKey(
+            intent.intent,
+            intent.customer_id,
+            intent.category,
+            tuple(intent.categories) if intent.categories is not None else None,
+            intent.start_date,
+            intent.end_date,
+            intent.top_n,
+            intent.threshold_std,
+        )
+        # Fresh dicts per call so callers can still mutate their plan
+        return [
+            {"tool": tool_name, "args": dict(args)}
+            for tool_name, args in _build_plan_cached(key, tuple(tools))
+        ]
+
+    @staticmethod
+    def _get_tool_args(intent: ParsedIntent, tool_name: str) -> Dict[str, Any]:
+        builder = _TOOL_ARG_BUILDERS.get(tool_name)
+        return builder(intent) if builder is not None else {}
+
+
+# The ParsedIntent fields a plan depends on; also read by _get_tool_args
+_PlanKey = namedtuple(
+    "_PlanKey",
+    "intent customer_id category categories start_date end_date top_n threshold_std",
+)
+
+
+@lru_cache(maxsize=4096)
+def _build_plan_cached(
+    intent: _PlanKey, tools: Tuple[str, ...]
+) -> Tuple[Tuple[str, Tuple[Tuple[str, Any], ...]], ...]:
+    """
+    Build the execution plan for one set of intent fields.
+
+    Args:
+        intent: Plan-relevant intent fields
+        tools: Tool names mapped to the intent type
+
+    Returns:
+        Immutable plan as (tool_name, args items) pairs
+    """
+    plan = []
+
+    for tool_name in tools:
+        args = QueryPlanner._get_tool_args(intent, tool_name)
+        plan.append((tool_name, tuple(args.items())))
+
+    if intent.intent == IntentType.COMPARE_CATEGORIES and intent.categories:
+        plan = [
+            ("get_spending_by_category", (("customer_id", intent.customer_id), ("category", cat)))
+            for cat in intent.categories
+        ]
+
+    return tuple(plan)
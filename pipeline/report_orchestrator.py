@@ -6,14 +6,25 @@ This module coordinates the planner-driven report generation pipeline:
 3. Execute sections based on plan
 4. Aggregate into CustomerReport
 5. Generate LLM summary (optional, fail-soft)
-6. Render PDF
+6. Render PDF (optionally on a background thread)
 
-Includes caching by (customer_id, analysis_period).
+Includes bounded LRU caching by (customer_id, analysis_period), backed by an
+optional disk cache that survives restarts.
 """
 
-from datetime import datetime
-from typing import Dict, Tuple, Optional, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Tuple, Optional, List, Union
+import hashlib
+import json
 import logging
+import threading
+
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
 from schemas.customer_report import CustomerReport, ReportMeta, ReportSectionMeta
 
@@ -31,17 +42,64 @@ class ReportGenerationError(Exception):
 from pipeline.customer_report_builder import (
     build_customer_report,
     build_data_profile,
-    execute_section
+    execute_section,
+    clear_category_index
 )
-from pipeline.report_planner import ReportPlanner, ReportPlan, PlannedSection
-from pipeline.report_summary_chain import generate_customer_review, generate_customer_persona
+from config.section_tools import LLM_GENERATED_SECTIONS, SECTION_TO_REPORT_FIELD
+from pipeline.report_planner import ReportPlan, PlannedSection, _get_planner
+from pipeline.report_summary_chain import PERSONA_REVIEW_PROMPT, generate_customer_persona_and_review
 from pipeline.pdf_renderer import render_report_pdf
 from pipeline.tradeline_feature_extractor import extract_tradeline_features
-from data.loader import get_transactions_df, load_rg_salary_data
-
-
-# Cache for report data - keyed by (customer_id, period)
-_REPORT_CACHE: Dict[Tuple[int, str], CustomerReport] = {}
+from data.loader import customer_exists, get_transactions_fingerprint, load_rg_salary_data
+from config.settings import (
+    REPORT_DISK_CACHE_ENABLED,
+    REPORT_DISK_CACHE_DIR,
+    REPORT_DISK_CACHE_TTL_SEC,
+    REPORT_DISK_CACHE_SIZE_LIMIT,
+)
+from utils.helpers import now_iso
+
+
+# Cache for report data - keyed by (customer_id, period), least recently used first
+MAX_CACHE_ENTRIES = 256
+_REPORT_CACHE: "OrderedDict[Tuple[int, str], CustomerReport]" = OrderedDict()
+_REPORT_CACHE_LOCK = threading.Lock()
+
+# Disk level behind _REPORT_CACHE (diskcache, opened on first use). Entries are
+# report fields keyed by (customer_id, period, transactions fingerprint, code
+# digest) and tagged with the customer_id for per-customer invalidation.
+_DISK_CACHE = None
+_DISK_CACHE_LOCK = threading.Lock()
+
+# Bump when section builders, risk rules or anything else that shapes a report
+# changes, so cached reports from older code are not served after a deploy.
+# Schema and summary prompt changes are picked up by the digest automatically.
+REPORT_CACHE_VERSION = 1
+_REPORT_CODE_DIGEST = hashlib.blake2b(
+    json.dumps(
+        [REPORT_CACHE_VERSION, CustomerReport.model_json_schema(), PERSONA_REVIEW_PROMPT],
+        sort_keys=True,
+    ).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+# PDF rendering for callers that pass background_render=True
+_RENDER_POOL: Optional[ThreadPoolExecutor] = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+# Upper bound on threads used to execute planned sections concurrently
+_MAX_SECTION_WORKERS = 8
+
+# Sections started before the plan is known, overlapping the planner LLM call
+_SPECULATIVE_SECTIONS = ("income_summary", "spending_summary")
+
+# (section name, CustomerReport fields it fills) for the deterministic sections;
+# LLM-generated sections are filled by the summary step instead
+_SECTION_FIELD_MAP = tuple(
+    (section_name, tuple(fields))
+    for section_name, fields in SECTION_TO_REPORT_FIELD.items()
+    if section_name not in LLM_GENERATED_SECTIONS
+)
 
 
 def generate_customer_report_pdf(
@@ -50,8 +108,9 @@ def generate_customer_report_pdf(
     include_summary: bool = True,
     output_path: Optional[str] = None,
     use_cache: bool = True,
-    use_planner: bool = True
-) -> Tuple[CustomerReport, str]:
+    use_planner: bool = True,
+    background_render: bool = False
+) -> Tuple[CustomerReport, Union[str, "Future[str]"]]:
     """
     Orchestrate planner-driven customer report generation.
 
@@ -71,9 +130,13 @@ def generate_customer_report_pdf(
         output_path: Output file path (default: reports/customer_{id}_report.pdf)
         use_cache: Whether to use cached report data (default True)
         use_planner: Whether to use LLM planner (default True, falls back to build_customer_report if False)
+        background_render: Render the PDF on a background thread and return
+            a Future for its path instead of waiting (default False)
 
     Returns:
-        Tuple of (CustomerReport, pdf_path)
+        Tuple of (CustomerReport, pdf_path), or (CustomerReport, Future[pdf_path])
+        when background_render is set. The Future raises ReportGenerationError
+        if rendering fails.
 
     Raises:
         CustomerNotFoundError: If customer_id is not in the dataset
@@ -87,8 +150,8 @@ def generate_customer_report_pdf(
     cache_key = (customer_id, f"{months}m")
 
     # Check cache first
-    if use_cache and cache_key in _REPORT_CACHE:
-        report = _REPORT_CACHE[cache_key]
+    report = _cache_get(cache_key) if use_cache else None
+    if report is not None:
         logger.debug(f"Using cached report for customer {customer_id}")
     else:
         if use_planner:
@@ -100,22 +163,37 @@ def generate_customer_report_pdf(
                 raise CustomerNotFoundError(f"Customer {customer_id} not found in dataset")
             report = build_customer_report(customer_id, months)
 
-        _REPORT_CACHE[cache_key] = report
+        _cache_put(cache_key, report)
 
     # Generate LLM summaries (optional, fail-soft)
-    if include_summary:
-        try:
-            if report.customer_persona is None:
-                report.customer_persona = generate_customer_persona(report)
-        except Exception as e:
-            logger.warning(f"Failed to generate customer persona: {e}")
+    if include_summary and _add_summaries(report):
+        _disk_cache_put(cache_key, report)
+
+    # Render PDF
+    if output_path is None:
+        output_path = f"reports/customer_{customer_id}_report.pdf"
+
+    if background_render:
+        return report, _get_render_pool().submit(_render_customer_pdf, report, customer_id, output_path)
+
+    return report, _render_customer_pdf(report, customer_id, output_path)
 
-        try:
-            if report.customer_review is None:
-                report.customer_review = generate_customer_review(report)
-        except Exception as e:
-            logger.warning(f"Failed to generate customer review: {e}")
 
+def _render_customer_pdf(report: CustomerReport, customer_id: int, output_path: str) -> str:
+    """
+    Gather the PDF-only inputs and render the report.
+
+    Args:
+        report: CustomerReport to render
+        customer_id: Customer identifier
+        output_path: Output file path
+
+    Returns:
+        Path to the rendered PDF
+
+    Raises:
+        ReportGenerationError: If PDF rendering fails
+    """
     # Load tradeline features for customer profile block (fail-soft)
     tl_features = None
     try:
@@ -130,23 +208,122 @@ def generate_customer_report_pdf(
     except Exception as e:
         logger.warning(f"RG salary data unavailable for [{customer_id}]: {e}")
 
-    # Render PDF
-    if output_path is None:
-        output_path = f"reports/customer_{customer_id}_report.pdf"
-
     try:
-        pdf_path = render_report_pdf(report, output_path, tl_features=tl_features, rg_salary_data=rg_salary_data)
+        return render_report_pdf(report, output_path, tl_features=tl_features, rg_salary_data=rg_salary_data)
     except Exception as e:
         logger.error(f"Failed to render PDF: {e}")
         raise ReportGenerationError(f"PDF rendering failed: {e}")
 
-    return report, pdf_path
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    """Create the shared background PDF render pool on first use."""
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        with _RENDER_POOL_LOCK:
+            if _RENDER_POOL is None:
+                _RENDER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-render")
+    return _RENDER_POOL
+
+
+def _add_summaries(report: CustomerReport) -> bool:
+    """
+    Fill in the persona and review in one LLM call (fail-soft, keeps existing values).
+
+    Returns:
+        True if the report gained a persona or review
+    """
+    if report.customer_persona is not None and report.customer_review is not None:
+        return False
+    try:
+        persona, review = generate_customer_persona_and_review(report)
+    except Exception as e:
+        logger.warning(f"Failed to generate customer persona/review: {e}")
+        return False
+    changed = False
+    if report.customer_persona is None and persona is not None:
+        report.customer_persona = persona
+        changed = True
+    if report.customer_review is None and review is not None:
+        report.customer_review = review
+        changed = True
+    return changed
+
+
+def _cache_get(key: Tuple[int, str]) -> Optional[CustomerReport]:
+    """Return a cached report (memory, then disk), or None on a miss."""
+    with _REPORT_CACHE_LOCK:
+        report = _REPORT_CACHE.get(key)
+        if report is not None:
+            _REPORT_CACHE.move_to_end(key)
+            return report
+
+    disk = _get_disk_cache()
+    if disk is None:
+        return None
+    try:
+        fields = disk.get(_disk_key(key))
+        if fields is None:
+            return None
+        report = CustomerReport(**fields)
+    except Exception as e:
+        logger.warning(f"Report disk cache read failed: {e}")
+        return None
+    _cache_put(key, report, persist=False)
+    return report
+
+
+def _cache_put(key: Tuple[int, str], report: CustomerReport, persist: bool = True) -> None:
+    """
+    Store a report, evicting the least recently used entries past MAX_CACHE_ENTRIES.
+
+    Args:
+        persist: Also write the report to the disk cache (if enabled)
+    """
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE[key] = report
+        _REPORT_CACHE.move_to_end(key)
+        while len(_REPORT_CACHE) > MAX_CACHE_ENTRIES:
+            _REPORT_CACHE.popitem(last=False)
+    if persist:
+        _disk_cache_put(key, report)
+
+
+def _get_disk_cache():
+    """Open the disk report cache on first use (None if unavailable/disabled)."""
+    global _DISK_CACHE
+    if not (REPORT_DISK_CACHE_ENABLED and DISKCACHE_AVAILABLE):
+        return None
+    if _DISK_CACHE is None:
+        with _DISK_CACHE_LOCK:
+            if _DISK_CACHE is None:
+                try:
+                    _DISK_CACHE = Cache(REPORT_DISK_CACHE_DIR, size_limit=REPORT_DISK_CACHE_SIZE_LIMIT)
+                except Exception as e:
+                    logger.warning(f"Report disk cache unavailable at {REPORT_DISK_CACHE_DIR}: {e}")
+                    _DISK_CACHE = False
+    # Compare to False explicitly: an empty Cache is falsy (it has __len__)
+    return None if _DISK_CACHE is False else _DISK_CACHE
+
+
+def _disk_key(key: Tuple[int, str]) -> str:
+    customer_id, period = key
+    return f"{customer_id}|{period}|{get_transactions_fingerprint()}|{_REPORT_CODE_DIGEST}"
+
+
+def _disk_cache_put(key: Tuple[int, str], report: CustomerReport) -> None:
+    """Write a report's fields to the disk cache (fail-soft)."""
+    disk = _get_disk_cache()
+    if disk is None:
+        return
+    try:
+        disk.set(_disk_key(key), report.model_dump(), expire=REPORT_DISK_CACHE_TTL_SEC, tag=key[0])
+    except Exception as e:
+        logger.warning(f"Report disk cache write failed: {e}")
 
 
 def _validate_customer_exists(customer_id: int) -> bool:
     """Check if customer exists in the dataset."""
-    df = get_transactions_df()
-    return customer_id in df['cust_id'].values
+    return customer_exists(customer_id)
 
 
 def _build_report_with_planner(customer_id: int, months: int = 6) -> CustomerReport:
@@ -156,8 +333,8 @@ def _build_report_with_planner(customer_id: int, months: int = 6) -> CustomerRep
     Flow:
     1. Validate customer exists
     2. Build quick data profile
-    3. Call planner to decide sections
-    4. Execute each planned section
+    3. Call planner to decide sections (core sections start meanwhile)
+    4. Execute the planned sections concurrently
     5. Aggregate results into CustomerReport
 
     Args:
@@ -182,37 +359,67 @@ def _build_report_with_planner(customer_id: int, months: int = 6) -> CustomerRep
         logger.error(f"Failed to build data profile for customer {customer_id}: {e}")
         raise ReportGenerationError(f"Failed to build data profile: {e}")
 
-    # Step 2: Get plan from planner (has internal fallback)
-    try:
-        planner = ReportPlanner()
-        plan = planner.plan(customer_id, data_profile)
-    except Exception as e:
-        logger.error(f"Planner initialization failed: {e}")
-        raise ReportGenerationError(f"Planner failed: {e}")
-
-    # Step 3: Execute sections based on plan
     section_results = {}
     section_errors = []
-    for section in plan.sections:
-        result, error = execute_section(customer_id, section.section_name)
-        if error:
-            section_errors.append(f"{section.section_name}: {error}")
-            logger.warning(f"Section '{section.section_name}' failed: {error}")
-        if result is not None:
-            section_results[section.section_name] = result
+    # Threads are started lazily, so the pool only grows to what the plan needs
+    with ThreadPoolExecutor(
+        max_workers=_MAX_SECTION_WORKERS,
+        thread_name_prefix="report-section"
+    ) as pool:
+        # Core sections are in practically every plan, so start them now and
+        # let them run while the planner LLM call is in flight.
+        futures = {
+            name: pool.submit(execute_section, customer_id, name)
+            for name in _SPECULATIVE_SECTIONS
+        }
+
+        # Step 2: Get plan from planner (has internal fallback). The party name
+        # is report metadata, not a planning signal, so it stays out of the prompt.
+        planner_profile = {k: v for k, v in data_profile.items() if k != "prty_name"}
+        try:
+            planner = _get_planner()
+            plan = planner.plan(customer_id, planner_profile)
+        except Exception as e:
+            for future in futures.values():
+                future.cancel()
+            logger.error(f"Planner initialization failed: {e}")
+            raise ReportGenerationError(f"Planner failed: {e}")
+
+        # Step 3: Execute the remaining planned sections. Sections are
+        # independent, so they run concurrently; each future is fail-soft.
+        # Speculative sections the plan left out are ignored.
+        planned = {}
+        for section in plan.sections:
+            name = section.section_name
+            if name not in futures:
+                futures[name] = pool.submit(execute_section, customer_id, name)
+            planned[futures[name]] = name
+
+        for future in as_completed(planned):
+            name = planned[future]
+            try:
+                result, error = future.result()
+            except Exception as e:
+                result, error = None, str(e)
+            if error:
+                section_errors.append(f"{name}: {error}")
+                logger.warning(f"Section '{name}' failed: {error}")
+            if result is not None:
+                section_results[name] = result
 
     if section_errors:
         logger.info(f"Report generated with {len(section_errors)} section errors: {section_errors}")
 
     # Step 4: Aggregate into CustomerReport
-    return _aggregate_to_report(customer_id, months, section_results, plan)
+    return _aggregate_to_report(customer_id, months, section_results, plan, data_profile)
 
 
 def _aggregate_to_report(
     customer_id: int,
     months: int,
     section_results: Dict[str, dict],
-    plan: ReportPlan
+    plan: ReportPlan,
+    data_profile: dict
 ) -> CustomerReport:
     """
     Aggregate section results into a CustomerReport object.
@@ -224,97 +431,44 @@ def _aggregate_to_report(
         months: Analysis period in months
         section_results: Dict mapping section names to their data
         plan: The ReportPlan used for section selection
+        data_profile: Profile from build_data_profile (transaction_count, prty_name)
 
     Returns:
         CustomerReport with all available sections populated
     """
-    # Build report metadata
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
-    transaction_count = len(cust_df)
-
-    prty_name = None
-    if 'prty_name' in cust_df.columns and len(cust_df) > 0:
-        prty_name = cust_df['prty_name'].iloc[0]
-        if prty_name and str(prty_name).lower() not in ['nan', 'none', '']:
-            prty_name = str(prty_name)
-        else:
-            prty_name = None
-
+    # Build report metadata from the profile (already sliced per customer)
     meta = ReportMeta(
         customer_id=customer_id,
-        prty_name=prty_name,
-        generated_at=datetime.now().isoformat(),
+        prty_name=data_profile.get("prty_name"),
+        generated_at=now_iso(),
         analysis_period=f"Last {months} months",
         currency="INR",
-        transaction_count=transaction_count
+        transaction_count=data_profile.get("transaction_count", 0)
     )
 
-    # Extract data from section results
-    # income_summary section -> salary field
-    salary = None
-    if "income_summary" in section_results:
-        salary = section_results["income_summary"].get("salary")
-
-    # spending_summary section -> category_overview, top_merchants fields
-    category_overview = None
-    top_merchants = None
-    if "spending_summary" in section_results:
-        category_overview = section_results["spending_summary"].get("category_overview")
-        top_merchants = section_results["spending_summary"].get("top_merchants")
-
-    # cashflow_analysis section -> monthly_cashflow field
-    monthly_cashflow = None
-    if "cashflow_analysis" in section_results:
-        monthly_cashflow = section_results["cashflow_analysis"].get("monthly_cashflow")
-
-    # emi_obligations section -> emis field
-    emis = None
-    if "emi_obligations" in section_results:
-        emis = section_results["emi_obligations"].get("emis")
-
-    # rent_payments section -> rent field
-    rent = None
-    if "rent_payments" in section_results:
-        rent = section_results["rent_payments"].get("rent")
-
-    # utility_bills section -> bills field
-    bills = None
-    if "utility_bills" in section_results:
-        bills = section_results["utility_bills"].get("bills")
-
-    # savings_analysis section -> savings field
-    savings = None
-    if "savings_analysis" in section_results:
-        savings = section_results["savings_analysis"].get("savings")
-
-    # risk_indicators section -> risk_indicators field
-    risk_indicators = None
-    if "risk_indicators" in section_results:
-        risk_indicators = section_results["risk_indicators"].get("risk_indicators")
+    # Extract data from section results into CustomerReport fields
+    extracted = {}
+    for section_name, fields in _SECTION_FIELD_MAP:
+        data = section_results.get(section_name)
+        if data:
+            for field in fields:
+                extracted[field] = data.get(field)
 
     # Build sections metadata from plan
+    included_set = section_results.keys()
     sections_meta = [
         ReportSectionMeta(
             section_name=s.section_name,
             emphasis=s.emphasis,
-            included=s.section_name in section_results
+            included=s.section_name in included_set
         )
         for s in plan.sections
     ]
 
     return CustomerReport(
         meta=meta,
-        category_overview=category_overview,
-        monthly_cashflow=monthly_cashflow,
-        top_merchants=top_merchants,
-        salary=salary,
-        emis=emis,
-        rent=rent,
-        bills=bills,
-        savings=savings,
-        risk_indicators=risk_indicators,
-        sections_meta=sections_meta
+        sections_meta=sections_meta,
+        **extracted
     )
 
 
@@ -353,9 +507,8 @@ def get_customer_report_data(
     cache_key = (customer_id, f"{months}m")
 
     # Build or retrieve from cache
-    if use_cache and cache_key in _REPORT_CACHE:
-        report = _REPORT_CACHE[cache_key]
-    else:
+    report = _cache_get(cache_key) if use_cache else None
+    if report is None:
         if use_planner:
             report = _build_report_with_planner(customer_id, months)
         else:
@@ -363,29 +516,23 @@ def get_customer_report_data(
             if not _validate_customer_exists(customer_id):
                 raise CustomerNotFoundError(f"Customer {customer_id} not found in dataset")
             report = build_customer_report(customer_id, months)
-        _REPORT_CACHE[cache_key] = report
+        _cache_put(cache_key, report)
 
     # Generate summaries if requested (fail-soft)
-    if include_summary:
-        try:
-            if report.customer_persona is None:
-                report.customer_persona = generate_customer_persona(report)
-        except Exception as e:
-            logger.warning(f"Failed to generate customer persona: {e}")
-
-        try:
-            if report.customer_review is None:
-                report.customer_review = generate_customer_review(report)
-        except Exception as e:
-            logger.warning(f"Failed to generate customer review: {e}")
+    if include_summary and _add_summaries(report):
+        _disk_cache_put(cache_key, report)
 
     return report
 
 
 def clear_report_cache():
-    """Clear the report cache."""
-    global _REPORT_CACHE
-    _REPORT_CACHE = {}
+    """Clear the report cache (memory and disk)."""
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE.clear()
+    disk = _get_disk_cache()
+    if disk is not None:
+        disk.clear()
+    clear_category_index()
 
 
 def invalidate_customer_cache(customer_id: int):
@@ -395,7 +542,12 @@ def invalidate_customer_cache(customer_id: int):
     Args:
         customer_id: Customer whose cache entries to clear
     """
-    global _REPORT_CACHE
-    keys_to_remove = [k for k in _REPORT_CACHE if k[0] == customer_id]
-    for key in keys_to_remove:
-        del _REPORT_CACHE[key]
+    with _REPORT_CACHE_LOCK:
+        keys_to_remove = [k for k in _REPORT_CACHE if k[0] == customer_id]
+        for key in keys_to_remove:
+            del _REPORT_CACHE[key]
+    disk = _get_disk_cache()
+    if disk is not None:
+        disk.evict(customer_id)
+    # lru_cache cannot drop a single customer; the index is cheap to rebuild
+    clear_category_index()
@@ -9,21 +9,29 @@ The planner outputs structured JSON only - no free text.
 All computation remains deterministic; LLM is only used for planning decisions.
 """
 
+from collections import OrderedDict
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from langchain_ollama import ChatOllama
-from langchain_core.prompts import ChatPromptTemplate
+import hashlib
 import json
 import logging
+import threading
 
-from config.settings import PARSER_MODEL
-from config.section_tools import AVAILABLE_SECTIONS, CORE_SECTIONS
+from config.settings import PARSER_MODEL, MIN_TX_FOR_LLM_PLAN
+from config.section_tools import AVAILABLE_SECTIONS, AVAILABLE_SECTIONS_SET, CORE_SECTIONS
 
 logger = logging.getLogger(__name__)
 
 # Valid emphasis levels
 VALID_EMPHASIS_LEVELS = ("high", "medium", "low")
 
+# Max number of LLM plans memoized per planner, keyed by data profile
+PLAN_CACHE_MAX_ENTRIES = 128
+
+# Profile flags for the optional sections whose inclusion the LLM weighs
+_PRESENCE_FLAGS = ("has_emi", "has_rent", "has_utilities")
+
 
 class PlannedSection(BaseModel):
     """A single section in the report plan."""
@@ -34,7 +42,7 @@ class PlannedSection(BaseModel):
     @field_validator('section_name')
     @classmethod
     def validate_section_name(cls, v: str) -> str:
-        if v not in AVAILABLE_SECTIONS:
+        if v not in AVAILABLE_SECTIONS_SET:
             raise ValueError(f"Invalid section name: {v}. Must be one of {AVAILABLE_SECTIONS}")
         return v
 
@@ -95,7 +103,12 @@ class ReportPlanner:
 
     def __init__(self, model_name: str = PARSER_MODEL):
         self.llm = ChatOllama(model=model_name, temperature=0, format="json", seed=42)
-        self.prompt = ChatPromptTemplate.from_template(REPORT_PLANNER_PROMPT)
+        # Unescape the literal {{ }} braces once; plan() only fills {data_profile}
+        self._prompt_template: str = REPORT_PLANNER_PROMPT.replace("{{", "{").replace("}}", "}")
+        # profile hash -> LLM plan, oldest first. The plan depends only on the
+        # profile, so customers with the same profile share one LLM call.
+        self._plan_cache: "OrderedDict[str, ReportPlan]" = OrderedDict()
+        self._plan_cache_lock = threading.Lock()
 
     def plan(self, customer_id: int, data_profile: dict) -> ReportPlan:
         """
@@ -114,11 +127,24 @@ class ReportPlanner:
         Returns:
             ReportPlan with ordered sections and emphasis levels
         """
+        if self._use_default_plan(data_profile):
+            logger.debug(f"Thin profile for customer {customer_id}, using default plan without LLM")
+            return self._default_plan(customer_id, data_profile)
+
+        cache_key = self._profile_key(data_profile)
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(cache_key)
+            if cached is not None:
+                self._plan_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.debug(f"Reusing memoized plan for customer {customer_id}")
+            return cached.model_copy(update={"customer_id": customer_id}, deep=True)
+
         profile_str = self._format_data_profile(data_profile)
 
         try:
             response = self.llm.invoke(
-                self.prompt.format(data_profile=profile_str)
+                self._prompt_template.replace("{data_profile}", profile_str)
             )
             data = json.loads(response.content)
 
@@ -126,7 +152,7 @@ class ReportPlanner:
             valid_sections = []
             for section in data.get("sections", []):
                 section_name = section.get("section_name")
-                if section_name not in AVAILABLE_SECTIONS:
+                if section_name not in AVAILABLE_SECTIONS_SET:
                     logger.warning(f"LLM returned invalid section '{section_name}', skipping")
                     continue
                 try:
@@ -139,12 +165,16 @@ class ReportPlanner:
                 logger.warning("LLM returned no valid sections, using default plan")
                 return self._default_plan(customer_id, data_profile)
 
-            return ReportPlan(
+            plan = ReportPlan(
                 customer_id=customer_id,
                 sections=valid_sections,
                 excluded_sections=data.get("excluded_sections", []),
                 planning_notes=data.get("planning_notes", "")
             )
+            # Only LLM plans are memoized, so a transient LLM failure does not
+            # pin the fallback plan for this profile.
+            self._remember_plan(cache_key, plan)
+            return plan
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM JSON response: {e}, using default plan")
             return self._default_plan(customer_id, data_profile)
@@ -152,6 +182,29 @@ class ReportPlanner:
             logger.warning(f"Planner failed with error: {e}, using default plan")
             return self._default_plan(customer_id, data_profile)
 
+    @staticmethod
+    def _use_default_plan(data_profile: dict) -> bool:
+        """True when the LLM has nothing to weigh beyond the default plan's rules."""
+        if MIN_TX_FOR_LLM_PLAN <= 0:
+            return False
+        if data_profile.get("transaction_count", 0) < MIN_TX_FOR_LLM_PLAN:
+            return True
+        return not any(data_profile.get(flag, False) for flag in _PRESENCE_FLAGS)
+
+    @staticmethod
+    def _profile_key(data_profile: dict) -> str:
+        """Stable hash of a data profile, used as the plan cache key."""
+        encoded = json.dumps(data_profile, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _remember_plan(self, cache_key: str, plan: ReportPlan) -> None:
+        """Memoize a plan, evicting the oldest entry past PLAN_CACHE_MAX_ENTRIES."""
+        with self._plan_cache_lock:
+            self._plan_cache[cache_key] = plan.model_copy(deep=True)
+            self._plan_cache.move_to_end(cache_key)
+            while len(self._plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+                self._plan_cache.popitem(last=False)
+
     def _format_data_profile(self, profile: dict) -> str:
         """Format data profile dict as readable string for the prompt."""
         lines = []
@@ -235,3 +288,18 @@ class ReportPlanner:
             sections=sections,
             planning_notes="Default plan (LLM fallback)"
         )
+
+
+# Shared planner: one ChatOllama client (and its HTTP pool) for every report
+_PLANNER: Optional[ReportPlanner] = None
+_PLANNER_LOCK = threading.Lock()
+
+
+def _get_planner() -> ReportPlanner:
+    """Create the shared ReportPlanner on first use."""
+    global _PLANNER
+    if _PLANNER is None:
+        with _PLANNER_LOCK:
+            if _PLANNER is None:
+                _PLANNER = ReportPlanner()
+    return _PLANNER
@@ -8,14 +8,16 @@ Uses LangChain Expression Language (LCEL) with Ollama models.
 """
 
 from dataclasses import asdict
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+import json
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_ollama import ChatOllama
 
 from schemas.customer_report import CustomerReport
-from data.loader import get_transactions_df
+from data.loader import get_customer_slice
 from utils.helpers import mask_customer_id, format_inr
 from schemas.loan_type import get_loan_type_display_name
 from config.settings import EXPLAINER_MODEL
@@ -264,6 +266,86 @@ def generate_customer_persona(
         return None
 
 
+# Persona and review in one round-trip; the model answers with a JSON object
+PERSONA_REVIEW_PROMPT = """Based on the complete financial profile for customer {customer_id}, write two short texts.
+
+COMPLETE FINANCIAL DATA:
+{comprehensive_data}
+
+SAMPLE TRANSACTIONS:
+{transaction_sample}
+
+KEY METRICS:
+{data_summary}
+
+1. "persona": a 4-5 line description of who this customer is, focusing on:
+- Who they likely are (profession, lifestyle)
+- Their financial behavior and discipline
+- Spending patterns and priorities
+- Overall financial health assessment
+
+2. "review": a 3-4 line professional financial review of the KEY METRICS.
+- Only mention data that is provided above
+- Do NOT mention or reference missing sections
+- Be factual and concise
+- Highlight any red flags or positive signals for lending decision
+
+Output ONLY a JSON object of the form {{"persona": "...", "review": "..."}}"""
+
+
+@lru_cache(maxsize=4)
+def _get_persona_review_llm(model_name: str) -> ChatOllama:
+    """One JSON-mode client per model, shared across reports."""
+    return ChatOllama(model=model_name, temperature=0, format="json", seed=42)
+
+
+def generate_customer_persona_and_review(
+    report: CustomerReport,
+    model_name: str = SUMMARY_MODEL
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Generate the customer persona and review with a single LLM call.
+
+    Same inputs as generate_customer_persona() and generate_customer_review(),
+    but one prompt asks for both texts as a JSON object, halving the number
+    of round-trips per report.
+
+    Args:
+        report: CustomerReport with populated sections
+        model_name: Ollama model to use
+
+    Returns:
+        Tuple of (persona, review); either is None if unavailable or generation fails
+    """
+    comprehensive_data = _build_comprehensive_data(report)
+    sections = _build_data_summary(report)
+
+    if not comprehensive_data:
+        return None, None
+
+    try:
+        chain = (
+            ChatPromptTemplate.from_template(PERSONA_REVIEW_PROMPT)
+            | _get_persona_review_llm(model_name)
+            | StrOutputParser()
+        )
+        raw = chain.invoke({
+            "customer_id": mask_customer_id(report.meta.customer_id),
+            "comprehensive_data": comprehensive_data,
+            "transaction_sample": _get_transaction_sample(report.meta.customer_id),
+            "data_summary": "\n".join(sections) if sections else "None",
+        })
+        data = json.loads(raw)
+    except Exception:
+        # Fail-soft: report will still be generated without summaries
+        return None, None
+
+    persona = str(data.get("persona") or "").strip() or None
+    # Like generate_customer_review(): no review without populated sections
+    review = (str(data.get("review") or "").strip() or None) if sections else None
+    return persona, review
+
+
 def _build_comprehensive_data(report: CustomerReport) -> str:
     """
     Build comprehensive data string from all report sections.
@@ -345,8 +427,7 @@ def _get_transaction_sample(customer_id: int, limit: int = 20) -> str:
         Formatted string of transaction samples
     """
     try:
-        df = get_transactions_df()
-        cust_df = df[df['cust_id'] == customer_id].copy()
+        cust_df = get_customer_slice(customer_id)
 
         if len(cust_df) == 0:
             return "No transactions available"
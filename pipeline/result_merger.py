@@ -22,12 +22,22 @@ def merge_transaction_insights(
     Returns:
         Enhanced data string with pattern information
     """
-    if not insights or not insights.patterns:
-        return data_str
-
-    insights_section = insights.to_explainer_context()
+    insights_section = format_insights_section(insights)
 
     if insights_section:
         return f"{data_str}\n\n{insights_section}"
 
     return data_str
+
+
+def format_insights_section(insights: Optional[TransactionInsights] = None) -> str:
+    """
+    Render the insights section on its own ("" when there is nothing to add).
+
+    Lets callers that assemble the prompt incrementally append the section
+    without first materializing the merged data string.
+    """
+    if not insights or not insights.patterns:
+        return ""
+
+    return insights.to_explainer_context() or ""
@@ -1,14 +1,14 @@
 """Pure Python analytics functions returning structured dicts."""
 
 from typing import Dict, Any, List
-from data.loader import get_transactions_df
+from data.loader import get_transactions_df, get_customer_slice
 from datetime import datetime, timedelta
 import pandas as pd
 
 def debit_total(customer_id: int, months: int = 6) -> Dict[str, Any]:
-    df = get_transactions_df().copy()
+    df = get_customer_slice(customer_id)
     df['tran_date'] = pd.to_datetime(df['tran_date'])
-    filtered = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'D')]
+    filtered = df[df['dr_cr_indctor'] == 'D']
 
     # If months is not None or > 0, restrict to the last 'months' months
     if months is not None and months > 0:
@@ -42,8 +42,8 @@ def debit_total(customer_id: int, months: int = 6) -> Dict[str, Any]:
 
 
 def get_total_income(customer_id: int) -> Dict[str, Any]:
-    df = get_transactions_df()
-    filtered = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'C')]
+    cust_df = get_customer_slice(customer_id)
+    filtered = cust_df[cust_df['dr_cr_indctor'] == 'C']
 
     return {
         "customer_id": customer_id,
@@ -54,12 +54,11 @@ def get_total_income(customer_id: int) -> Dict[str, Any]:
 
 
 def get_spending_by_category(customer_id: int, category: str = None) -> Dict[str, Any]:
-    df = get_transactions_df()
+    cust_df = get_customer_slice(customer_id)
     if category:
-        filtered = df[
-            (df['cust_id'] == customer_id) &
-            (df['dr_cr_indctor'] == 'D') &
-            (df['category_of_txn'] == category)
+        filtered = cust_df[
+            (cust_df['dr_cr_indctor'] == 'D') &
+            (cust_df['category_of_txn'] == category)
         ]
         return {
             "customer_id": customer_id,
@@ -69,10 +68,7 @@ def get_spending_by_category(customer_id: int, category: str = None) -> Dict[str
             "currency": "INR"
         }
     else:
-        filtered = df[
-            (df['cust_id'] == customer_id) &
-            (df['dr_cr_indctor'] == 'D')
-        ]
+        filtered = cust_df[cust_df['dr_cr_indctor'] == 'D']
         by_category = filtered.groupby('category_of_txn')['tran_amt_in_ac'].sum().to_dict()
         by_category = {cat: float(amount) for cat, amount in by_category.items()}
         transactions_by_category = filtered.groupby('category_of_txn').size().to_dict()
@@ -87,8 +83,8 @@ def get_spending_by_category(customer_id: int, category: str = None) -> Dict[str
 
 
 def top_spending_categories(customer_id: int, top_n: int = 5) -> Dict[str, Any]:
-    df = get_transactions_df()
-    filtered = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'D')]
+    cust_df = get_customer_slice(customer_id)
+    filtered = cust_df[cust_df['dr_cr_indctor'] == 'D']
 
     category_totals = filtered.groupby('category_of_txn')['tran_amt_in_ac'].sum()
     top_cats = category_totals.sort_values(ascending=False).head(top_n)
@@ -106,12 +102,11 @@ def spending_in_date_range(
     start_date: str,
     end_date: str
 ) -> Dict[str, Any]:
-    df = get_transactions_df()
-    filtered = df[
-        (df['cust_id'] == customer_id) &
-        (df['dr_cr_indctor'] == 'D') &
-        (df['tran_date'] >= start_date) &
-        (df['tran_date'] <= end_date)
+    cust_df = get_customer_slice(customer_id)
+    filtered = cust_df[
+        (cust_df['dr_cr_indctor'] == 'D') &
+        (cust_df['tran_date'] >= start_date) &
+        (cust_df['tran_date'] <= end_date)
     ]
 
     return {
@@ -146,8 +141,8 @@ def list_categories() -> Dict[str, Any]:
 
 def get_credit_statistics(customer_id: int) -> Dict[str, Any]:
     """Get comprehensive credit/income statistics for a customer."""
-    df = get_transactions_df()
-    credits = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'C')]
+    cust_df = get_customer_slice(customer_id)
+    credits = cust_df[cust_df['dr_cr_indctor'] == 'C']
 
     if len(credits) == 0:
         return {
@@ -213,8 +208,8 @@ def get_credit_statistics(customer_id: int) -> Dict[str, Any]:
 
 def get_debit_statistics(customer_id: int) -> Dict[str, Any]:
     """Get comprehensive debit/spending statistics for a customer."""
-    df = get_transactions_df()
-    debits = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'D')]
+    cust_df = get_customer_slice(customer_id)
+    debits = cust_df[cust_df['dr_cr_indctor'] == 'D']
 
     if len(debits) == 0:
         return {
@@ -256,8 +251,7 @@ def get_debit_statistics(customer_id: int) -> Dict[str, Any]:
 
 def get_transaction_counts(customer_id: int) -> Dict[str, Any]:
     """Get credit/debit transaction counts with monthly breakdown."""
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
+    cust_df = get_customer_slice(customer_id)
 
     credits = cust_df[cust_df['dr_cr_indctor'] == 'C']
     debits = cust_df[cust_df['dr_cr_indctor'] == 'D']
@@ -286,8 +280,7 @@ def get_transaction_counts(customer_id: int) -> Dict[str, Any]:
 
 def get_balance_trend(customer_id: int) -> Dict[str, Any]:
     """Calculate running balance over time for a customer."""
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id].copy()
+    cust_df = get_customer_slice(customer_id)
 
     if len(cust_df) == 0:
         return {
@@ -338,8 +331,7 @@ def get_balance_trend(customer_id: int) -> Dict[str, Any]:
 
 def detect_anomalies(customer_id: int, threshold_std: float = 2.0) -> Dict[str, Any]:
     """Detect credit/debit spikes using standard deviation threshold."""
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
+    cust_df = get_customer_slice(customer_id)
 
     results = {
         "customer_id": customer_id,
@@ -372,8 +364,8 @@ def detect_anomalies(customer_id: int, threshold_std: float = 2.0) -> Dict[str,
 
 def get_income_stability(customer_id: int) -> Dict[str, Any]:
     """Analyze income stability and consistency."""
-    df = get_transactions_df()
-    credits = df[(df['cust_id'] == customer_id) & (df['dr_cr_indctor'] == 'C')]
+    cust_df = get_customer_slice(customer_id)
+    credits = cust_df[cust_df['dr_cr_indctor'] == 'C']
 
     if len(credits) == 0:
         return {
@@ -430,8 +422,7 @@ def get_income_stability(customer_id: int) -> Dict[str, Any]:
 
 def get_cash_flow(customer_id: int) -> Dict[str, Any]:
     """Get monthly cash flow summary (inflows vs outflows)."""
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id].copy()
+    cust_df = get_customer_slice(customer_id)
 
     if len(cust_df) == 0:
         return {
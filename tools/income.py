@@ -3,7 +3,7 @@ Income-related tools for analyzing credit transactions.
 """
 
 from langchain_core.tools import tool
-from data.loader import get_transactions_df
+from data.loader import get_customer_slice
 
 
 @tool
@@ -17,10 +17,7 @@ def get_total_income(customer_id: int) -> str:
     Args:
         customer_id: The customer ID (e.g., 1)
     """
-    df = get_transactions_df()
-    filtered = df[
-        (df['cust_id'] == customer_id) &
-        (df['dr_cr_indctor'] == 'C')
-    ]
+    cust_df = get_customer_slice(customer_id)
+    filtered = cust_df[cust_df['dr_cr_indctor'] == 'C']
     total = filtered['tran_amt_in_ac'].sum()
     return f"Customer {customer_id} total income: ${total:,.2f}"
@@ -11,7 +11,7 @@ NO LLM calls - purely deterministic logic.
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
-from data.loader import get_transactions_df
+from data.loader import get_customer_slice
 from schemas.transaction_summary import (
     SalarySummary,
     HighFrequencyTransaction,
@@ -44,8 +44,7 @@ def fetch_transaction_summary(customer_id: int) -> TransactionSummary:
     Args: customer_id: Customer identifier
     Returns: TransactionSummary with salary info and high-frequency transaction groups
     """
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id]
+    cust_df = get_customer_slice(customer_id)
 
     if len(cust_df) == 0:
         return TransactionSummary(customer_id=customer_id, total_transactions_analyzed=0)
@@ -2,6 +2,10 @@
 Utility functions used across the project.
 """
 
+import time
+from functools import lru_cache
+from typing import Tuple
+
 
 def format_currency(amount: float) -> str:
     """Format a number as currency."""
@@ -20,27 +24,34 @@ def format_inr(amount: float) -> str:
     Returns:
         String with Indian-style commas, no decimals. E.g. '1,85,72,860'.
     """
-    is_negative = amount < 0
-    num = abs(int(round(amount)))
+    result = _group_inr_digits(abs(int(round(amount))))
+    return f"-{result}" if amount < 0 else result
+
+
+@lru_cache(maxsize=4096)
+def _group_inr_digits(num: int) -> str:
+    """Indian comma grouping for a non-negative integer.
+
+    Cached on the rounded value: report amounts (sanctions, overdue
+    balances) repeat heavily across customers in batch runs.
+    """
     s = str(num)
 
     if len(s) <= 3:
-        result = s
-    else:
-        # Last 3 digits
-        last3 = s[-3:]
-        rest = s[:-3]
-        # Group remaining digits in pairs from right
-        parts = []
-        while len(rest) > 2:
-            parts.append(rest[-2:])
-            rest = rest[:-2]
-        if rest:
-            parts.append(rest)
-        parts.reverse()
-        result = ",".join(parts) + "," + last3
-
-    return f"-{result}" if is_negative else result
+        return s
+
+    # Last 3 digits
+    last3 = s[-3:]
+    rest = s[:-3]
+    # Group remaining digits in pairs from right
+    parts = []
+    while len(rest) > 2:
+        parts.append(rest[-2:])
+        rest = rest[:-2]
+    if rest:
+        parts.append(rest)
+    parts.reverse()
+    return ",".join(parts) + "," + last3
 
 
 def format_inr_units(amount) -> str:
@@ -90,10 +101,14 @@ def print_section(title: str, char: str = "-", width: int = 40):
     print(char * width)
 
 
+@lru_cache(maxsize=1024)
 def mask_customer_id(customer_id: int | str) -> str:
     """
     Mask customer ID to show only last 4 digits.
 
+    Cached per id: the same customer is masked several times per query
+    (session logging, prompt building, report headers).
+
     Args:
         customer_id: Customer identifier (int or str)
 
@@ -112,3 +127,25 @@ def mask_customer_id(customer_id: int | str) -> str:
     if len(id_str) <= 4:
         return f"###{id_str}"
     return f"###{id_str[-4:]}"
+
+
+# (epoch second, formatted timestamp) of the last now_iso() call
+_NOW_ISO_CACHE: Tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Current local time as an ISO-8601 string at one-second resolution.
+
+    The formatted string is reused for every call within the same second, so
+    bulk report generation does not reformat the clock for each report.
+
+    Returns:
+        Timestamp like '2025-12-31T23:59:59'.
+    """
+    global _NOW_ISO_CACHE
+    second = int(time.time())
+    cached_second, text = _NOW_ISO_CACHE
+    if second != cached_second:
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _NOW_ISO_CACHE = (second, text)
+    return text
@@ -1,7 +1,7 @@
 """Transaction filtering utilities for insight extraction."""
 
 from typing import List, Dict, Any
-from data.loader import get_transactions_df
+from data.loader import get_customer_slice
 
 
 def get_customer_transactions(customer_id: int) -> List[Dict[str, Any]]:
@@ -14,8 +14,7 @@ def get_customer_transactions(customer_id: int) -> List[Dict[str, Any]]:
     Returns:
         List of transaction dictionaries
     """
-    df = get_transactions_df()
-    cust_df = df[df['cust_id'] == customer_id].copy()
+    cust_df = get_customer_slice(customer_id)
 
     if cust_df.empty:
         return []